@@ -1,63 +1,192 @@
-from flask import Flask, render_template, request, send_file, jsonify
+from flask import Flask, Request, Response, render_template, request, send_file, jsonify
+import logging
 import os
+import tempfile
 from werkzeug.utils import secure_filename
-from converter import DouzoneConverter
-import uuid
+from converter import ConversionCache, ConverterPool
+from exporters import OUTPUT_FORMATS, check_output_format
+from company_index import CompanyIndex
+from jobs import JobQueue, QueueFullError
+from result_cache import ResultCache
+from sheet_cache import SheetCache
+from metrics import METRICS
+
+# 변환 진행 로그 - LOG_LEVEL=WARNING 이면 시트별 진행 줄을 끔, CONVERTER_METRICS=0 이면 단계별 계측을 끔
+logging.basicConfig(level=os.environ.get('LOG_LEVEL', 'INFO').upper(), format='%(message)s')
+METRICS.enabled = os.environ.get('CONVERTER_METRICS', '1') != '0'
 
-app = Flask(__name__)
 UPLOAD_FOLDER = 'uploads'
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+# 업로드/변환 결과를 이 크기까지는 메모리에 두고, 넘으면 임시 파일로 넘김
+SPOOL_MAX_BYTES = int(os.environ.get('SPOOL_MAX_BYTES', 16 << 20))
+
+class SpooledRequest(Request):
+    """업로드 파일을 SPOOL_MAX_BYTES까지 메모리에 받는 요청 - 요청이 끝나면 닫힘(임시 파일 삭제)"""
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES, mode='rb+')
+
+app = Flask(__name__)
+app.request_class = SpooledRequest
+
+# 요청 간 변환 캐시 공유 (워커 프로세스 단위) - CONVERTER_SHARED_CACHE=0 이면 요청마다 새 캐시
+SHARED_CACHE = None
+if os.environ.get('CONVERTER_SHARED_CACHE', '1') != '0':
+    SHARED_CACHE = ConversionCache(int(os.environ.get('CONVERTER_CACHE_SIZE', 65536)))
+
+# 변환기 공통 옵션 - CONVERTER_MEMORY_BUDGET(바이트)을 주면 큰 시트도 나눠서 처리해 메모리 사용량을 제한
+CONVERTER_OPTIONS = {'cache': SHARED_CACHE}
+if int(os.environ.get('CONVERTER_MEMORY_BUDGET', 0)):
+    CONVERTER_OPTIONS['memory_budget'] = int(os.environ['CONVERTER_MEMORY_BUDGET'])
+# xlsx 저장 방식 - CONVERTER_WRITER=xml 이면 시트 XML을 zip에 바로 써서 저장이 빠름 (기본 openpyxl)
+CONVERTER_OPTIONS['writer'] = os.environ.get('CONVERTER_WRITER', 'openpyxl')
+# 증분 변환 - 시트별 결과를 uploads/sheets에 두고 다음 업로드에서 바뀐 시트만 다시 처리 (CONVERTER_SHEET_CACHE=1)
+if os.environ.get('CONVERTER_SHEET_CACHE', '0') != '0':
+    CONVERTER_OPTIONS['sheet_cache'] = SheetCache(
+        os.path.join(UPLOAD_FOLDER, 'sheets'),
+        max_bytes=int(os.environ.get('SHEET_CACHE_MAX_BYTES', 256 << 20)),
+    )
+
+# 머리글/번역 용어는 GLOSSARY_FILE(기본 data/glossary.json) 용어집에서 읽음 - 배포 전 `python glossary.py compile`로
+# 검사하고 컴파일 파일을 만들어 두면 기동 시 그대로 읽음. 용어집이 바뀌면 결과 캐시 키도 바뀜
+# 요청 처리 스레드마다 변환기를 하나씩 두고 재사용 - 번역 사전/스타일을 요청마다 다시 만들지 않음
+CONVERTERS = ConverterPool(CONVERTER_OPTIONS)
+
+# 같은 파일/영문명 재업로드 시 저장된 결과를 바로 돌려줌 - 전체 크기 제한, 오래 안 쓴 결과부터 삭제
+# (백그라운드 작업의 결과는 형식과 상관없이 모두 여기에 저장)
+RESULT_CACHE = ResultCache(
+    os.path.join(UPLOAD_FOLDER, 'results'),
+    max_bytes=int(os.environ.get('RESULT_CACHE_MAX_BYTES', 1 << 30)),
+)
 
-# 회사명-영문명 매핑
-COMPANY_MAP = {
-    '베이징그레이스레이저기술유한회사(영업소)': ['Grace Laser Korea Branch'],
-    '필립스카본블랙코리아 대표사무소': [
-        'PCB KR RO',
-        'PHILLIPS CARBON BLACK KOREA REPRESENTATIVE OFFICE'
-    ]
-}
+# 백그라운드 변환 작업 - 상태/결과는 uploads/jobs/<id>/ 아래 파일로 관리
+# 끝난 작업은 JOB_TTL_SECONDS(기본 하루)가 지나면 폴더째 삭제 (0이면 지우지 않음)
+JOB_QUEUE = JobQueue(
+    os.path.join(UPLOAD_FOLDER, 'jobs'),
+    workers=int(os.environ.get('JOB_WORKERS', 2)),
+    max_pending=int(os.environ.get('JOB_MAX_PENDING', 16)),
+    converter_options=CONVERTER_OPTIONS,
+    result_cache=RESULT_CACHE,
+    ttl=int(os.environ.get('JOB_TTL_SECONDS', 24 * 3600)),
+)
 
-# 부분일치 검색
+# 회사명-영문명 매핑 - 파일이 바뀌면 재시작 없이 다시 읽음
+COMPANY_MAP_FILE = os.environ.get('COMPANY_MAP_FILE', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'companies.json'))
+COMPANY_INDEX = CompanyIndex(path=COMPANY_MAP_FILE)
+SEARCH_LIMIT = int(os.environ.get('COMPANY_SEARCH_LIMIT', 20))
+
+# 부분일치 검색 (한글/영문명, 일치 위치 순 상위 SEARCH_LIMIT개)
 def search_company(partial_name):
-    results = []
-    for kr_name, en_names in COMPANY_MAP.items():
-        if partial_name in kr_name:
-            results.append({'kr': kr_name, 'en': en_names})
-    return results
+    return COMPANY_INDEX.search(partial_name, limit=SEARCH_LIMIT)
 
 @app.route('/search_company')
 def search():
-    query = request.args.get('q', '')
-    if len(query) >= 3:
+    query = request.args.get('q', '').strip()
+    # 색인 검색이라 짧은 질의도 부담이 없음
+    if query:
         return jsonify(search_company(query))
     return jsonify([])
 
+@app.route('/jobs', methods=['POST'])
+def create_job():
+    file = request.files.get('excel_file')
+    english_name = request.form.get('selected_english_name', '').strip()
+    output_format = request.form.get('output_format', 'xlsx')
+
+    if not english_name:
+        return jsonify({'error': "영문 회사명을 먼저 선택해주세요."}), 400
+    if not (file and file.filename.endswith(('.xlsx', '.xls'))):
+        return jsonify({'error': "xlsx 또는 xls 파일만 변환할 수 있습니다."}), 400
+    try:
+        check_output_format(output_format)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    try:
+        status = JOB_QUEUE.submit(file, secure_filename(file.filename), english_name, output_format)
+    except QueueFullError as e:
+        return jsonify({'error': str(e)}), 503
+    return jsonify(status), 202
+
+@app.route('/jobs/<job_id>')
+def job_status(job_id):
+    status = JOB_QUEUE.status(job_id)
+    if status is None:
+        return jsonify({'error': "작업을 찾을 수 없습니다."}), 404
+    return jsonify(status)
+
+@app.route('/jobs/<job_id>/download')
+def job_download(job_id):
+    status = JOB_QUEUE.status(job_id)
+    if status is None:
+        return jsonify({'error': "작업을 찾을 수 없습니다."}), 404
+    if status['state'] != 'done':
+        return jsonify({'error': "변환이 아직 끝나지 않았습니다.", 'state': status['state']}), 409
+    result_path = JOB_QUEUE.result_path(status)
+    if result_path is None:
+        return jsonify({'error': "변환 결과가 만료되었습니다. 다시 업로드해주세요."}), 410
+    return send_file(result_path, as_attachment=True, download_name=status['download_name'])
+
+@app.route('/metrics')
+def metrics():
+    """변환 단계별 소요 시간/행 수/바이트 (Prometheus 텍스트 형식, 워커 프로세스 단위)"""
+    return Response(METRICS.to_prometheus(), mimetype='text/plain; version=0.0.4')
+
 @app.route('/', methods=['GET', 'POST'])
 def index():
     if request.method == 'POST':
         file = request.files.get('excel_file')
         english_name = request.form.get('selected_english_name', '').strip()
+        output_format = request.form.get('output_format', 'xlsx')
 
         if not english_name:
             return "\u274c \uc601\ubb38 \ud68c\uc0ac\uba85\uc744 \uba3c\uc800 \uc120\ud0dd\ud574\uc8fc\uc138\uc694.", 400
+        try:
+            check_output_format(output_format)
+        except ValueError as e:
+            return f"❌ {e}", 400
 
         if file and file.filename.endswith(('.xlsx', '.xls')):
             original_filename = secure_filename(file.filename)
             file_root, file_ext = os.path.splitext(original_filename)
-            input_path = os.path.join(UPLOAD_FOLDER, f"{uuid.uuid4().hex}_{original_filename}")
-            output_filename = f"{file_root}_converted.xlsx"
-            output_path = os.path.join(UPLOAD_FOLDER, f"{uuid.uuid4().hex}_{output_filename}")
-            file.save(input_path)
+            extension, mimetype = OUTPUT_FORMATS[output_format]
+            output_filename = f"{file_root}_converted{extension}"
 
-            converter = DouzoneConverter()
-            success = converter.convert(input_path, output_path, english_name)
+            # 업로드 버퍼에서 바로 읽음 - uploads/에 사본을 만들지 않음
+            # 결과 캐시는 xlsx만 (CSV/Parquet/NDJSON은 서식 단계가 없어 다시 만드는 비용이 작음)
+            cache_key = None
+            if output_format == 'xlsx':
+                cache_key = RESULT_CACHE.key(file.stream, english_name)
+                cached_path = RESULT_CACHE.get(cache_key)
+                if cached_path is not None:
+                    return send_file(cached_path, as_attachment=True, download_name=output_filename)
+
+            output = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES, mode='w+b')
+            try:
+                converter = CONVERTERS.get()
+                success = converter.convert(file.stream, output, english_name, output_format=output_format)
+                if success:
+                    if cache_key is not None:
+                        RESULT_CACHE.put_stream(cache_key, output)
+                    output.seek(0)
+            except Exception:
+                output.close()
+                raise
 
             if success:
-                return send_file(output_path, as_attachment=True, download_name=output_filename)
+                # 응답 전송이 끝나면 send_file이 스트림을 닫음 (스풀된 임시 파일도 이때 삭제)
+                return send_file(output, as_attachment=True, download_name=output_filename, mimetype=mimetype)
             else:
+                output.close()
                 return "\u274c \ubcc0\ud658 \uc2e4\ud328. \ud30c\uc77c\uc744 \ud655\uc778\ud574\uc8fc\uc138\uc694.", 400
 
-    return render_template('index.html')
+    # Parquet은 pyarrow가 설치된 경우에만 선택지에 보임
+    return render_template('index.html', output_formats=OUTPUT_FORMATS)
+
+# 첫 요청 전에 지연 import/날짜 형식 확인 등을 끝냄 - gunicorn preload_app이면 마스터에서 한 번만 실행되고
+# 포크된 워커가 그대로 물려받음 (CONVERTER_PREWARM=0 이면 끔)
+if os.environ.get('CONVERTER_PREWARM', '1') != '0':
+    CONVERTERS.get().warm_up()
 
 if __name__ == '__main__':
     import os
@@ -0,0 +1,287 @@
+"""더존 계정별원장 일괄 변환
+
+    python batch.py 입력폴더_또는_glob [...] -m data/companies.json -o 출력폴더 [-j 작업 수] [-i]
+
+입력마다 영문 회사명은 --company, 매핑 파일의 파일 이름 키, 3행 '회사명:'에 들어 있는
+한글 회사명 순으로 찾음. 출력이 최신이면(입력 내용/회사명/변환기 버전이 같으면) 건너뜀.
+출력은 입력들의 공통 상위 폴더 기준 하위 폴더 구조를 출력폴더 아래에 그대로 유지함.
+"""
+import argparse
+import glob
+import io
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from company_index import load_company_map
+from converter import XLSX_WRITERS, ConversionCache, DouzoneConverter, WorkbookReader, result_version
+from exporters import ALL_OUTPUT_FORMATS, OUTPUT_FORMATS, check_output_format
+from file_cache import atomic_write
+from result_cache import hash_file
+
+INPUT_EXTENSIONS = ('.xlsx', '.xls')
+MANIFEST_NAME = '.batch_manifest.json'
+SHEET_CACHE_NAME = '.sheet_cache'
+
+def find_inputs(patterns, exclude=None):
+    """폴더/glob/파일 경로 목록 → 변환할 엑셀 파일 경로 (중복 제거, 정렬)
+
+    exclude 폴더(출력 폴더) 아래 파일은 제외 - 출력 폴더가 입력 폴더 안에 있어도 이전 결과를 다시 변환하지 않음
+    """
+    excluded = os.path.abspath(exclude) if exclude else None
+    paths = set()
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            candidates = glob.glob(os.path.join(pattern, '**', '*'), recursive=True)
+        else:
+            candidates = glob.glob(pattern, recursive=True)
+        for path in candidates:
+            name = os.path.basename(path)
+            path = os.path.abspath(path)
+            if excluded and os.path.commonpath([path, excluded]) == excluded:
+                continue
+            # 엑셀이 열려 있을 때 생기는 잠금 파일(~$...) 제외
+            if os.path.isfile(path) and path.lower().endswith(INPUT_EXTENSIONS) and not name.startswith('~$'):
+                paths.add(path)
+    return sorted(paths)
+
+def input_root(inputs):
+    """입력 파일들의 공통 상위 폴더 - 출력 폴더 아래에 이 기준의 하위 폴더 구조를 그대로 만듦"""
+    return os.path.commonpath([os.path.dirname(path) for path in inputs]) if inputs else None
+
+def output_path_for(input_path, output_dir, output_format='xlsx', root=None):
+    """출력 경로 - root(input_root)를 주면 입력의 상대 폴더를 output_dir 아래에 유지 (jan/ledger.xlsx와
+    feb/ledger.xlsx가 같은 출력으로 겹치지 않음)"""
+    file_root, _ = os.path.splitext(os.path.basename(input_path))
+    folder = output_dir
+    if root:
+        relative = os.path.relpath(os.path.dirname(os.path.abspath(input_path)), root)
+        if relative != os.curdir:
+            folder = os.path.join(output_dir, relative)
+    return os.path.join(folder, f"{file_root}_converted{OUTPUT_FORMATS[output_format][0]}")
+
+def detect_company_name(input_path, company_map):
+    """첫 시트 1~3행에 들어 있는 한글 회사명(매핑 키) 중 가장 긴 것 - 없으면 None"""
+    with WorkbookReader(input_path) as reader:
+        if not reader.sheet_names:
+            return None
+        rows = reader.read_rows(reader.sheet_names[0])[:3]
+    texts = [str(value) for row in rows for value in row if isinstance(value, str)]
+    matches = [kr for kr in company_map if any(kr in text for text in texts)]
+    return max(matches, key=len) if matches else None
+
+def resolve_english_name(input_path, company_map, company=None):
+    if company:
+        return company
+    file_name = os.path.basename(input_path)
+    for key in (file_name, os.path.splitext(file_name)[0]):
+        if key in company_map:
+            return company_map[key][0]
+    kr_name = detect_company_name(input_path, company_map)
+    return company_map[kr_name][0] if kr_name else None
+
+def load_manifest(output_dir):
+    try:
+        with open(os.path.join(output_dir, MANIFEST_NAME), encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+def save_manifest(output_dir, manifest):
+    with atomic_write(os.path.join(output_dir, MANIFEST_NAME), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+def is_up_to_date(input_path, output_path, english_name, entry, output_format='xlsx'):
+    """이전 실행 기록과 비교 - 크기/수정 시각이 같으면 바로, 다르면 내용 해시로 판단
+
+    반환: (최신 여부, 입력 해시 - 계산하지 않았으면 None)
+    """
+    if not entry or not os.path.exists(output_path):
+        return False, None
+    if entry.get('english_name') != english_name or entry.get('version') != result_version():
+        return False, None
+    if entry.get('output_format', 'xlsx') != output_format:
+        return False, None
+    stat = os.stat(input_path)
+    if entry.get('size') == stat.st_size and entry.get('mtime_ns') == stat.st_mtime_ns:
+        return True, entry.get('sha256')
+    digest = hash_file(input_path)
+    return digest == entry.get('sha256'), digest
+
+# --- 작업 프로세스 ---
+
+_worker_converter = None
+
+def _init_batch_worker(cache_size, converter_options):
+    """작업 프로세스마다 변환기 하나를 두고 파일 간에 재사용 (번역/날짜/금액 캐시 포함)
+
+    파일별 상태(reference_col_widths)는 convert가 파일마다 초기화함
+    """
+    global _worker_converter
+    _worker_converter = DouzoneConverter(cache=ConversionCache(cache_size), **converter_options)
+
+def convert_file(input_path, output_path, english_name, verbose=False, output_format='xlsx'):
+    """파일 하나 변환 - (성공 여부, 걸린 시간, 변환기 오류 로그) 반환"""
+    converter = _worker_converter
+    log = io.StringIO()
+    handler = logging.StreamHandler(log)
+    handler.setLevel(logging.ERROR)
+    converter_logger = logging.getLogger('converter')
+    # verbose가 아니면 진행 로그는 끄고 오류만 모아 요약에 기록
+    converter_logger.setLevel(logging.INFO if verbose else logging.ERROR)
+    converter_logger.propagate = verbose
+    converter_logger.addHandler(handler)
+    start = time.perf_counter()
+    try:
+        success = converter.convert(input_path, output_path, english_name, output_format=output_format)
+    finally:
+        converter_logger.removeHandler(handler)
+    return success, time.perf_counter() - start, log.getvalue()
+
+# --- 명령행 ---
+
+def run_batch(inputs, output_dir, company_map, company=None, workers=None, force=False,
+              converter_options=None, cache_size=65536, verbose=False, output_format='xlsx'):
+    """inputs를 output_dir로 변환하고 파일별 결과 요약(dict)을 반환"""
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = load_manifest(output_dir)
+    converter_options = converter_options or {}
+    started = time.time()
+    results = []
+    tasks = {}
+    root = input_root(inputs)
+    # 출력 경로 → 그 경로를 쓰는 입력 (같은 폴더의 ledger.xls와 ledger.xlsx처럼 겹치면 뒤의 것은 실패 처리)
+    claimed = {}
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                             initargs=(cache_size, converter_options)) as executor:
+        for input_path in inputs:
+            output_path = output_path_for(input_path, output_dir, output_format, root)
+            result = {'input': input_path, 'output': output_path, 'english_name': None,
+                      'status': None, 'seconds': 0.0, 'error': None}
+            results.append(result)
+            if output_path in claimed:
+                result.update(status='failed', error=f"출력 파일이 {claimed[output_path]}의 출력과 겹칩니다.")
+                continue
+            claimed[output_path] = input_path
+            try:
+                english_name = resolve_english_name(input_path, company_map, company)
+            except Exception as e:
+                result.update(status='failed', error=f"회사명 확인 실패: {e}")
+                continue
+            if not english_name:
+                result.update(status='failed', error="영문 회사명을 찾을 수 없습니다.")
+                continue
+            result['english_name'] = english_name
+
+            up_to_date, digest = (False, None) if force else is_up_to_date(
+                input_path, output_path, english_name, manifest.get(input_path), output_format)
+            if up_to_date:
+                result['status'] = 'skipped'
+                # 내용은 같고 수정 시각만 바뀐 경우 - 다음 실행에서 다시 해시하지 않도록 갱신
+                stat = os.stat(input_path)
+                manifest[input_path].update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+                continue
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+            future = executor.submit(convert_file, input_path, output_path, english_name, verbose, output_format)
+            tasks[future] = (result, digest)
+
+        for future in as_completed(tasks):
+            result, digest = tasks[future]
+            try:
+                success, seconds, log = future.result()
+            except Exception as e:
+                result.update(status='failed', error=str(e))
+                continue
+            result['seconds'] = round(seconds, 3)
+            if not success:
+                # 변환기 오류 로그의 마지막 줄을 원인으로 기록
+                errors = [line.strip() for line in log.splitlines() if line.strip()]
+                result.update(status='failed', error=errors[-1] if errors else "변환 실패")
+                continue
+            result['status'] = 'converted'
+            stat = os.stat(result['input'])
+            manifest[result['input']] = {
+                'output': result['output'],
+                'english_name': result['english_name'],
+                'output_format': output_format,
+                'version': result_version(),
+                'sha256': digest or hash_file(result['input']),
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+            }
+            print(f"✅ {os.path.basename(result['input'])} ({seconds:.2f}s)")
+
+    save_manifest(output_dir, manifest)
+    counts = {status: sum(1 for r in results if r['status'] == status) for status in ('converted', 'skipped', 'failed')}
+    return {
+        'version': result_version(),
+        'started': started,
+        'finished': time.time(),
+        'seconds': round(time.time() - started, 3),
+        'counts': counts,
+        'files': results,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="더존 계정별원장 엑셀 파일을 일괄 변환합니다.")
+    parser.add_argument('inputs', nargs='+', help="입력 폴더, glob 패턴 또는 파일")
+    parser.add_argument('-o', '--output-dir', required=True, help="변환 결과 폴더")
+    parser.add_argument('-m', '--mapping', default=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'companies.json'),
+                        help="회사명 매핑 JSON {한글 회사명 또는 파일 이름: [영문명, ...]}")
+    parser.add_argument('-c', '--company', help="모든 파일에 쓸 영문 회사명 (매핑보다 우선)")
+    parser.add_argument('-j', '--workers', type=int, default=None, help="동시 변환 프로세스 수 (기본: CPU 수)")
+    parser.add_argument('-s', '--summary', help="JSON 요약 파일 경로 (기본: 출력폴더/batch_summary.json)")
+    parser.add_argument('-f', '--force', action='store_true', help="최신인 출력도 다시 변환")
+    parser.add_argument('--format', choices=sorted(ALL_OUTPUT_FORMATS), default='xlsx', dest='output_format',
+                        help="출력 형식 - csv(시트별 CSV의 zip)/parquet(pyarrow 필요)/ndjson은 서식 없이 데이터 행만")
+    parser.add_argument('--streaming', action='store_true', help="write-only 워크북으로 저장")
+    parser.add_argument('--writer', choices=XLSX_WRITERS, default='openpyxl',
+                        help="xlsx 저장 방식 - xml은 시트 XML을 직접 써서 저장이 빠름 (결과는 openpyxl과 같음)")
+    parser.add_argument('--memory-budget', type=int, metavar='MB',
+                        help="시트를 나눠 처리할 때 행 데이터 메모리 상한 (MB) - 큰 원장용")
+    parser.add_argument('-i', '--incremental', action='store_true',
+                        help="시트별 변환 결과를 출력폴더/.sheet_cache에 두고 바뀐 시트(또는 뒤에 붙은 행)만 다시 변환")
+    parser.add_argument('-v', '--verbose', action='store_true', help="변환기 진행 로그 출력")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    try:
+        check_output_format(args.output_format)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+
+    inputs = find_inputs(args.inputs, exclude=args.output_dir)
+    if not inputs:
+        print("❌ 변환할 엑셀 파일이 없습니다.")
+        return 1
+    company_map = load_company_map(args.mapping) if os.path.exists(args.mapping) else {}
+
+    converter_options = {'streaming': args.streaming, 'writer': args.writer}
+    if args.memory_budget:
+        converter_options['memory_budget'] = args.memory_budget << 20
+    if args.incremental:
+        converter_options['sheet_cache'] = os.path.join(os.path.abspath(args.output_dir), SHEET_CACHE_NAME)
+
+    print(f"🔄 {len(inputs)}개 파일 변환 시작")
+    summary = run_batch(inputs, args.output_dir, company_map, company=args.company, workers=args.workers,
+                        force=args.force, converter_options=converter_options, verbose=args.verbose,
+                        output_format=args.output_format)
+
+    summary_path = args.summary or os.path.join(args.output_dir, 'batch_summary.json')
+    with open(summary_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+
+    counts = summary['counts']
+    for result in summary['files']:
+        if result['status'] == 'failed':
+            print(f"❌ {os.path.basename(result['input'])}: {result['error']}")
+    print(f"📋 변환 {counts['converted']} / 건너뜀 {counts['skipped']} / 실패 {counts['failed']} "
+          f"({summary['seconds']:.1f}s) - 요약: {summary_path}")
+    return 1 if counts['failed'] else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
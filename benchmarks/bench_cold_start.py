@@ -0,0 +1,116 @@
+"""웹 워커 기동부터 첫 변환 응답까지 걸리는 시간 (콜드 스타트)
+
+    python benchmarks/bench_cold_start.py [--rows 200] [--repeat 5] [--modes cold,prewarm,preload]
+
+  cold     새 프로세스, CONVERTER_PREWARM=0 - app import 후 첫 요청에서 변환기 준비
+  prewarm  새 프로세스, app import 때 warm_up - 준비 시간이 import 쪽으로 옮겨감
+  preload  gunicorn preload_app처럼 app을 import(+warm_up)한 프로세스를 포크한 워커 - 포크 시점부터 측정
+
+요청은 Flask 테스트 클라이언트로 POST / (결과 캐시에 걸리지 않도록 요청마다 영문명을 바꿈).
+"""
+import argparse
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+MODES = {
+    'cold': {'CONVERTER_PREWARM': '0'},
+    'prewarm': {'CONVERTER_PREWARM': '1'},
+    'preload': {'CONVERTER_PREWARM': '1'},
+}
+
+def post_convert(client, data, index):
+    """POST / 한 번 - 걸린 시간(초)"""
+    start = time.perf_counter()
+    response = client.post('/', data={
+        'excel_file': (io.BytesIO(data), 'ledger.xlsx'),
+        'selected_english_name': f'Cold Start {index}',
+    }, content_type='multipart/form-data')
+    response.get_data()
+    if response.status_code != 200:
+        raise SystemExit(f"변환 요청 실패: {response.status_code}")
+    return time.perf_counter() - start
+
+def serve_requests(data, started):
+    """첫 요청/두 번째 요청 시간과 started(time.time())부터 첫 응답까지의 시간을 JSON으로 표준 출력에 씀"""
+    from app import app
+    client = app.test_client()
+    ready = time.time() - started
+    first = post_convert(client, data, 1)
+    to_first_response = time.time() - started
+    second = post_convert(client, data, 2)
+    json.dump({'ready': ready, 'first': first, 'second': second, 'to_first_response': to_first_response}, sys.stdout)
+    sys.stdout.flush()
+
+def run_child(mode, input_path, started):
+    """(하위 프로세스) cold/prewarm은 바로, preload는 app import 후 포크한 프로세스에서 요청 처리
+
+    started는 부모가 프로세스를 띄운 시각 - 인터프리터 기동 시간까지 포함해 측정
+    """
+    with open(input_path, 'rb') as f:
+        data = f.read()
+    if mode != 'preload':
+        serve_requests(data, started)
+        return
+
+    import app  # noqa: F401 - 마스터에서 미리 import (+ warm_up)
+    started = time.time()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            serve_requests(data, started)
+        finally:
+            os._exit(0)
+    os.waitpid(pid, 0)
+
+def run_mode(mode, input_path, repeat):
+    runs = []
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as tmp:
+            env = dict(os.environ, LOG_LEVEL='WARNING', PYTHONPATH=ROOT, **MODES[mode])
+            output = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', mode, input_path,
+                                     repr(time.time())],
+                                    check=True, capture_output=True, text=True, cwd=tmp, env=env).stdout
+        runs.append(json.loads(output))
+    return {key: statistics.median(r[key] for r in runs) for key in runs[0]}
+
+def main():
+    parser = argparse.ArgumentParser(description="웹 워커 콜드 스타트 측정")
+    parser.add_argument('--rows', type=int, default=200, help="요청 원장의 시트당 데이터 행 수")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--modes', default='cold,prewarm,preload', help=f"쉼표로 구분 ({', '.join(MODES)})")
+    parser.add_argument('--child', nargs=3, metavar=('MODE', 'INPUT', 'STARTED'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        mode, input_path, started = args.child
+        run_child(mode, input_path, float(started))
+        return
+
+    modes = [m.strip() for m in args.modes.split(',') if m.strip()]
+    unknown = [m for m in modes if m not in MODES]
+    if unknown:
+        parser.error(f"알 수 없는 모드: {', '.join(unknown)}")
+    if 'preload' in modes and not hasattr(os, 'fork'):
+        parser.error("preload 모드는 fork가 되는 환경에서만 측정할 수 있습니다.")
+
+    from douzone_fixtures import generate_ledger
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = generate_ledger(os.path.join(tmp, 'ledger.xlsx'), sheets=2, rows=args.rows)
+        print(f"입력: 2개 시트 x {args.rows}행, 반복 {args.repeat}회")
+        print(f"  {'모드':10s} {'첫 응답까지':>12s} {'준비':>9s} {'첫 요청':>9s} {'두 번째':>9s}")
+        for mode in modes:
+            r = run_mode(mode, input_path, args.repeat)
+            print(f"  {mode:10s} {r['to_first_response']:10.3f} s {r['ready']:7.3f} s {r['first']:7.3f} s {r['second']:7.3f} s")
+
+if __name__ == '__main__':
+    main()
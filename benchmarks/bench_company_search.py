@@ -0,0 +1,93 @@
+"""회사명 검색 마이크로벤치마크 - 기존 전체 순회와 CompanyIndex의 질의당 지연 비교
+
+    python benchmarks/bench_company_search.py [회사 수] [질의 수]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from company_index import CompanyIndex  # noqa: E402
+
+
+SYLLABLES = '가나다라마바사아자차카타파하한국대성삼현기술산업전자화학물류상사건설제약'
+SUFFIXES = ['(주)', '주식회사', '유한회사', '코리아', '대표사무소', '(영업소)', '지점']
+
+
+def synthetic_company_map(count, seed=0):
+    """한글 회사명 count개와 영문명 1~2개씩"""
+    rng = random.Random(seed)
+    mapping = {}
+    while len(mapping) < count:
+        core = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 8)))
+        kr_name = f"{core}{rng.choice(SUFFIXES)}"
+        en_core = ''.join(rng.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ') for _ in range(rng.randint(3, 10)))
+        mapping[kr_name] = [f"{en_core} KOREA"] + ([f"{en_core} CO., LTD."] if rng.random() < 0.5 else [])
+    return mapping
+
+
+def synthetic_queries(mapping, count, seed=1):
+    """회사명 일부(1~5자)를 잘라낸 질의 - 일부는 영문, 일부는 없는 이름"""
+    rng = random.Random(seed)
+    names = list(mapping)
+    queries = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.8:
+            name = rng.choice(names)
+        elif kind < 0.95:
+            name = rng.choice(mapping[rng.choice(names)]).lower()
+        else:
+            name = '존재하지않는회사'
+        length = rng.randint(1, min(5, len(name)))
+        start = rng.randint(0, len(name) - length)
+        queries.append(name[start:start + length])
+    return queries
+
+
+def linear_search(mapping, query):
+    """기존 search_company와 같은 전체 순회 (영문명 포함)"""
+    query = query.strip().lower()
+    if not query:
+        return []
+    return [kr for kr, en in mapping.items() if any(query in name.lower() for name in [kr, *en])]
+
+
+def measure(func, queries, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for query in queries:
+            func(query)
+        best = min(best, time.perf_counter() - start)
+    return best / len(queries)
+
+
+def main():
+    companies = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    mapping = synthetic_company_map(companies)
+    queries = synthetic_queries(mapping, count)
+
+    start = time.perf_counter()
+    index = CompanyIndex(mapping)
+    build = time.perf_counter() - start
+
+    mismatches = [q for q in queries
+                  if sorted(r['kr'] for r in index.search(q, limit=None)) != sorted(linear_search(mapping, q))]
+    if mismatches:
+        print(f"❌ 결과 불일치 {len(mismatches)}건: {mismatches[:5]}")
+        sys.exit(1)
+
+    old = measure(lambda q: linear_search(mapping, q), queries)
+    new = measure(lambda q: index.search(q, limit=20), queries)
+
+    print(f"회사 {companies:,}개, 질의 {count:,}건 (색인 생성 {build * 1000:.1f} ms)")
+    print(f"  전체 순회     : {old * 1e6:10.1f} µs/질의")
+    print(f"  CompanyIndex  : {new * 1e6:10.1f} µs/질의 ({old / new:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
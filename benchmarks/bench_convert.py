@@ -0,0 +1,181 @@
+"""DouzoneConverter.convert 벤치마크 - 설정별 전체/단계별 처리량(행/초)과 최대 RSS
+
+    python benchmarks/bench_convert.py [--sheets 5] [--rows 5000] [--repeat 3] [--configs default,streaming]
+                                       [--save-baseline base.json] [--baseline base.json] [--tolerance 0.15]
+
+실행마다 새 프로세스에서 변환하므로 최대 RSS는 그 실행 하나의 값. 같은 --seed/--sheets/--rows면
+합성 원장이 같으므로 저장해 둔 기준(--save-baseline)과 비교할 수 있음 (--baseline).
+"""
+import argparse
+import json
+import logging
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+CONFIGS = {
+    'default': {},
+    'streaming': {'streaming': True},
+    'rowwise': {'vectorized': False},
+    'pandas_reader': {'fast_reader': False},
+    'parallel': {'workers': 4},
+    'chunked': {'memory_budget': 32 << 20},
+    'csv': {'output_format': 'csv'},
+    'parquet': {'output_format': 'parquet'},
+    'ndjson': {'output_format': 'ndjson'},
+}
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_child(config, input_path):
+    """(하위 프로세스) 변환 한 번 - 결과를 JSON으로 표준 출력에 씀"""
+    from converter import CONVERTER_VERSION, DouzoneConverter
+    from exporters import OUTPUT_FORMATS, check_output_format
+    from metrics import PipelineMetrics
+
+    logging.disable(logging.CRITICAL)
+    metrics = PipelineMetrics()
+    options = dict(CONFIGS[config])
+    output_format = options.pop('output_format', 'xlsx')
+    check_output_format(output_format)
+    converter = DouzoneConverter(metrics=metrics, **options)
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = os.path.join(tmp, 'out' + OUTPUT_FORMATS[output_format][0])
+        start = time.perf_counter()
+        success = converter.convert(input_path, output_path, 'Benchmark Co', output_format=output_format)
+        seconds = time.perf_counter() - start
+    if not success:
+        raise SystemExit(f"변환 실패: {config}")
+    stages = metrics.snapshot()['stages']
+    json.dump({
+        'version': CONVERTER_VERSION,
+        'seconds': seconds,
+        'rows': stages.get('process_data_rows', {}).get('rows', 0),
+        'peak_rss_mb': peak_rss_mb(),
+        'stages': {name: {'seconds': s['seconds'], 'rows': s['rows'], 'bytes': s['bytes']} for name, s in stages.items()},
+    }, sys.stdout)
+
+
+def run_config(config, input_path, repeat):
+    """설정 하나를 repeat번 (매번 새 프로세스) 실행해 시간은 중앙값, RSS는 최댓값으로 요약"""
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', config, input_path],
+                                check=True, capture_output=True, text=True, cwd=ROOT).stdout
+        runs.append(json.loads(output))
+
+    seconds = statistics.median(r['seconds'] for r in runs)
+    rows = runs[0]['rows']
+    stages = {}
+    for name in runs[0]['stages']:
+        stage_seconds = statistics.median(r['stages'][name]['seconds'] for r in runs)
+        stage_rows = runs[0]['stages'][name]['rows']
+        stages[name] = {
+            'seconds': stage_seconds,
+            'rows': stage_rows,
+            'rows_per_sec': stage_rows / stage_seconds if stage_rows and stage_seconds else None,
+        }
+    return {
+        'seconds': seconds,
+        'rows': rows,
+        'rows_per_sec': rows / seconds if seconds else None,
+        'peak_rss_mb': max(r['peak_rss_mb'] for r in runs),
+        'stages': stages,
+        'version': runs[0]['version'],
+    }
+
+
+def compare(results, baseline, tolerance):
+    """기준 대비 처리량 비율 출력 - 전체 처리량이 tolerance 이상 떨어진 설정 목록 반환"""
+    regressions = []
+    for config, result in results.items():
+        base = baseline.get('results', {}).get(config)
+        if not base:
+            continue
+        ratio = result['rows_per_sec'] / base['rows_per_sec']
+        rss = result['peak_rss_mb'] - base['peak_rss_mb']
+        flag = '❌' if ratio < 1 - tolerance else '✅'
+        print(f"  {flag} {config:14s} 처리량 {ratio:6.2f}x  RSS {rss:+8.1f} MB")
+        for name, stage in sorted(result['stages'].items()):
+            base_stage = base['stages'].get(name)
+            if stage['rows_per_sec'] and base_stage and base_stage.get('rows_per_sec'):
+                print(f"       {name:22s} {stage['rows_per_sec'] / base_stage['rows_per_sec']:6.2f}x")
+        if ratio < 1 - tolerance:
+            regressions.append(config)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DouzoneConverter.convert 벤치마크")
+    parser.add_argument('--sheets', type=int, default=5)
+    parser.add_argument('--rows', type=int, default=5000, help="시트당 데이터 행 수")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--configs', default='default,streaming', help=f"쉼표로 구분 ({', '.join(CONFIGS)})")
+    parser.add_argument('--input', help="합성 원장 대신 쓸 입력 파일")
+    parser.add_argument('--save-baseline', help="결과를 기준 파일로 저장")
+    parser.add_argument('--baseline', help="비교할 기준 파일")
+    parser.add_argument('--tolerance', type=float, default=0.15, help="허용하는 처리량 감소 비율")
+    parser.add_argument('--child', nargs=2, metavar=('CONFIG', 'INPUT'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(*args.child)
+        return
+
+    configs = [c.strip() for c in args.configs.split(',') if c.strip()]
+    unknown = [c for c in configs if c not in CONFIGS]
+    if unknown:
+        parser.error(f"알 수 없는 설정: {', '.join(unknown)}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = args.input
+        if input_path is None:
+            from douzone_fixtures import generate_ledger
+            input_path = generate_ledger(os.path.join(tmp, 'ledger.xlsx'), args.sheets, args.rows, args.seed)
+        input_path = os.path.abspath(input_path)
+
+        print(f"입력: {os.path.basename(input_path)} ({os.path.getsize(input_path) / 1024:,.0f} KB), 반복 {args.repeat}회")
+        results = {}
+        for config in configs:
+            result = results[config] = run_config(config, input_path, args.repeat)
+            print(f"  {config:14s} {result['seconds']:8.3f} s  {result['rows_per_sec']:12,.0f} 행/초  "
+                  f"최대 RSS {result['peak_rss_mb']:8.1f} MB")
+            for name, stage in sorted(result['stages'].items()):
+                speed = f"{stage['rows_per_sec']:12,.0f} 행/초" if stage['rows_per_sec'] else ''
+                print(f"       {name:22s} {stage['seconds']:8.3f} s  {speed}")
+
+    report = {
+        'params': {'sheets': args.sheets, 'rows': args.rows, 'seed': args.seed, 'input': args.input},
+        'results': results,
+    }
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"기준 저장: {args.save_baseline}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        if baseline.get('params') != report['params']:
+            print(f"⚠️ 기준과 입력 조건이 다릅니다: {baseline.get('params')}")
+        print(f"기준 대비 ({args.baseline}):")
+        if compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""용어집 크기에 따른 번역 처리량/읽기 시간
+
+    python benchmarks/bench_glossary.py [--sizes 15,100,1000,5000] [--count 20000]
+
+용어 N개짜리 합성 용어집(기본 용어집 + 임의의 한글 용어)으로 적요 치환을 세 가지 방식으로 측정:
+  loop   사전 순서대로 `in` 검사 + str.replace (예전 translate_text)
+  regex  길이 내림차순 대체(|) 정규식 1회 치환 (예전 TranslationEngine)
+  trie   glossary.TermMatcher (현재)
+regex와 trie 결과가 하나라도 다르면 종료 코드 1. 읽기 시간은 원본 JSON 컴파일과 컴파일 파일 읽기 비교.
+"""
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from glossary import TermMatcher, compile_glossary, default_glossary, load_glossary, parse_glossary  # noqa: E402
+
+SYLLABLES = '가나다라마바사아자차카타파하금예입출비용수익부채자본매외상미지급선대여차손충당세'
+
+def synthetic_glossary(size, seed=0):
+    """기본 용어집에 임의 용어를 더해 용어 size개로"""
+    rng = random.Random(seed)
+    base = default_glossary()
+    sections = {name: dict(terms) for name, terms in base.sections.items()}
+    accounts = sections['accounts']
+    while len(accounts) + len(sections['phrases']) < size:
+        term = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 6)))
+        accounts.setdefault(term, f"Account {len(accounts)}")
+    return {'version': f'bench-{size}', **sections}
+
+def synthetic_memos(terms, count, seed=1):
+    """적요 문자열 - 절반은 용어를 한두 개 포함"""
+    rng = random.Random(seed)
+    memos = ['급여 지급', '사무용품 구입', '(주)가나상사 송금', '법인카드 결제', 'ABC Corp', '보험료 자동이체']
+    values = []
+    for _ in range(count):
+        if rng.random() < 0.5:
+            values.append(rng.choice(memos))
+        else:
+            values.append(' '.join(rng.choice(terms) for _ in range(rng.randint(1, 2))) + ' ' + rng.choice(memos))
+    return values
+
+def measure(func, values, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for value in values:
+            func(value)
+        best = min(best, time.perf_counter() - start)
+    return len(values) / best
+
+def main():
+    parser = argparse.ArgumentParser(description="용어집 크기별 번역 처리량")
+    parser.add_argument('--sizes', default='15,100,1000,5000', help="쉼표로 구분한 용어 수")
+    parser.add_argument('--count', type=int, default=20000, help="크기마다 치환할 적요 수")
+    args = parser.parse_args()
+
+    print(f"적요 {args.count:,}건, 건/초")
+    print(f"  {'용어 수':>8s} {'loop':>11s} {'regex':>11s} {'trie':>11s} {'JSON 컴파일':>12s} {'컴파일 파일':>12s}")
+    failed = False
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in (int(s) for s in args.sizes.split(',')):
+            path = os.path.join(tmp, f'glossary_{size}.json')
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(synthetic_glossary(size), f, ensure_ascii=False)
+
+            start = time.perf_counter()
+            glossary = parse_glossary(path)
+            parse_seconds = time.perf_counter() - start
+            compile_glossary(path)
+            start = time.perf_counter()
+            load_glossary(path)
+            load_seconds = time.perf_counter() - start
+
+            translations = glossary.translations
+            memos = synthetic_memos(list(translations), args.count)
+            pattern = re.compile('|'.join(re.escape(k) for k in sorted(translations, key=len, reverse=True)))
+            matcher = TermMatcher(translations)
+
+            def loop(text):
+                for korean, english in translations.items():
+                    if korean in text:
+                        text = text.replace(korean, english)
+                return text
+
+            def regex(text):
+                return pattern.sub(lambda m: translations[m.group(0)], text)
+
+            mismatches = [m for m in memos if regex(m) != matcher.sub(m)]
+            if mismatches:
+                print(f"❌ 용어 {size}개: regex/trie 결과 불일치 {len(mismatches)}건: {mismatches[:3]}")
+                failed = True
+
+            # loop는 용어가 많으면 너무 느려 일부만 측정
+            loop_rate = measure(loop, memos[:max(200, args.count * 100 // size)], repeat=1)
+            print(f"  {len(translations):8,d} {loop_rate:11,.0f} {measure(regex, memos):11,.0f} "
+                  f"{measure(matcher.sub, memos):11,.0f} {parse_seconds * 1000:9.1f} ms {load_seconds * 1000:9.1f} ms")
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
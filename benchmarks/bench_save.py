@@ -0,0 +1,209 @@
+"""xlsx 저장 방식(writer) 비교 - openpyxl(기준)과 xml 저장본이 같은지 확인하고 저장 처리량 측정
+
+    python benchmarks/bench_save.py [--sheets 3] [--rows 5000] [--repeat 3] [--check-only]
+
+0) openpyxl 내부 구현 확인: xml 저장 방식이 쓰는 내부 함수/속성과 시트 XML 머리/꼬리가 그대로인지 - 다르면 종료 코드 1
+1) 골든 비교: 합성 원장과 특수 값 원장(수식처럼 보이는 문자열, 오류 코드, 앞뒤 공백, 날짜/불리언 값,
+   G열 밖의 열, 3행/합계 행의 날짜, 빈 시트, 제어 문자 행이 든 xls - xlwt 필요)을 모드별(default/streaming/chunked)로 두 방식 모두 변환하고, openpyxl로 다시 읽어
+   시트 설정(병합/틀고정/열 너비/행 높이/활성 셀)과 모든 셀의 값/타입/서식을 비교 - 다르면 종료 코드 1
+2) 처리량: 행을 시트에 쓰고 저장하는 단계(write_rows + apply_formatting + write_streaming_sheet + save)의
+   시간과 초당 행 수, 전체 변환 시간, 결과 파일 크기
+"""
+import argparse
+import io
+import logging
+import os
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import date, datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import openpyxl  # noqa: E402
+from openpyxl import Workbook, load_workbook  # noqa: E402
+
+from converter import DouzoneConverter  # noqa: E402
+from douzone_fixtures import HEADERS, generate_ledger  # noqa: E402
+from metrics import PipelineMetrics  # noqa: E402
+from xlsx_writer import VERIFIED_OPENPYXL, check_openpyxl_internals  # noqa: E402
+
+MODES = {
+    'default': {},
+    'streaming': {'streaming': True},
+    'chunked': {'memory_budget': 1},
+}
+WRITE_STAGES = ('write_rows', 'apply_formatting', 'write_streaming_sheet', 'save')
+
+EDGE_ROWS = [
+    [None, None, None, '계   정   별   원   장'],
+    [None, None, None, '2024년 1월 1일 부터 2024년 3월 31일 까지'],
+    ['회사명: (주)특수값', None, None, None, None, None, '단위 : 원', datetime(2024, 4, 1, 8, 0)],
+    HEADERS + ['비고', '담당'],
+    [None, '전기이월', None, None, 0, 0, 0],
+    ['2024-01-02', '=SUM(E5:E6)', '00101', '#N/A', '12,000', None, 12000, '  앞뒤 공백  ', True],
+    ['2024-01-03', '<태그> & "따옴표"', 102, datetime(2024, 1, 5, 9, 30), None, 2000.5, 9999.5, '', False],
+    ['2024-01-04', '   ', '=', 'x' * 300, 0.1, 1e20, -0.0, 12345678901234567, 3.141592653589793],
+    [None, '[ 월         계 ]', None, date(2024, 1, 31), 12000, 2000.5, None],
+    [None, '[ 누         계 ]', None, None, 12000, 2000.5, None],
+]
+# 셀에 쓸 수 없는 제어 문자가 든 적요 - xlsx에는 담을 수 없고 xls(xlrd로 읽음)로만 들어옴
+CONTROL_ROW = ['2024-01-05', '제어\x01문자', None, None, 500, None, 12500]
+
+def generate_edge_ledger(path):
+    """저장 방식마다 다르게 쓰기 쉬운 값을 모은 원장"""
+    wb = Workbook()
+    ws = wb.active
+    ws.title = '1_bank deposits'
+    for row in EDGE_ROWS:
+        ws.append(row)
+    # '='/'#'으로 시작하는 값을 수식/오류가 아닌 문자열 셀로 저장 (변환기는 문자열로 읽음)
+    for coordinate in ('B6', 'D6'):
+        ws[coordinate].data_type = 's'
+    ws2 = wb.create_sheet('2_보통예금(10300)')
+    for row in EDGE_ROWS[:4] + [[None, '사무용품 구입', None, None, 1, 2, 3]]:
+        ws2.append(row)
+    wb.create_sheet('3_빈 시트')
+    wb.save(path)
+    return path
+
+def generate_control_ledger(path):
+    """특수 값 원장 중간에 제어 문자 행을 넣은 xls - 시트를 쓰다가 셀 오류가 나는 경우 (xlwt 없으면 None)
+
+    변환기는 그 시트를 처리 실패로 기록하고 나머지 시트만 저장함. 시트 XML은 오류 전 행까지로 닫혀야 함
+    """
+    try:
+        import xlwt
+    except ImportError:
+        return None
+    book = xlwt.Workbook(encoding='utf-8')
+    date_style = xlwt.easyxf(num_format_str='yyyy-mm-dd hh:mm')
+    sheets = (('1_bank deposits', EDGE_ROWS[:7] + [CONTROL_ROW] + EDGE_ROWS[7:]),
+              ('2_보통예금(10300)', EDGE_ROWS[:4] + [[None, '사무용품 구입', None, None, 1, 2, 3]]))
+    for title, rows in sheets:
+        sheet = book.add_sheet(title)
+        for r, row in enumerate(rows):
+            for c, value in enumerate(row):
+                if isinstance(value, datetime):
+                    sheet.write(r, c, value, date_style)
+                elif value is not None:
+                    sheet.write(r, c, value)
+    book.save(path)
+    return path
+
+def workbook_signature(path):
+    """openpyxl로 다시 읽은 워크북의 비교용 목록 - 시트 설정 + 셀마다 (좌표, 값, 타입, 서식)"""
+    wb = load_workbook(path)
+    signature = [('sheets', tuple(wb.sheetnames))]
+    for ws in wb.worksheets:
+        selection = ws.sheet_view.selection[0] if ws.sheet_view.selection else None
+        signature.append(('sheet', ws.title, ws.dimensions, str(ws.freeze_panes),
+                          tuple(sorted(str(r) for r in ws.merged_cells.ranges)),
+                          tuple((k, ws.column_dimensions[k].width) for k in 'ABCDEFG'),
+                          tuple((r, ws.row_dimensions[r].height) for r in (1, 2, 3)),
+                          selection.activeCell if selection else None))
+        for row in ws.iter_rows():
+            for c in row:
+                border = tuple(getattr(getattr(c.border, side), 'style', None) for side in ('left', 'right', 'top', 'bottom'))
+                signature.append((c.coordinate, c.value, c.data_type, c.style, c.number_format,
+                                  c.font.name, c.font.sz, c.font.b, c.alignment.horizontal, c.alignment.vertical,
+                                  c.fill.fill_type, c.fill.fgColor.rgb, border))
+    return signature
+
+def convert(input_path, output_path, metrics=None, **options):
+    with redirect_stdout(io.StringIO()):
+        return DouzoneConverter(metrics=metrics or PipelineMetrics(), **options).convert(
+            input_path, output_path, 'Golden Co')
+
+def golden_check(inputs, tmp):
+    """모드/입력마다 openpyxl 저장본(골든)과 xml 저장본 비교 - 불일치 목록
+
+    inputs의 각 항목은 (이름, 입력 경로, 골든 쪽에 더할 옵션)
+    """
+    failures = []
+    for label, input_path, reference in inputs:
+        for mode, options in MODES.items():
+            golden = os.path.join(tmp, f'golden_{label}_{mode}.xlsx')
+            candidate = os.path.join(tmp, f'xml_{label}_{mode}.xlsx')
+            results = (convert(input_path, golden, **{**options, 'writer': 'openpyxl', **reference}),
+                       convert(input_path, candidate, writer='xml', **options))
+            if results[0] != results[1]:
+                failures.append((label, mode, f"변환 결과가 다름 {results}"))
+                continue
+            try:
+                expected, actual = workbook_signature(golden), workbook_signature(candidate)
+            except Exception as e:
+                failures.append((label, mode, f"저장본을 읽을 수 없음: {e}"))
+                print(f"  ❌ {label:8s} {mode:10s} 읽기 실패")
+                continue
+            if expected != actual:
+                diff = next(((e, a) for e, a in zip(expected, actual) if e != a), (len(expected), len(actual)))
+                failures.append((label, mode, diff))
+            print(f"  {'✅' if expected == actual else '❌'} {label:8s} {mode:10s} 셀 {len(expected):,}개")
+    return failures
+
+def measure(input_path, output_path, rows, repeat, **options):
+    """(쓰기+저장 초, 전체 변환 초, 파일 크기) - repeat회 중 최소"""
+    best = None
+    for _ in range(repeat):
+        metrics = PipelineMetrics()
+        start = time.perf_counter()
+        convert(input_path, output_path, metrics=metrics, **options)
+        total = time.perf_counter() - start
+        stages = metrics.snapshot()['stages']
+        write = sum(stages[name]['seconds'] for name in WRITE_STAGES if name in stages)
+        if best is None or write < best[0]:
+            best = (write, total, os.path.getsize(output_path))
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="xlsx 저장 방식 골든 비교 + 저장 처리량")
+    parser.add_argument('--sheets', type=int, default=3)
+    parser.add_argument('--rows', type=int, default=5000, help="시트당 데이터 행 수")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--check-only', action='store_true', help="골든 비교만 (처리량 측정 생략)")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    # xml 저장 방식이 따라 쓰는 openpyxl 내부 구현 - 바뀌었으면 골든 비교 전에 실패
+    problems = check_openpyxl_internals()
+    for problem in problems:
+        print(f"❌ openpyxl 내부 구현: {problem}")
+    if problems:
+        return 1
+    if openpyxl.__version__ != VERIFIED_OPENPYXL:
+        print(f"⚠️ openpyxl {openpyxl.__version__} - 검증한 버전({VERIFIED_OPENPYXL})과 다름, 골든 비교로 확인")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        inputs = [('ledger', generate_ledger(os.path.join(tmp, 'ledger.xlsx'), sheets=2, rows=300), {}),
+                  ('edge', generate_edge_ledger(os.path.join(tmp, 'edge.xlsx')), {})]
+        # 시트 쓰기 중 오류 - openpyxl 일반 저장은 서식 없는 시트를 남기므로 write-only(streaming) 저장본과 비교
+        control = generate_control_ledger(os.path.join(tmp, 'control.xls'))
+        if control is None:
+            print("⚠️ xlwt가 없어 제어 문자 원장(xls) 비교는 건너뜀")
+        else:
+            inputs.append(('control', control, {'streaming': True}))
+        print("골든 비교 (openpyxl 저장본 = 기준)")
+        failures = golden_check(inputs, tmp)
+        for label, mode, diff in failures:
+            print(f"❌ {label}/{mode}: {diff}")
+        if failures or args.check_only:
+            return 1 if failures else 0
+
+        input_path = generate_ledger(os.path.join(tmp, 'bench.xlsx'), sheets=args.sheets, rows=args.rows)
+        rows = args.sheets * (args.rows + 30)
+        print(f"\n저장 처리량: {args.sheets}개 시트 x {args.rows}행, {args.repeat}회 중 최소")
+        print(f"  {'방식':22s} {'쓰기+저장':>10s} {'행/초':>11s} {'전체 변환':>10s} {'파일 크기':>12s}")
+        baseline = None
+        for label, options in (('openpyxl', {}), ('openpyxl streaming', {'streaming': True}),
+                               ('xml', {'writer': 'xml'})):
+            write, total, size = measure(input_path, os.path.join(tmp, 'out.xlsx'), rows, args.repeat, **options)
+            baseline = baseline or write
+            print(f"  {label:22s} {write:8.3f} s {rows / write:11,.0f} {total:8.3f} s {size:12,d}"
+                  f"  ({baseline / write:.1f}x)")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,119 @@
+"""translate_text 마이크로벤치마크 - 기존 구현과 TranslationEngine 처리량 비교
+
+    python benchmarks/bench_translate.py [설명 개수]
+"""
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd  # noqa: E402
+
+from converter import DouzoneConverter  # noqa: E402
+
+
+def legacy_translate_korean_date_period(text):
+    """매 호출마다 정규식을 컴파일하던 기존 구현"""
+    text_str = str(text).strip()
+    pattern = r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일\s*(?:부터|~|-)\s*(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일\s*(?:까지|)'
+    match = re.search(pattern, text_str)
+    if match:
+        start_year, start_month, start_day, end_year, end_month, end_day = match.groups()
+        start_date = f"{start_year}.{start_month.zfill(2)}.{start_day.zfill(2)}"
+        end_date = f"{end_year}.{end_month.zfill(2)}.{end_day.zfill(2)}"
+        return f"{start_date} - {end_date}"
+    single_pattern = r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일'
+    single_match = re.search(single_pattern, text_str)
+    if single_match:
+        year, month, day = single_match.groups()
+        converted_date = f"{year}.{month.zfill(2)}.{day.zfill(2)}"
+        return re.sub(single_pattern, converted_date, text_str)
+    return text_str
+
+
+def legacy_translate_text(translations, text):
+    """사전 전체를 돌며 str.replace 하던 기존 translate_text"""
+    if pd.isna(text) or text is None:
+        return text
+    text = str(text).strip()
+    if not text:
+        return text
+    text = legacy_translate_korean_date_period(text)
+    if re.search(r'계정.*원장|원장.*계정', text):
+        return 'General Ledger'
+    if re.search(r'\[\s*월\s*계\s*\]', text):
+        return 'Monthly total'
+    if re.search(r'\[\s*누\s*계\s*\]', text):
+        return 'Cumulative total'
+    if text in translations:
+        return translations[text]
+    for korean, english in translations.items():
+        if korean in text:
+            text = text.replace(korean, english)
+    return text
+
+
+def synthetic_descriptions(count, seed=0):
+    """더존 적요란과 비슷한 설명 문자열 - 사전 키를 임의로 이어 붙인 경우 포함"""
+    rng = random.Random(seed)
+    converter = DouzoneConverter()
+    keys = list(converter.translations)
+    memos = ['급여 지급', '사무용품 구입', '임차료 지급', '카드대금', '(주)가나상사 송금', '부가세 예수금',
+             '법인카드 결제', '통신비', 'ABC Corp', '보험료 자동이체', '이자수익', '']
+    descriptions = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.6:
+            descriptions.append(rng.choice(memos))
+        elif kind < 0.75:
+            descriptions.append(rng.choice(['[ 월         계 ]', '[ 누         계 ]', '전기이월']))
+        elif kind < 0.8:
+            descriptions.append(f'{rng.randint(2020, 2025)}년 {rng.randint(1, 12)}월 {rng.randint(1, 28)}일 매입')
+        else:
+            parts = [rng.choice(keys + memos) for _ in range(rng.randint(1, 4))]
+            descriptions.append(rng.choice(['', ' ']).join(parts))
+    return descriptions
+
+
+def measure(func, values, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for value in values:
+            func(value)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    # 엔진 자체 처리량을 보기 위해 LRU 캐시는 끔
+    converter = DouzoneConverter(cache_size=0)
+    values = synthetic_descriptions(count)
+
+    mismatches = [v for v in values if legacy_translate_text(converter.translations, v) != converter.translate_text(v)]
+    if mismatches:
+        print(f"❌ 결과 불일치 {len(mismatches)}건: {mismatches[:5]}")
+        sys.exit(1)
+
+    old = measure(lambda v: legacy_translate_text(converter.translations, v), values)
+    new = measure(converter.translate_text, values)
+    cached_converter = DouzoneConverter()
+    cached = measure(cached_converter.translate_text, values)
+    series = pd.Series(values, dtype=object)
+    start = time.perf_counter()
+    converter._translate_series(series)
+    column = time.perf_counter() - start
+
+    print(f"설명 {count:,}건 (single_pass={converter.translator.single_pass})")
+    print(f"  기존 translate_text : {count / old:12,.0f} 건/초")
+    print(f"  TranslationEngine  : {count / new:12,.0f} 건/초 ({old / new:.2f}x)")
+    print(f"  + LRU 캐시          : {count / cached:12,.0f} 건/초 ({old / cached:.2f}x)")
+    print(f"  열 단위(_translate_series): {count / column:12,.0f} 건/초")
+
+
+if __name__ == '__main__':
+    main()
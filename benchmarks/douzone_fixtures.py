@@ -0,0 +1,71 @@
+"""더존 계정별원장 형식의 합성 엑셀 생성기 (벤치마크/비교용)
+
+    python benchmarks/douzone_fixtures.py 출력.xlsx [--sheets 5] [--rows 2000] [--seed 0]
+
+시트마다 1~3행 제목(D1 '계   정   별   원   장', D2 기간, A3 회사명/G3 단위), 4행 머리글,
+그리고 월별 데이터 행 뒤에 '[ 월         계 ]' / '[ 누         계 ]' 행이 들어감.
+"""
+import argparse
+import random
+
+from openpyxl import Workbook
+
+HEADERS = ['날짜', '적    요    란', '코드', '거래처', '차   변', '대   변', '잔   액']
+ACCOUNTS = ['보통예금(10300)', '외상매출금(10800)', '미수금(12000)', '선급비용(13300)', '외상매입금(25100)',
+            '미지급금(25300)', '예수금(25400)', '급여(80200)', '복리후생비(81100)', '지급임차료(81900)']
+MEMOS = ['급여 지급', '사무용품 구입', '임차료 지급', '카드대금', '(주)가나상사 송금', '부가세 예수금',
+         '법인카드 결제', '통신비', '보험료 자동이체', '이자수익', '이월결손금 정리', 'ABC Corp 용역비', None]
+VENDORS = ['(주)가나상사', '다라물산', '마바전자(주)', 'ABC Corp', '국민은행', '신한카드', None]
+
+def ledger_rows(rng, rows, year=2024, company='(주)샘플컴퍼니'):
+    """시트 하나의 행 목록 - 데이터 행이 rows개가 되도록 12개월에 나눠 배치"""
+    yield [None, None, None, '계   정   별   원   장']
+    yield [None, None, None, f'{year}년 1월 1일 부터 {year}년 12월 31일 까지']
+    yield [f'회사명: {company}', None, None, None, None, None, '단위 : 원']
+    yield list(HEADERS)
+    yield [None, '전기이월', None, None, 0, 0, 0]
+
+    balance = 0
+    cumulative_debit = cumulative_credit = 0
+    per_month = [rows // 12 + (1 if m < rows % 12 else 0) for m in range(12)]
+    for month, count in enumerate(per_month, 1):
+        monthly_debit = monthly_credit = 0
+        for day in sorted(rng.randint(1, 28) for _ in range(count)):
+            debit = rng.randint(1, 5000) * 100 if rng.random() < 0.5 else 0
+            credit = 0 if debit else rng.randint(1, 5000) * 100
+            balance += debit - credit
+            monthly_debit += debit
+            monthly_credit += credit
+            code = rng.choice([f'{rng.randint(100, 999):05d}', rng.randint(100, 999), None])
+            yield [f'{year}-{month:02d}-{day:02d}', rng.choice(MEMOS), code, rng.choice(VENDORS),
+                   debit or None, credit or None, balance]
+        cumulative_debit += monthly_debit
+        cumulative_credit += monthly_credit
+        yield [None, '[ 월         계 ]', None, None, monthly_debit, monthly_credit, None]
+        yield [None, '[ 누         계 ]', None, None, cumulative_debit, cumulative_credit, None]
+
+def generate_ledger(path, sheets=5, rows=2000, seed=0):
+    """sheets개 시트, 시트당 데이터 rows행인 합성 원장을 path(.xlsx)에 저장하고 path 반환"""
+    rng = random.Random(seed)
+    wb = Workbook(write_only=True)
+    for index in range(sheets):
+        # 첫 시트는 열 너비 기준이 되는 'bank deposits'
+        account = 'bank deposits' if index == 0 else ACCOUNTS[index % len(ACCOUNTS)]
+        ws = wb.create_sheet(title=f'{index + 1}_{account}'[:31])
+        for row in ledger_rows(rng, rows):
+            ws.append(row)
+    wb.save(path)
+    return path
+
+def main():
+    parser = argparse.ArgumentParser(description="더존 계정별원장 형식의 합성 엑셀을 만듭니다.")
+    parser.add_argument('output')
+    parser.add_argument('--sheets', type=int, default=5)
+    parser.add_argument('--rows', type=int, default=2000, help="시트당 데이터 행 수")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    generate_ledger(args.output, args.sheets, args.rows, args.seed)
+    print(f"✅ {args.output}: {args.sheets}개 시트 x {args.rows}행")
+
+if __name__ == '__main__':
+    main()
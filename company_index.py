@@ -0,0 +1,122 @@
+import heapq
+import json
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# --- 회사명 검색 색인 ---
+
+def _normalize(text):
+    return str(text).strip().lower()
+
+def _grams(text, size):
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+def load_company_map(path):
+    """JSON 파일 {한글 회사명: [영문명, ...]} 읽기 - 영문명이 문자열 하나여도 허용"""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError(f"회사명 매핑은 객체여야 합니다: {path}")
+    return {str(kr): [en] if isinstance(en, str) else list(en) for kr, en in data.items()}
+
+class CompanyIndex:
+    """한글/영문 회사명 부분일치 검색용 n-gram 역색인
+
+    회사명마다 음절 1-gram/2-gram을 색인해 두고, 질의의 gram 목록이 모두 들어 있는
+    후보만 실제 포함 여부를 확인함. path를 주면 파일이 바뀔 때 다시 읽어 색인을 교체함.
+    """
+
+    def __init__(self, mapping=None, path=None, reload_interval=2.0):
+        self.path = path
+        self.reload_interval = reload_interval
+        self._mtime = None
+        self._checked = 0.0
+        self._lock = threading.Lock()
+        if path is not None:
+            mapping = load_company_map(path)
+            self._mtime = os.path.getmtime(path)
+        self._state = self._build(mapping or {})
+
+    @property
+    def mapping(self):
+        return self._state[0]
+
+    def _build(self, mapping):
+        entries = []
+        postings = {}
+        for entry_id, (kr_name, en_names) in enumerate(mapping.items()):
+            keys = [_normalize(name) for name in [kr_name, *en_names]]
+            # 한글명/영문명을 구분자로 이어 붙여 포함 여부를 find 한 번으로 확인
+            entries.append((kr_name, list(en_names), '\0'.join(keys), len(keys[0]), len(kr_name)))
+            grams = set()
+            for key in keys:
+                grams |= _grams(key, 1) | _grams(key, 2)
+            for gram in grams:
+                postings.setdefault(gram, []).append(entry_id)
+        return dict(mapping), entries, postings
+
+    def reload_if_changed(self):
+        """매핑 파일의 수정 시각이 바뀌었으면 새 색인을 만들어 교체 (reload_interval마다 한 번 확인)"""
+        if self.path is None:
+            return False
+        now = time.monotonic()
+        if now - self._checked < self.reload_interval:
+            return False
+        with self._lock:
+            self._checked = now
+            try:
+                mtime = os.path.getmtime(self.path)
+                if mtime == self._mtime:
+                    return False
+                state = self._build(load_company_map(self.path))
+            except (OSError, ValueError) as e:
+                # 편집 중인 파일 등은 기존 색인을 그대로 사용
+                logger.warning("⚠️ 회사명 매핑 다시 읽기 실패: %s", e)
+                return False
+            self._state = state
+            self._mtime = mtime
+            return True
+
+    def search(self, query, limit=20):
+        """query를 포함하는 회사 [{'kr': 한글명, 'en': [영문명, ...]}] - 일치 위치가 앞설수록 먼저"""
+        self.reload_if_changed()
+        query = _normalize(query)
+        if not query:
+            return []
+
+        _, entries, postings = self._state
+        size = min(2, len(query))
+        candidates = None
+        for gram in sorted(_grams(query, size), key=lambda g: len(postings.get(g, ()))):
+            ids = postings.get(gram)
+            if not ids:
+                return []
+            candidates = set(ids) if candidates is None else candidates.intersection(ids)
+            if not candidates:
+                return []
+
+        ranked = []
+        for entry_id in candidates:
+            _, _, joined, kr_length, name_length = entries[entry_id]
+            pos = joined.find(query)
+            if pos < 0:
+                continue
+            # 한글명 일치 (정확히 → 앞부분 → 앞쪽 위치) → 영문명 일치 → 짧은 이름 순
+            if pos < kr_length:
+                rank = (0, 0 if kr_length == len(query) else 1, pos)
+            else:
+                key_start = joined.rfind('\0', 0, pos) + 1
+                key_end = joined.find('\0', pos)
+                key_length = (key_end if key_end >= 0 else len(joined)) - key_start
+                rank = (1, 0 if key_length == len(query) else 1, pos - key_start)
+            ranked.append((rank, name_length, entry_id))
+
+        if limit is not None:
+            ranked = heapq.nsmallest(limit, ranked)
+        else:
+            ranked.sort()
+        return [{'kr': entries[entry_id][0], 'en': entries[entry_id][1]} for _, _, entry_id in ranked]
@@ -1,14 +1,111 @@
+import numpy as np
 import pandas as pd
+import hashlib
+import io
+import logging
 import os
+import pickle
 import re
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from itertools import chain, islice
 from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import TIME_TYPES, get_time_format
+from openpyxl.styles import Font, Alignment, Border, Side, PatternFill, NamedStyle
 import warnings
+from metrics import METRICS, PipelineMetrics
+from sheet_cache import SheetCache
+from exporters import EXPORTERS, check_output_format
+from glossary import TermMatcher, default_glossary, load_glossary
+from xlsx_writer import XlsxSheet, XlsxWriter
 
 warnings.filterwarnings('ignore')
 
+logger = logging.getLogger(__name__)
+
+# 같은 입력에서 변환 결과(값/서식)가 달라지는 변경이면 올림 - 결과 캐시 키에 포함됨
+CONVERTER_VERSION = '1.0'
+
+def result_version(glossary=None):
+    """저장된 변환 결과를 재사용할지 판단하는 버전 - 변환기 버전 + 용어집 버전/내용 해시
+
+    용어집은 재배포 없이 바뀔 수 있으므로 결과 캐시/일괄 변환 기록은 이 값으로 비교.
+    """
+    return f"{CONVERTER_VERSION}+{(glossary or default_glossary()).fingerprint}"
+
 # --- 유틸리티 함수 ---
 
+DATE_PERIOD_PATTERN = re.compile(r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일\s*(?:부터|~|-)\s*(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일\s*(?:까지|)')
+SINGLE_DATE_PATTERN = re.compile(r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일')
+GENERAL_LEDGER_PATTERN = re.compile(r'계정.*원장|원장.*계정')
+MONTHLY_TOTAL_PATTERN = re.compile(r'\[\s*월\s*계\s*\]')
+CUMULATIVE_TOTAL_PATTERN = re.compile(r'\[\s*누\s*계\s*\]')
+CURRENCY_PATTERN = re.compile(r'^-?\d*\.?\d+$')
+
+# 더존 날짜 열에 나오는 형식 - (이름, 전체 일치 정규식, strptime 형식, 검증용 샘플)
+# 형식이 None이면 범용 해석(pd.to_datetime)으로도 날짜가 되지 않아 원본 그대로 두는 형태
+# 검증용 샘플에는 정규식에 걸리면 안 되는 값도 넣음 (걸리면 범용 해석과 달라 그 형식을 쓰지 않게 됨)
+DATE_FORMATS = (
+    ('iso', re.compile(r'\d{4}-\d{1,2}-\d{1,2}'), '%Y-%m-%d', ('2024-01-15', '2024-1-5', '1999-12-31')),
+    ('dotted', re.compile(r'\d{4}\.\d{1,2}\.\d{1,2}'), '%Y.%m.%d', ('2024.01.15', '2024.1.5', '1999.12.31')),
+    ('datetime', re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}'), '%Y-%m-%d %H:%M:%S',
+     ('2024-01-15 00:00:00', '2024-01-15 13:45:10')),
+    ('month_day', re.compile(r'(?:0?[1-9]|1[0-2])-(?:0?[1-9]|[12]\d|3[01])'), None, ('01-15', '1-5', '12-31', '02-30')),
+    # 0으로 시작하는 5자리('01121', '00112')는 범용 해석이 연도(1121년, 112년)로 읽으므로 제외
+    ('excel_serial', re.compile(r'[1-9]\d{4}(?:\.0+)?'), None,
+     ('45000', '45000.0', '44927', '01121', '00112', '01121.0')),
+)
+
+def _parse_date_generic(date_text):
+    """형식 추론 기반 범용 해석 - 'YYYY-MM-DD' 또는 None"""
+    try:
+        date_obj = pd.to_datetime(date_text, errors='coerce')
+        if pd.notna(date_obj):
+            return date_obj.strftime('%Y-%m-%d')
+    except (ValueError, TypeError):
+        pass
+    return None
+
+def _parse_date_fixed(date_text, date_format):
+    """고정 형식 해석 - pandas Timestamp 범위를 벗어나면 범용 해석에 맡기도록 None"""
+    if date_format is None:
+        return None
+    try:
+        date_obj = datetime.strptime(date_text, date_format)
+    except ValueError:
+        return None
+    if not (pd.Timestamp.min <= date_obj <= pd.Timestamp.max):
+        return None
+    return date_obj.strftime('%Y-%m-%d')
+
+@lru_cache(maxsize=None)
+def fast_date_formats():
+    """설치된 pandas의 범용 해석과 결과가 같은 빠른 형식만 사용 (버전별 차이 대비, 프로세스당 1회 확인)"""
+    return tuple(
+        (name, pattern, date_format)
+        for name, pattern, date_format, probes in DATE_FORMATS
+        if all(_parse_date_fixed(p, date_format) == _parse_date_generic(p) for p in probes if pattern.fullmatch(p))
+    )
+
+def detect_date_format(values, sample_size=50):
+    """샘플에서 가장 많이 맞는 날짜 형식 (없으면 None)"""
+    sample = values[:sample_size]
+    best, best_count = None, 0
+    for date_format in fast_date_formats():
+        count = sum(1 for value in sample if date_format[1].fullmatch(value))
+        if count > best_count:
+            best, best_count = date_format, count
+    return best
+
+def _format_korean_date(year, month, day):
+    return f"{year}.{month.zfill(2)}.{day.zfill(2)}"
+
 def translate_korean_date_period(text):
     """한글 날짜 기간을 숫자 형식으로 변환"""
     if pd.isna(text) or text is None:
@@ -17,28 +114,39 @@ def translate_korean_date_period(text):
     text_str = str(text).strip()
 
     try:
-        pattern = r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일\s*(?:부터|~|-)\s*(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일\s*(?:까지|)'
-        match = re.search(pattern, text_str)
+        match = DATE_PERIOD_PATTERN.search(text_str)
 
         if match:
             start_year, start_month, start_day, end_year, end_month, end_day = match.groups()
-            start_date = f"{start_year}.{start_month.zfill(2)}.{start_day.zfill(2)}"
-            end_date = f"{end_year}.{end_month.zfill(2)}.{end_day.zfill(2)}"
+            start_date = _format_korean_date(start_year, start_month, start_day)
+            end_date = _format_korean_date(end_year, end_month, end_day)
             return f"{start_date} - {end_date}"
 
-        single_pattern = r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일'
-        single_match = re.search(single_pattern, text_str)
+        single_match = SINGLE_DATE_PATTERN.search(text_str)
 
         if single_match:
-            year, month, day = single_match.groups()
-            converted_date = f"{year}.{month.zfill(2)}.{day.zfill(2)}"
-            return re.sub(single_pattern, converted_date, text_str)
+            converted_date = _format_korean_date(*single_match.groups())
+            return SINGLE_DATE_PATTERN.sub(converted_date, text_str)
 
         return text_str
 
     except (ValueError, TypeError):
         return text_str
 
+TOTAL_KEYWORDS = (
+    'total', 'subtotal', 'sum', 'balance', 'carry forward', '계', '합계', '소계',
+    '누계', '월계', '총계', '잔액', '이월', '전기이월', '당기이월', '기말잔액',
+    'beginning balance', 'monthly total', 'cumulative total', 'ending balance'
+)
+
+def _compile_keyword_pattern(keywords):
+    """키워드 중 하나라도 포함되는지 한 번에 검사하는 정규식"""
+    # 다른 키워드를 포함하는 키워드('합계' ⊃ '계')는 결과에 영향이 없으므로 제외
+    minimal = [k for k in keywords if not any(other != k and other in k for other in keywords)]
+    return re.compile('|'.join(re.escape(k) for k in sorted(minimal, key=len, reverse=True)))
+
+TOTAL_ROW_PATTERN = _compile_keyword_pattern(TOTAL_KEYWORDS)
+
 def is_total_row(row_data):
     """합계 행인지 확인"""
     if not row_data or len(row_data) < 2:
@@ -52,35 +160,442 @@ def is_total_row(row_data):
     if not description:
         return False
 
-    total_keywords = [
-        'total', 'subtotal', 'sum', 'balance', 'carry forward', '계', '합계', '소계',
-        '누계', '월계', '총계', '잔액', '이월', '전기이월', '당기이월', '기말잔액',
-        'beginning balance', 'monthly total', 'cumulative total', 'ending balance'
-    ]
+    return TOTAL_ROW_PATTERN.search(description) is not None
+
+def collect_total_blocks(flags, first_row, total_blocks):
+    """행별 합계 여부(flags)에서 연속 구간 (시작 행, 끝 행)을 total_blocks에 추가"""
+    flags = np.asarray(flags, dtype=bool)
+    if not flags.any():
+        return
+    edges = np.diff(np.concatenate(([False], flags, [False])).astype(np.int8))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1) - 1
+    blocks = [(first_row + int(s), first_row + int(e)) for s, e in zip(starts, ends)]
+    # 앞 chunk 끝의 합계 구간과 바로 이어지면 하나로 합침
+    if total_blocks and total_blocks[-1][1] + 1 == blocks[0][0]:
+        blocks[0] = (total_blocks.pop()[0], blocks[0][1])
+    total_blocks.extend(blocks)
+
+def _overlaps(left, right):
+    """left 뒤쪽과 right 앞쪽이 겹칠 수 있는지 (left 안에서 시작해 밖으로 이어지는 경우)"""
+    return any(right.startswith(left[i:]) for i in range(1, len(left)))
+
+def _is_order_independent(keys, translations):
+    """사전 순서대로 str.replace 하는 것과 최장 일치 1회 치환의 결과가 항상 같은지 확인"""
+    for j, later in enumerate(keys):
+        for earlier in keys[:j]:
+            # 앞선 키가 뒤 키의 일부이거나, 뒤 키가 왼쪽에서 앞선 키와 겹치면 순서가 결과를 바꿈
+            if earlier in later or _overlaps(later, earlier):
+                return False
+    for value in translations.values():
+        if not value:
+            return False
+        for key in keys:
+            # 치환 결과가 새 키를 만들어 연쇄 치환되는 경우
+            if key in value or value in key or _overlaps(value, key) or _overlaps(key, value):
+                return False
+    return True
+
+class TranslationEngine:
+    """translate_text용 번역기 - 정규식과 치환 사전(trie)을 한 번만 컴파일
+
+    matcher를 주면 (용어집에서 컴파일된 TermMatcher) 순서 검사 없이 최장 일치 1회 치환.
+    """
+
+    def __init__(self, translations, matcher=None):
+        self.translations = dict(translations)
+        # 계정별원장/월계/누계 정규식에 걸리는 키는 치환 단계까지 오지 않으므로 제외
+        early_patterns = (GENERAL_LEDGER_PATTERN, MONTHLY_TOTAL_PATTERN, CUMULATIVE_TOTAL_PATTERN)
+        self.replace_keys = [k for k in self.translations if not any(p.search(k) for p in early_patterns)]
+        if matcher is not None:
+            # 용어집은 최장 일치가 정의 - 용어 수천 개에 O(n²) 순서 검사를 하지 않음
+            # (제외 대상 키가 matcher에 남아 있어도 그 키를 포함한 문자열은 앞 단계에서 끝나므로 결과 같음)
+            self.single_pass = True
+        else:
+            self.single_pass = _is_order_independent(self.replace_keys, self.translations)
+            matcher = TermMatcher({k: self.translations[k] for k in self.replace_keys})
+        self.matcher = matcher if len(matcher) else None
+
+    def translate(self, text):
+        """공백 제거된 문자열을 번역 (빈 문자열/결측값 처리는 호출 측)"""
+        text = translate_korean_date_period(text)
+
+        if GENERAL_LEDGER_PATTERN.search(text):
+            return 'General Ledger'
+        if MONTHLY_TOTAL_PATTERN.search(text):
+            return 'Monthly total'
+        if CUMULATIVE_TOTAL_PATTERN.search(text):
+            return 'Cumulative total'
+
+        if text in self.translations:
+            return self.translations[text]
+
+        return self.replace(text)
+
+    def replace(self, text):
+        """사전 키를 영문으로 치환 - 순서 무관하면 최장 일치 1회, 아니면 사전 순서대로"""
+        if self.matcher is None:
+            return text
+        if self.single_pass:
+            return self.matcher.sub(text)
+        if not self.matcher.contains(text):
+            return text
+        for korean in self.replace_keys:
+            if korean in text:
+                text = text.replace(korean, self.translations[korean])
+        return text
+
+    def replace_series(self, text):
+        """replace의 Series 버전"""
+        if self.matcher is None:
+            return text
+        if self.single_pass:
+            return text.map(self.matcher.sub)
+        for korean in self.replace_keys:
+            text = text.str.replace(korean, self.translations[korean], regex=False)
+        return text
+
+@lru_cache(maxsize=16)
+def _cached_translator(items):
+    return TranslationEngine(dict(items))
+
+def shared_translator(translations):
+    """같은 번역 사전을 쓰는 변환기끼리 TranslationEngine을 한 번만 만들어 공유 (만든 뒤에는 읽기만 함)"""
+    return _cached_translator(tuple(translations.items()))
 
-    return any(keyword in description for keyword in total_keywords)
+@lru_cache(maxsize=16)
+def glossary_translator(glossary):
+    """용어집의 컴파일된 matcher를 쓰는 TranslationEngine - 용어집마다 한 번만 만들어 공유"""
+    return TranslationEngine(glossary.translations, matcher=glossary.matcher)
+
+_MISSING = object()
+
+def _cache_key(value):
+    """타입까지 구분하는 캐시 키 (1, 1.0, True가 섞이지 않도록) - 캐시 불가면 None"""
+    if isinstance(value, float) and value != value:
+        return None
+    key = (type(value), value)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+class LRUCache:
+    """크기 제한 LRU 캐시 - 스레드 안전, 적중/미스 횟수 기록"""
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_compute(self, key, compute, *args):
+        if key is None or self.maxsize <= 0:
+            return compute(*args)
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute(*args)
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._data), 'maxsize': self.maxsize}
+
+class ConversionCache:
+    """번역/날짜/금액 변환 결과 캐시 묶음 - 여러 변환기(요청)가 공유할 수 있음
+
+    같은 번역 사전을 쓰는 변환기끼리만 공유해야 함.
+    """
+
+    def __init__(self, maxsize=4096):
+        self.translations = LRUCache(maxsize)
+        self.dates = LRUCache(maxsize)
+        self.currency = LRUCache(maxsize)
+
+    def clear(self):
+        for cache in (self.translations, self.dates, self.currency):
+            cache.clear()
+
+    def stats(self):
+        return {
+            'translations': self.translations.info(),
+            'dates': self.dates.info(),
+            'currency': self.currency.info(),
+        }
+
+# xlsx 저장 방식 - openpyxl 워크북 저장(기준) / xlsx_writer.XlsxWriter로 시트 XML 직접 쓰기
+XLSX_WRITERS = ('openpyxl', 'xml')
+
+# 셀 스타일 키 - 표시 형식이 정해진 정렬 종류(금액/코드 텍스트)와 날짜 값용 표시 형식 표시자
+FIXED_FORMAT_STYLES = ('right-money', 'center-text')
+STYLE_NUMBER_FORMAT = 'number-format'
+
+# --- 입력 읽기 ---
+
+# chunk 모드(memory_budget) 행 수 추정 - 읽은 행 튜플, 열 Series, 변환 결과, 쓰기용 셀을 합친 셀 하나의 대략적 바이트
+CHUNK_CELL_BYTES = 256
+MIN_CHUNK_ROWS = 256
+
+# pd.read_excel이 결측값(NaN)으로 읽는 문자열 (pandas 기본 na_values)
+NA_STRINGS = frozenset({
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+})
+
+def _normalize_cell(value):
+    """셀 값을 pd.read_excel(header=None)과 같은 형태로 - 빈 셀/결측 문자열은 NaN, 정수 실수는 int"""
+    if value is None:
+        return np.nan
+    if isinstance(value, str):
+        return np.nan if value in NA_STRINGS else value
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else value
+    return value
+
+def _pad_rows(rows):
+    """끝쪽 빈 행을 버리고 모든 행을 가장 긴 행 길이에 맞춰 NaN으로 채움"""
+    while rows and not rows[-1]:
+        rows.pop()
+    width = max((len(row) for row in rows), default=0)
+    return [row + (np.nan,) * (width - len(row)) for row in rows]
+
+def _trim_row(values):
+    """행 끝쪽의 빈 셀 제거"""
+    end = len(values)
+    while end and (values[end - 1] is None or values[end - 1] == ''):
+        end -= 1
+    return values[:end]
+
+def _pad_row(row, width):
+    """행 하나를 width 길이까지 NaN으로 채움"""
+    if len(row) >= width:
+        return row
+    return tuple(row) + (np.nan,) * (width - len(row))
+
+def _read_spilled(spill):
+    """pickle.dump로 이어 쓴 chunk들을 다시 읽어 행을 하나씩 내보냄"""
+    while True:
+        try:
+            chunk = pickle.load(spill)
+        except EOFError:
+            return
+        yield from chunk
+
+def _row_digest(rows, checkpoint=None):
+    """행 튜플 목록의 누적 sha256 - (전체 해시, 앞 checkpoint행까지의 해시 또는 None)"""
+    digest = hashlib.sha256()
+    prefix = None
+    for index, row in enumerate(rows):
+        if index == checkpoint:
+            prefix = digest.hexdigest()
+        digest.update(repr(row).encode('utf-8'))
+        digest.update(b'\n')
+    full = digest.hexdigest()
+    if checkpoint == len(rows):
+        prefix = full
+    return full, prefix
+
+XLS_SIGNATURE = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+
+def _file_size(file):
+    """경로/스트림의 바이트 수 (알 수 없으면 0)"""
+    try:
+        if is_file_object(file):
+            position = file.tell()
+            size = file.seek(0, os.SEEK_END)
+            file.seek(position)
+            return size
+        return os.path.getsize(file)
+    except (OSError, ValueError):
+        return 0
+
+def is_file_object(file):
+    """경로가 아니라 read/write 가능한 파일 객체인지"""
+    return hasattr(file, 'read') or hasattr(file, 'write')
+
+def file_label(file):
+    """로그용 파일 이름 - 이름 없는 메모리 스트림이면 '<stream>'"""
+    if is_file_object(file):
+        name = getattr(file, 'name', None)
+        return name if isinstance(name, str) else '<stream>'
+    return file
+
+def _is_xls(input_file):
+    """.xls(BIFF/OLE2) 입력인지 - 경로/스트림 모두 확장자가 아니라 파일 시그니처로 판단 (pd.ExcelFile과 같음)"""
+    if not is_file_object(input_file):
+        with open(input_file, 'rb') as f:
+            return f.read(len(XLS_SIGNATURE)) == XLS_SIGNATURE
+    position = input_file.tell()
+    signature = input_file.read(len(XLS_SIGNATURE))
+    input_file.seek(position)
+    return signature == XLS_SIGNATURE
+
+class WorkbookReader:
+    """입력 워크북을 한 번만 열고 시트별 행을 튜플 리스트로 읽음 (DataFrame을 만들지 않음)
+
+    .xlsx는 openpyxl read_only, .xls는 xlrd로 읽으며 값은 pd.read_excel(header=None)과 같게 맞춤.
+    input_file은 경로 또는 seek 가능한 바이너리 스트림.
+    """
+
+    def __init__(self, input_file):
+        self.input_file = input_file
+        self._book = None
+        self._handle = None
+        self._xls = _is_xls(input_file)
+        if self._xls:
+            import xlrd
+            if is_file_object(input_file):
+                self._book = xlrd.open_workbook(file_contents=input_file.read(), on_demand=True)
+            else:
+                self._book = xlrd.open_workbook(input_file, on_demand=True)
+            self.sheet_names = self._book.sheet_names()
+        else:
+            from openpyxl import load_workbook
+            from openpyxl.reader.excel import SUPPORTED_FORMATS
+            source = input_file
+            if not is_file_object(input_file) and not str(input_file).lower().endswith(SUPPORTED_FORMATS):
+                # openpyxl은 경로를 확장자로 거부함 - 내용이 xlsx면 이름이 .xls여도 열리도록 파일 객체로 넘김
+                source = self._handle = open(input_file, 'rb')
+            self._book = load_workbook(source, read_only=True, data_only=True)
+            self.sheet_names = self._book.sheetnames
+
+    def read_rows(self, sheet_name):
+        return _pad_rows(list(self.iter_rows(sheet_name)))
+
+    def iter_rows(self, sheet_name):
+        """행을 하나씩 내보내는 제너레이터 - read_rows와 달리 끝쪽 빈 셀은 잘린 채, 길이를 맞추지 않음"""
+        if self._xls:
+            yield from self._iter_xls_rows(sheet_name)
+            return
+        ws = self._book[sheet_name]
+        # 일부 프로그램이 만든 파일은 dimension 정보가 틀려 행이 잘리므로 다시 계산
+        ws.reset_dimensions()
+        for values in ws.iter_rows(values_only=True):
+            yield tuple(_normalize_cell(v) for v in _trim_row(values))
+
+    def _iter_xls_rows(self, sheet_name):
+        # xlrd는 시트 전체를 한 번에 읽음 - .xls는 최대 65536행이라 시트 크기가 제한됨
+        sheet = self._book.sheet_by_name(sheet_name)
+        try:
+            for i in range(sheet.nrows):
+                values = [self._xls_cell(cell) for cell in sheet.row(i)]
+                yield tuple(_normalize_cell(v) for v in _trim_row(values))
+        finally:
+            self._book.unload_sheet(sheet_name)
+
+    def _xls_cell(self, cell):
+        """xlrd 셀 → 파이썬 값 (pandas의 xlrd 변환 규칙과 동일)"""
+        import xlrd
+        if cell.ctype in (xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK, xlrd.XL_CELL_ERROR):
+            return None
+        if cell.ctype == xlrd.XL_CELL_BOOLEAN:
+            return bool(cell.value)
+        if cell.ctype == xlrd.XL_CELL_DATE:
+            try:
+                value = xlrd.xldate.xldate_as_datetime(cell.value, self._book.datemode)
+            except (ValueError, OverflowError):
+                return cell.value
+            # 날짜 없이 시각만 있는 셀
+            if value.timetuple()[0:3] in ((1899, 12, 31), (1900, 1, 1)):
+                return value.time()
+            return value
+        return cell.value
+
+    def close(self):
+        if self._book is None:
+            return
+        if self._xls:
+            self._book.release_resources()
+        else:
+            self._book.close()
+        self._book = None
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
 # --- 메인 변환기 클래스 ---
 
 class DouzoneConverter:
-    def __init__(self):
-        self.columns = {
-            '날짜': 'Date', '적    요    란': 'Description', '코드': 'Code',
-            '거래처': 'Customer/Vendor', '차   변': 'Debit', '대   변': 'Credit',
-            '잔   액': 'Balance'
-        }
-        self.translations = {
-            '전기이월': 'Beginning Balance', '월계': 'Monthly total', '누계': 'Cumulative total',
-            '계   정   별   원   장': 'General Ledger', '계정별원장': 'General Ledger',
-            '계정 별 원장': 'General Ledger', '계 정 별 원 장': 'General Ledger',
-            '총계정원장': 'General Ledger', 
-            '회사명:': 'Company Name : ', '계정과목': 'Account', '이월결손금': 'Accumulated Deficit',
-            '[ 월         계 ]': 'Monthly total', '[ 누         계 ]': 'Cumulative total',
-            '[월계]': 'Monthly total', '[누계]': 'Cumulative total'
-        }
+    def __init__(self, vectorized=True, streaming=False, cache=None, cache_size=4096, workers=1,
+                 columns=None, translations=None, fast_reader=True, metrics=None, memory_budget=None,
+                 sheet_cache=None, glossary=None, writer='openpyxl'):
+        # 머리글/번역 사전 기본값은 용어집(data/glossary.json 또는 GLOSSARY_FILE)에서 - 경로를 줘도 됨
+        if glossary is None:
+            glossary = default_glossary()
+        elif isinstance(glossary, str):
+            glossary = load_glossary(glossary)
+        self.glossary = glossary
+        self.columns = columns if columns is not None else dict(glossary.columns)
+        # 직접 준 사전은 기존처럼 사전 순서 치환 규칙을 따름
+        self.custom_translations = translations is not None
+        if self.custom_translations:
+            self.translations = translations
+            self.translator = shared_translator(self.translations)
+        else:
+            self.translations = dict(glossary.translations)
+            self.translator = glossary_translator(glossary)
         self.setup_styles()
         # ✅ 여기에 추가
         self.reference_col_widths = {}
+        # 데이터 행을 열 단위(Series)로 일괄 처리 - False면 기존 행 단위 처리
+        self.vectorized = vectorized
+        # write-only 워크북에 행을 내보내면서 서식 지정 - 셀 객체를 메모리에 쌓지 않음
+        self.streaming = streaming
+        # 같은 적요/날짜/금액 문자열 반복 변환 방지 - cache_size=0이면 사용 안 함
+        self.cache = cache if cache is not None else ConversionCache(cache_size)
+        self.cache_size = cache_size
+        # 2 이상이면 시트 읽기/변환을 프로세스 풀에서 병렬 처리 (서식/저장은 시트 순서대로 본 프로세스에서)
+        self.workers = workers
+        # 시트를 DataFrame 없이 행 튜플로 읽음 (openpyxl read_only / xlrd) - False면 pd.read_excel
+        self.fast_reader = fast_reader
+        # 단계별 소요 시간/행 수/바이트 집계 - 기본은 프로세스 전역 METRICS (/metrics 노출)
+        self.metrics = metrics if metrics is not None else METRICS
+        # 시트 하나를 변환하는 동안 행 데이터가 차지할 메모리 상한(바이트) - 지정하면 시트 크기와 상관없이
+        # chunk 단위로 읽기/변환/쓰기 (write-only 워크북으로 저장, workers는 쓰지 않음)
+        self.memory_budget = memory_budget
+        # 증분 변환 - SheetCache(또는 그 폴더 경로)를 주면 입력 행이 같은 시트는 이전 결과를 재사용하고,
+        # 행이 뒤에 붙기만 한 시트는 붙은 행만 변환 (memory_budget chunk 모드에는 적용 안 됨)
+        if isinstance(sheet_cache, str):
+            sheet_cache = SheetCache(sheet_cache)
+        self.sheet_cache = sheet_cache
+        # xlsx 저장 방식 - 'openpyxl'(기준) 또는 'xml'(시트 XML을 zip에 바로 씀, 결과는 같음)
+        if writer not in XLSX_WRITERS:
+            raise ValueError(f"지원하지 않는 저장 방식: {writer}")
+        self.writer = writer
 
     def setup_styles(self):
         """스타일 관련 설정을 미리 정의"""
@@ -104,8 +619,19 @@ class DouzoneConverter:
         self.header_fill = PatternFill(start_color='D9E2F3', end_color='D9E2F3', fill_type='solid')
         # 첫 번째 행 배경색 제거 - title_fill 삭제하고 None으로 설정
         self.title_fill = None
+        # 워크북별로 등록한 NamedStyle 이름 {스타일 키: 이름}
+        self._workbook_styles = weakref.WeakKeyDictionary()
 
     def translate_text(self, text):
+        return self.cache.translations.get_or_compute(_cache_key(text), self._translate_text, text)
+
+    def standardize_date(self, date_str):
+        return self.cache.dates.get_or_compute(_cache_key(date_str), self._standardize_date, date_str)
+
+    def format_currency(self, value):
+        return self.cache.currency.get_or_compute(_cache_key(value), self._format_currency, value)
+
+    def _translate_text(self, text):
         if pd.isna(text) or text is None:
             return text
 
@@ -114,27 +640,11 @@ class DouzoneConverter:
             if not text:
                 return text
 
-            text = translate_korean_date_period(text)
-
-            if re.search(r'계정.*원장|원장.*계정', text):
-                return 'General Ledger'
-            if re.search(r'\[\s*월\s*계\s*\]', text):
-                return 'Monthly total'
-            if re.search(r'\[\s*누\s*계\s*\]', text):
-                return 'Cumulative total'
-
-            if text in self.translations:
-                return self.translations[text]
-
-            for korean, english in self.translations.items():
-                if korean in text:
-                    text = text.replace(korean, english)
-
-            return text
+            return self.translator.translate(text)
         except (ValueError, TypeError):
             return str(text) if text is not None else ""
 
-    def standardize_date(self, date_str):
+    def _standardize_date(self, date_str):
         if pd.isna(date_str) or date_str is None:
             return date_str
 
@@ -143,15 +653,27 @@ class DouzoneConverter:
             if not date_text:
                 return date_str
 
-            date_obj = pd.to_datetime(date_text, errors='coerce')
-            if pd.notna(date_obj):
-                return date_obj.strftime('%Y-%m-%d')
+            parsed = self._parse_date_text(date_text)
+            if parsed is not None:
+                return parsed
         except (ValueError, TypeError):
             pass
 
         return date_str
 
-    def format_currency(self, value):
+    def _parse_date_text(self, date_text):
+        """공백 제거된 날짜 문자열 → 'YYYY-MM-DD' (해석 불가면 None)"""
+        for _, pattern, date_format in fast_date_formats():
+            if pattern.fullmatch(date_text):
+                if date_format is None:
+                    return None
+                parsed = _parse_date_fixed(date_text, date_format)
+                if parsed is not None:
+                    return parsed
+                break
+        return _parse_date_generic(date_text)
+
+    def _format_currency(self, value):
         if pd.isna(value) or value is None:
             return value
 
@@ -161,7 +683,7 @@ class DouzoneConverter:
 
             cleaned_value = str(value).replace(',', '').replace(' ', '')
 
-            if not re.match(r'^-?\d*\.?\d+$', cleaned_value):
+            if not CURRENCY_PATTERN.match(cleaned_value):
                 return value
 
             num_value = float(cleaned_value)
@@ -179,24 +701,36 @@ class DouzoneConverter:
         name = name.strip()
         return self.translate_text(name)
 
-    def process_sheet(self, df, sheet_name):
-        if df.empty or len(df) < 4:
+    def process_sheet(self, rows, sheet_name, total_blocks=None):
+        """시트 변환 - rows는 WorkbookReader.read_rows의 행 튜플 리스트 (DataFrame도 가능)
+
+        total_blocks 리스트를 넘기면 합계 행 구간(시작 행, 끝 행)을 함께 채움
+        """
+        if isinstance(rows, pd.DataFrame):
+            rows = list(rows.itertuples(index=False, name=None))
+        if len(rows) < 4 or not rows[0]:
             return None
 
         ws_data = []
+        if total_blocks is None:
+            total_blocks = []
 
-        self._process_header_rows(df, ws_data)
-        self._process_data_rows(df, ws_data)
+        with self.metrics.stage('process_header_rows') as timer:
+            self._process_header_rows(rows, ws_data)
+            timer.rows = len(ws_data)
+        with self.metrics.stage('process_data_rows') as timer:
+            self._process_data_rows(rows, ws_data, total_blocks)
+            timer.rows = max(len(ws_data) - 4, 0)
 
         return ws_data
 
-    def _process_header_rows(self, df, ws_data):
+    def _process_header_rows(self, rows, ws_data):
         translation_positions = {0: [0, 1, 2], 1: [1, 2, 3], 2: [0, 6]}
 
         for i in range(3):
-            if i < len(df):
+            if i < len(rows):
                 try:
-                    row_values = df.iloc[i].values
+                    row_values = rows[i]
                     row = self._translate_header_row(i, row_values, translation_positions)
                     ws_data.append(row)
                 except IndexError:
@@ -209,9 +743,9 @@ class DouzoneConverter:
 
         if row_index == 0 and max_cols > 3 and pd.notna(row_values[3]):
             d1_content = str(row_values[3]).strip()
-            if re.search(r'계정.*원장|원장.*계정', d1_content) or d1_content in self.translations:
+            if GENERAL_LEDGER_PATTERN.search(d1_content) or d1_content in self.translations:
                 translated_title = self.translate_text(d1_content)
-                print(f"    🔍 D1 셀 원본: '{d1_content}' → A1으로 이동: '{translated_title}'")
+                logger.debug("    🔍 D1 셀 원본: '%s' → A1으로 이동: '%s'", d1_content, translated_title)
                 row.append(translated_title)
                 for j in range(1, max_cols):
                     row.append(None if j == 3 else row_values[j])
@@ -225,28 +759,52 @@ class DouzoneConverter:
                 row.append(cell)
         return row
 
-    def _process_data_rows(self, df, ws_data):
-        if len(df) <= 3:
+    def _process_data_rows(self, rows, ws_data, total_blocks):
+        if len(rows) <= 3:
             return
 
-        original_headers = df.iloc[3].values
-        english_headers = [self.columns.get(str(h).strip(), str(h)) for h in original_headers]
+        english_headers, layout = self._data_layout(rows[3])
         ws_data.append(english_headers)
 
+        first_row = len(ws_data) + 1
+        self._process_body(rows[4:], ws_data, layout, first_row, total_blocks)
+
+    def _data_layout(self, original_headers):
+        """4행 머리글 → (영문 머리글, (적요, 코드, 날짜 열 번호, 금액 열 번호 목록))"""
+        english_headers = [self.columns.get(str(h).strip(), str(h)) for h in original_headers]
+
         header_map = {header: idx for idx, header in enumerate(english_headers) if header}
         desc_idx = header_map.get('Description', -1)
         code_idx = header_map.get('Code', -1)
         date_idx = header_map.get('Date', -1)
         money_indices = [header_map.get(col, -1) for col in ['Debit', 'Credit', 'Balance'] if col in header_map]
+        return english_headers, (desc_idx, code_idx, date_idx, money_indices)
+
+    def _process_body(self, body, ws_data, layout, first_row, total_blocks):
+        """데이터 행(5행부터)을 변환해 ws_data에 추가하고 합계 행 구간을 total_blocks에 추가
+
+        first_row는 ws_data에 새로 추가되는 첫 행의 엑셀 행 번호
+        """
+        start = len(ws_data)
+        if self.vectorized:
+            self._process_data_columns(body, ws_data, *layout)
+            with self.metrics.stage('find_total_blocks') as timer:
+                timer.rows = len(ws_data) - start
+                collect_total_blocks(self._total_row_mask(ws_data[start:]), first_row, total_blocks)
+            return
 
-        for i in range(4, len(df)):
+        flags = []
+        for row_values in body:
             try:
-                row_values = df.iloc[i].values
-                row_data = self._process_single_data_row(row_values, desc_idx, code_idx, date_idx, money_indices)
+                row_data = self._process_single_data_row(row_values, *layout)
                 if any(pd.notna(x) and str(x).strip() for x in row_data if x is not None):
                     ws_data.append(row_data)
+                    flags.append(is_total_row(row_data))
             except IndexError:
                 continue
+        with self.metrics.stage('find_total_blocks') as timer:
+            timer.rows = len(flags)
+            collect_total_blocks(flags, first_row, total_blocks)
 
     def _process_single_data_row(self, row_values, desc_idx, code_idx, date_idx, money_indices):
         row_data = []
@@ -262,8 +820,188 @@ class DouzoneConverter:
             row_data.append(cell)
         return row_data
 
-    def apply_formatting(self, ws):
-        self._apply_general_formatting(ws)
+    def _process_data_columns(self, body, ws_data, desc_idx, code_idx, date_idx, money_indices):
+        """데이터 행을 열(Series) 단위로 일괄 변환 - _process_single_data_row와 동일한 결과"""
+        if not body:
+            return
+
+        columns = []
+        for j, values in enumerate(zip(*body)):
+            col = pd.Series(values, dtype=object)
+            if j == desc_idx:
+                col = self._translate_series(col)
+            elif j == code_idx:
+                col = self._strip_series(col)
+            elif j == date_idx:
+                col = self._standardize_date_series(col)
+            elif j in money_indices:
+                col = self._format_currency_series(col)
+            columns.append(col.to_numpy(dtype=object))
+
+        # 빈 행 제외: 값이 있고 공백이 아닌 셀이 하나라도 있어야 유지
+        keep = np.zeros(len(body), dtype=bool)
+        for values in columns:
+            series = pd.Series(values, dtype=object)
+            keep |= (series.notna() & series.astype(str).str.strip().ne('')).to_numpy()
+
+        ws_data.extend(np.column_stack(columns)[keep].tolist())
+
+    def _total_row_mask(self, rows):
+        """is_total_row의 열 단위 버전 - B열 값에 키워드 정규식을 한 번씩 적용"""
+        if not rows or len(rows[0]) < 2:
+            return np.zeros(len(rows), dtype=bool)
+        descriptions = pd.Series([row[1] for row in rows], dtype=object)
+        matches = descriptions.astype(str).str.lower().str.contains(TOTAL_ROW_PATTERN)
+        return (descriptions.notna() & matches).to_numpy(dtype=bool)
+
+    def _map_cached(self, text, cache, convert):
+        """문자열 Series의 고유값 중 캐시에 없는 것만 convert로 일괄 변환한 뒤 전체에 매핑"""
+        known = {}
+        missing = []
+        for value in pd.unique(text.to_numpy()):
+            cached = cache.get(('column', value), _MISSING)
+            if cached is _MISSING:
+                missing.append(value)
+            else:
+                known[value] = cached
+        if missing:
+            converted = convert(pd.Series(missing, dtype=object))
+            for value, result in zip(missing, converted.tolist()):
+                cache.put(('column', value), result)
+                known[value] = result
+        return text.map(known)
+
+    def _translate_series(self, col):
+        """translate_text의 열 단위 버전"""
+        result = col.copy()
+        present = col.notna()
+        if not present.any():
+            return result
+
+        text = col[present].astype(str).str.strip().astype(object)
+        translated = self._map_cached(text, self.cache.translations, self._translate_text_series)
+        result.loc[translated.index] = translated.to_numpy()
+        return result
+
+    def _translate_text_series(self, text):
+        """공백 제거된 문자열 Series 번역"""
+        text = text.copy()
+
+        # 한글 날짜 기간 → 숫자 형식 (translate_korean_date_period)
+        periods = text.str.extract(DATE_PERIOD_PATTERN)
+        has_period = periods[0].notna()
+        if has_period.any():
+            text[has_period] = [
+                f"{_format_korean_date(*groups[:3])} - {_format_korean_date(*groups[3:])}"
+                for groups in periods[has_period].itertuples(index=False)
+            ]
+        singles = text[~has_period].str.extract(SINGLE_DATE_PATTERN)
+        has_single = singles[0].notna()
+        if has_single.any():
+            index = singles.index[has_single]
+            text.loc[index] = [
+                SINGLE_DATE_PATTERN.sub(_format_korean_date(*groups), value)
+                for groups, value in zip(singles[has_single].itertuples(index=False), text[index])
+            ]
+
+        translated = self.translator.replace_series(text)
+
+        exact = text.map(self.translations)
+        has_exact = exact.notna()
+        translated[has_exact] = exact[has_exact]
+        translated[text.str.contains(CUMULATIVE_TOTAL_PATTERN)] = 'Cumulative total'
+        translated[text.str.contains(MONTHLY_TOTAL_PATTERN)] = 'Monthly total'
+        translated[text.str.contains(GENERAL_LEDGER_PATTERN)] = 'General Ledger'
+        return translated
+
+    def _strip_series(self, col):
+        result = col.copy()
+        present = col.notna()
+        result.loc[present] = col[present].astype(str).str.strip().to_numpy()
+        return result
+
+    def _standardize_date_series(self, col):
+        """standardize_date의 열 단위 버전 - 열 전체를 pd.to_datetime 한 번으로 변환"""
+        result = col.copy()
+        present = col.notna()
+        text = col[present].astype(str).str.strip()
+        text = text[text.ne('')]
+        if text.empty:
+            return result
+
+        parsed = self._map_cached(text.astype(object), self.cache.dates, self._parse_date_series)
+        valid = parsed.notna()
+        result.loc[valid.index[valid]] = parsed[valid].to_numpy()
+        return result
+
+    def _parse_date_series(self, text):
+        """_parse_date_text의 열 단위 버전 - 샘플로 열의 형식을 정해 고정 형식으로 일괄 해석"""
+        result = pd.Series(None, index=text.index, dtype=object)
+        detected = detect_date_format(text.tolist())
+        if detected is not None:
+            _, pattern, date_format = detected
+            matched = text[text.str.fullmatch(pattern).astype(bool)]
+            if date_format is None:
+                # 범용 해석으로도 날짜가 되지 않는 형태 - 원본 유지
+                text = text.drop(matched.index)
+            elif not matched.empty:
+                parsed = pd.to_datetime(matched, format=date_format, errors='coerce')
+                # _parse_date_fixed와 같이 pandas Timestamp 범위 밖(예: 0999-01-01)은 범용 해석에 맡김
+                valid = parsed.notna() & parsed.between(pd.Timestamp.min, pd.Timestamp.max)
+                # 월/일이 두 자리(길이 10, 시각 포함 19)인 유효한 날짜는 앞 10자가 곧 strftime 결과
+                padded = valid & matched.str.len().isin([10, 19])
+                formatted = matched[padded].str[:10].str.replace('.', '-', regex=False)
+                result.loc[formatted.index] = formatted.to_numpy()
+                rest = valid & ~padded
+                result.loc[rest.index[rest]] = parsed[rest].dt.strftime('%Y-%m-%d').to_numpy()
+                text = text.drop(valid.index[valid])
+        if text.empty:
+            return result.where(result.notna(), None)
+
+        # 형식이 다른 셀만 범용 해석
+        try:
+            parsed = pd.to_datetime(text, errors='coerce', format='mixed')
+            if not pd.api.types.is_datetime64_any_dtype(parsed):
+                raise TypeError("mixed timezones")
+        except (ValueError, TypeError, OverflowError):
+            # 시간대가 섞인 경우 등은 셀 단위 처리로 대체
+            result.loc[text.index] = text.map(_parse_date_generic).to_numpy()
+            return result.where(result.notna(), None)
+
+        valid = parsed.notna()
+        result.loc[valid.index[valid]] = parsed[valid].dt.strftime('%Y-%m-%d').to_numpy()
+        return result.where(result.notna(), None)
+
+    def _format_currency_series(self, col):
+        """format_currency의 열 단위 버전 - 쉼표/공백 제거 후 pd.to_numeric 한 번으로 변환"""
+        result = col.copy()
+        present = col.notna()
+        text = col[present].astype(str)
+        text = text[text.str.strip().ne('')]
+        cleaned = text.str.replace(',', '', regex=False).str.replace(' ', '', regex=False)
+        cleaned = cleaned[cleaned.str.match(CURRENCY_PATTERN).astype(bool)]
+        if cleaned.empty:
+            return result
+
+        numbers = pd.to_numeric(cleaned, errors='coerce')
+        failed = numbers.isna()
+        if failed.any():
+            numbers[failed] = cleaned[failed].map(float)
+
+        values = numbers.to_numpy(dtype=float)
+        near_int = np.abs(values - np.trunc(values)) < 0.01
+        converted = np.empty(len(values), dtype=object)
+        converted[near_int] = [int(v) for v in values[near_int].tolist()]
+        converted[~near_int] = [round(v, 2) for v in values[~near_int].tolist()]
+        result.loc[cleaned.index] = converted
+        return result
+
+    def apply_formatting(self, ws, total_blocks=None):
+        # process_sheet에서 구한 구간이 없을 때만 시트를 다시 훑음
+        if total_blocks is None:
+            total_blocks = self._find_total_blocks(list(ws.iter_rows(min_row=5, max_col=7, values_only=True)))
+
+        self._apply_general_formatting(ws, self._total_row_edges(total_blocks))
         # 2행 A2:G2 병합 + D2 값 보존
         try:
             merge_range = 'A2:G2'
@@ -271,119 +1009,178 @@ class DouzoneConverter:
             ws.merge_cells(merge_range)
             cell = ws['A2']
             cell.value = value
-            cell.font = self.header_font
-            cell.alignment = self.center_align
+            self._set_style(cell, self._named_style(ws, ('subtitle',), value))
             ws.row_dimensions[2].height = 22
         except Exception as e:
-            print(f"⚠️ 2행 병합 중 오류: {e}")
-        # C열 (Code 열, 3번째 열) 오류 알림 무시 + 텍스트 서식 적용
-        for row in ws.iter_rows(min_row=5, min_col=3, max_col=3, max_row=ws.max_row):
-            for cell in row:
-                if cell.value is not None:
-                    cell.number_format = '@'  # 텍스트 형식
+            logger.warning("⚠️ 2행 병합 중 오류: %s", e)
 
-        # ✅ 3행 폰트: Arial 9pt 적용
+        # ✅ 3행 폰트: Arial 9pt 적용 (G3은 오른쪽 정렬)
         for cell in ws[3]:
-            cell.font = self.row3_font
-        print("    🎨 3행 폰트: Arial, 크기 9 적용 완료")   
-    
+            key = ('company', 'info', 'right') if cell.column == 7 else ('company', 'info')
+            self._set_style(cell, self._named_style(ws, key, cell.value))
+        logger.debug("    🎨 3행 폰트: Arial, 크기 9 적용 완료")
 
-        self._apply_total_row_formatting(ws)
         self._adjust_column_widths(ws)
         self._set_active_cell(ws)
 
-    def _apply_general_formatting(self, ws):
+    def _apply_general_formatting(self, ws, total_edges=None):
+        """1행 제목, 4행 머리글, 5행부터 데이터/합계 행 서식 - 셀마다 등록된 스타일 하나만 지정"""
+        total_edges = total_edges or {}
         if ws.max_row > 0:
             ws.merge_cells('A1:G1')
-            ws['A1'].font = self.title_font
-            ws['A1'].alignment = self.center_align
-            # 첫 번째 행 배경색 제거 - fill 설정 삭제
-            # ws['A1'].fill = self.title_fill  # 이 줄을 주석 처리
+            self._set_style(ws['A1'], self._named_style(ws, ('title',), ws['A1'].value))
+            # 첫 번째 행 배경색 없음 (title_fill = None)
             ws.row_dimensions[1].height = 25
 
-        if ws.max_row >= 3:
-            try:
-                ws['G3'].alignment = self.right_align
-            except (KeyError, IndexError):
-                pass
-
         if ws.max_row >= 4:
             for cell in ws[4]:
-                cell.font = self.header_font
-                cell.alignment = self.center_align
-                cell.border = self.thin_border
-                cell.fill = self.header_fill
-
-        for row_num in range(5, ws.max_row + 1):
-            max_col = min(7, ws.max_column)
-            for col_num in range(1, max_col + 1):
-                try:
-                    cell = ws.cell(row=row_num, column=col_num)
-                    cell.font = self.data_font
-                    cell.border = self.thin_border
-                    if col_num in [1, 3]:
-                        cell.alignment = self.center_align
-                    elif col_num in [5, 6, 7]:
-                        cell.alignment = self.right_align
-                        cell.number_format = '#,##0'
-                    else:
-                        cell.alignment = self.left_align
-                except (KeyError, IndexError):
-                    continue
+                self._set_style(cell, self._named_style(ws, ('header',), cell.value))
+
+        max_col = min(7, ws.max_column)
+        for row in ws.iter_rows(min_row=5, max_row=ws.max_row, max_col=max_col):
+            edges = total_edges.get(row[0].row)
+            for cell in row:
+                col_num = cell.column
+                # C열 (Code 열) 값은 텍스트 서식 - 숫자 코드 오류 알림 방지
+                is_text = col_num == 3 and cell.value is not None
+                self._set_style(cell, self._data_style(ws, col_num, is_text, edges, col_num == max_col, cell.value))
 
         # ✅ 틀고정: 5행을 기준으로 위쪽 고정
         ws.freeze_panes = 'A5'
-        print("    📌 틀고정: 5행 위쪽 고정 완료")        
-
-    def _apply_total_row_formatting(self, ws):
-        total_blocks = self._find_total_blocks(ws)
-
-        for start_row, end_row in total_blocks:
-            for row_num in range(start_row, end_row + 1):
-                max_col = min(7, ws.max_column)
-                for col_num in range(1, max_col + 1):
-                    try:
-                        cell = ws.cell(row=row_num, column=col_num)
-                        cell.font = self.total_font
-                        cell.fill = self.total_fill
-                        border = Border(
-                            left=Side(style='thin') if col_num == 1 else None,
-                            right=Side(style='thin') if col_num == max_col else None,
-                            top=Side(style='thin') if row_num == start_row else None,
-                            bottom=Side(style='thin') if row_num == end_row else None
-                        )
-                        cell.border = border
-                    except (KeyError, IndexError):
-                        continue
-
-    def _find_total_blocks(self, ws):
+        logger.debug("    📌 틀고정: 5행 위쪽 고정 완료")
+
+    def _data_style(self, ws, col_num, is_text, edges, is_last_col, value=None):
+        """데이터/합계 셀 스타일 이름"""
+        return self._named_style(ws, self._data_style_key(col_num, is_text, edges, is_last_col), value)
+
+    @staticmethod
+    def _data_style_key(col_num, is_text, edges, is_last_col):
+        """데이터/합계 셀 스타일 키 - edges가 (구간 첫 행 여부, 끝 행 여부)면 합계 행
+
+        열마다가 아니라 정렬 종류(left/center/right-money, C열 텍스트는 center-text)로만 나눔.
+        합계 행은 구간 테두리가 닿는 변(left/right/top/bottom)까지 키에 포함
+        """
+        if col_num in (1, 3):
+            align = 'center-text' if is_text else 'center'
+        elif col_num in (5, 6, 7):
+            align = 'right-money'
+        else:
+            align = 'left'
+        if edges is None:
+            return ('data', align)
+        is_top, is_bottom = edges
+        sides = tuple(side for side, on in (('left', col_num == 1), ('right', is_last_col),
+                                            ('top', is_top), ('bottom', is_bottom)) if on)
+        return ('total', align, sides)
+
+    @staticmethod
+    def _value_style_key(key, value):
+        """값이 날짜/시각이면 openpyxl이 그 값에 붙이는 표시 형식을 더한 키
+
+        NamedStyle은 표시 형식까지 함께 지정하므로(기본 General) 그대로 쓰면 날짜가 일련번호로 보임.
+        금액(#,##0)/코드(@)처럼 형식이 정해진 스타일은 예전 서식과 같게 그 형식을 유지
+        """
+        if isinstance(value, TIME_TYPES) and not (len(key) > 1 and key[1] in FIXED_FORMAT_STYLES):
+            return key + (STYLE_NUMBER_FORMAT, get_time_format(type(value)))
+        return key
+
+    @staticmethod
+    def _style_name(key):
+        """엑셀 셀 스타일 목록에 보이는 이름 - 예: 'data-right-money', 'total-center (left, top border)',
+        날짜 값이면 'data-left [yyyy-mm-dd h:mm:ss]'"""
+        if STYLE_NUMBER_FORMAT in key:
+            index = key.index(STYLE_NUMBER_FORMAT)
+            return f"{DouzoneConverter._style_name(key[:index])} [{key[index + 1]}]"
+        if key[0] == 'total':
+            return f"total-{key[1]} ({', '.join(key[2])} border)" if key[2] else f"total-{key[1]}"
+        return '-'.join(key)
+
+    def _named_style(self, ws, key, value=None):
+        """워크북에 한 번만 등록한 NamedStyle의 이름 (_set_style로 셀에 지정) - value는 _value_style_key 참고"""
+        return self._workbook_style(ws.parent, self._value_style_key(key, value))
+
+    def _workbook_style(self, wb, key):
+        """_named_style의 워크북 버전 - 처음 쓰일 때 wb.add_named_style로 등록 (XlsxWriter도 씀)"""
+        styles = self._workbook_styles.get(wb)
+        if styles is None:
+            styles = self._workbook_styles[wb] = {}
+        name = styles.get(key)
+        if name is None:
+            name = self._style_name(key)
+            if name not in wb.named_styles:
+                wb.add_named_style(self._build_named_style(name, key))
+            styles[key] = name
+        return name
+
+    @staticmethod
+    def _set_style(cell, name):
+        cell.style = name
+
+    def _build_named_style(self, name, key):
+        if STYLE_NUMBER_FORMAT in key:
+            index = key.index(STYLE_NUMBER_FORMAT)
+            style = self._build_named_style(name, key[:index])
+            style.number_format = key[index + 1]
+            return style
+        kind = key[0]
+        style = NamedStyle(name=name)
+        if kind == 'title':
+            style.font, style.alignment = self.title_font, self.center_align
+        elif kind == 'subtitle':
+            style.font, style.alignment = self.header_font, self.center_align
+        elif kind == 'header':
+            style.font, style.alignment = self.header_font, self.center_align
+            style.border, style.fill = self.thin_border, self.header_fill
+        elif key == ('company', 'info'):
+            style.font = self.row3_font
+        elif key == ('company', 'info', 'right'):
+            style.font, style.alignment = self.row3_font, self.right_align
+        else:
+            align = key[1]
+            if align == 'right-money':
+                style.alignment = self.right_align
+                style.number_format = '#,##0'
+            elif align == 'left':
+                style.alignment = self.left_align
+            else:
+                style.alignment = self.center_align
+            if align == 'center-text':
+                style.number_format = '@'  # 텍스트 형식
+            if kind == 'data':
+                style.font, style.border = self.data_font, self.thin_border
+            else:
+                sides = key[2]
+                style.font, style.fill = self.total_font, self.total_fill
+                style.border = Border(
+                    left=Side(style='thin') if 'left' in sides else None,
+                    right=Side(style='thin') if 'right' in sides else None,
+                    top=Side(style='thin') if 'top' in sides else None,
+                    bottom=Side(style='thin') if 'bottom' in sides else None
+                )
+        return style
+
+    def _find_total_blocks(self, rows):
+        """데이터 행(엑셀 5행부터)의 합계 구간 - process_sheet에서 구한 구간이 없을 때만 사용"""
         total_blocks = []
-        current_block_start = None
-        for row_num in range(5, ws.max_row + 1):
-            try:
-                row_data = [ws.cell(row=row_num, column=col).value for col in range(1, min(8, ws.max_column + 1))]
-                if is_total_row(row_data):
-                    if current_block_start is None:
-                        current_block_start = row_num
-                elif current_block_start is not None:
-                    total_blocks.append((current_block_start, row_num - 1))
-                    current_block_start = None
-            except (KeyError, IndexError):
-                continue
-        if current_block_start is not None:
-            total_blocks.append((current_block_start, ws.max_row))
+        with self.metrics.stage('find_total_blocks') as timer:
+            timer.rows = len(rows)
+            collect_total_blocks(self._total_row_mask(rows), 5, total_blocks)
         return total_blocks
 
     def _adjust_column_widths(self, ws):
+        for col_letter, width in self._column_widths().items():
+            ws.column_dimensions[col_letter].width = width
+
+    def _column_widths(self):
+        """A~G열 너비 - 'bank deposits' 시트에서 저장한 너비가 있으면 그것, 없으면 고정값"""
         # ✅ 1. 기준 너비가 있다면 그대로 적용
         if self.reference_col_widths:
-            for col_letter in ['A', 'B', 'C', 'D', 'E', 'F', 'G']:
-                ws.column_dimensions[col_letter].width = self.reference_col_widths[col_letter]
-            print("    📏 열 넓이: 'bank deposits' 기준으로 적용 완료")
-            return
+            logger.debug("    📏 열 넓이: 'bank deposits' 기준으로 적용 완료")
+            return {col_letter: self.reference_col_widths[col_letter]
+                    for col_letter in ['A', 'B', 'C', 'D', 'E', 'F', 'G']}
 
         # ✅ 2. 기준 없을 경우 고정 너비로 설정
-        print("    📏 열 너비 고정값 적용 중...")
+        logger.debug("    📏 열 너비 고정값 적용 중...")
 
         fixed_widths = {
             'A': 6,
@@ -396,98 +1193,596 @@ class DouzoneConverter:
         }
 
         for col_letter, width in fixed_widths.items():
-            ws.column_dimensions[col_letter].width = width
-            print(f"    📏 {col_letter}열 너비 고정: {width}")
+            logger.debug("    📏 %s열 너비 고정: %s", col_letter, width)
 
-        print("    ✅ 열 너비 고정 적용 완료")
+        logger.debug("    ✅ 열 너비 고정 적용 완료")
+        return fixed_widths
 
-    def _set_active_cell(self, ws):
+    def _set_active_cell(self, ws, last_data_row=None):
         try:
-            last_data_row = ws.max_row
-            target_row = last_data_row + 4
-            active_cell = f"G{target_row}"
+            if last_data_row is None:
+                last_data_row = ws.max_row
+            active_cell = self._active_cell(last_data_row)
             ws.sheet_view.selection[0].activeCell = active_cell
             ws.sheet_view.selection[0].sqref = active_cell
-            print(f"    📍 액티브 셀 설정: {active_cell} (마지막 데이터: {last_data_row}행)")
+            logger.debug("    📍 액티브 셀 설정: %s (마지막 데이터: %s행)", active_cell, last_data_row)
         except (AttributeError, IndexError):
-            print("    ⚠️ 액티브 셀 설정 실패")
+            logger.warning("    ⚠️ 액티브 셀 설정 실패")
             try:
                 ws.sheet_view.selection[0].activeCell = "G10"
                 ws.sheet_view.selection[0].sqref = "G10"
             except (AttributeError, IndexError):
                 pass
 
-    def convert(self, input_file, output_file, english_company_name=None):
+    @staticmethod
+    def _active_cell(last_data_row):
+        """마지막 데이터 행 4행 아래 G열"""
+        return f"G{last_data_row + 4}"
+
+    def write_streaming_sheet(self, ws, ws_data, english_company_name=None, total_blocks=None):
+        """write-only 시트에 행을 내보내면서 apply_formatting과 같은 서식을 지정"""
+        # 일반 모드에서는 A1:G1 병합으로 G열까지 셀이 생기므로 최소 7열
+        max_col = max(7, max(len(row) for row in ws_data))
+        if total_blocks is None:
+            total_blocks = self._find_total_blocks(ws_data[4:])
+        self._write_streaming_rows(ws, ws_data, len(ws_data), max_col, total_blocks, english_company_name)
+
+    def _write_streaming_rows(self, ws, rows, max_row, max_col, total_blocks, english_company_name):
+        """rows를 차례로 내보냄 - 시트 설정이 행보다 먼저 쓰이므로 행 수/열 수/합계 구간은 미리 알아야 함"""
+        total_edges = self._total_row_edges(total_blocks)
+
+        if isinstance(ws, XlsxSheet):
+            # writer='xml' - 같은 배치(_layout_row)를 셀 객체 없이 시트 XML로 바로 씀
+            ws.write((self._layout_row(row_num, values, max_col, total_edges, english_company_name)
+                      for row_num, values in enumerate(rows, 1)),
+                     max_row, max_col, self._column_widths(), self._active_cell(max_row),
+                     merged=('A2:G2', 'A1:G1'), row_heights={1: 25, 2: 22})
+            return
+
+        # 시트 설정은 첫 행을 쓰기 전에 끝내야 함 (write-only 제약)
+        ws.merged_cells.add('A1:G1')
+        ws.merged_cells.add('A2:G2')
+        ws.row_dimensions[1].height = 25
+        ws.row_dimensions[2].height = 22
+        ws.freeze_panes = 'A5'
+        self._adjust_column_widths(ws)
+        self._set_active_cell(ws, max_row)
+
+        for row_num, values in enumerate(rows, 1):
+            ws.append(self._streaming_row(ws, row_num, values, max_col, total_edges, english_company_name))
+
+    def _streaming_row(self, ws, row_num, values, max_col, total_edges, english_company_name):
+        row = []
+        for value, key in self._layout_row(row_num, values, max_col, total_edges, english_company_name):
+            if key is None:
+                row.append(value)
+            else:
+                cell = WriteOnlyCell(ws, value=value)
+                self._set_style(cell, self._named_style(ws, key))
+                row.append(cell)
+        return row
+
+    def _layout_row(self, row_num, values, max_col, total_edges, english_company_name):
+        """row_num행에 쓸 [(값, 스타일 키 또는 None), ...] - apply_formatting과 같은 배치 (write-only/XML 공용)
+
+        날짜/시각 값은 _value_style_key로 표시 형식을 더한 키
+        """
+        value_style_key = self._value_style_key
+        if row_num <= 2:
+            # 병합 영역(A:G)은 시작 셀만 값 유지 - 2행은 D2 값을 A2로 이동
+            first = values[0] if row_num == 1 else (values[3] if len(values) > 3 else None)
+            key = self._value_style_key(('title',) if row_num == 1 else ('subtitle',), first)
+            return ([(first, key)] + [(None, None)] * 6
+                    + [(value, None) for value in values[7:]])
+
+        values = list(values) + [None] * (max_col - len(values))
+        if row_num == 3:
+            if english_company_name:
+                values[0] = f"Company Name : {english_company_name}"
+            return [(value, value_style_key(('company', 'info', 'right') if col_num == 7 else ('company', 'info'), value))
+                    for col_num, value in enumerate(values, 1)]
+
+        if row_num == 4:
+            return [(value, value_style_key(('header',), value)) for value in values]
+
+        edges = total_edges.get(row_num)
+        data_style_key = self._data_style_key
+        row = [(value, value_style_key(data_style_key(col_num, col_num == 3 and value is not None, edges, col_num == 7),
+                                       value))
+               for col_num, value in enumerate(values[:7], 1)]
+        return row + [(value, None) for value in values[7:]]
+
+    def _total_row_edges(self, total_blocks):
+        """합계 구간을 {행 번호: (구간 첫 행 여부, 구간 끝 행 여부)}로 변환"""
+        edges = {}
+        for start_row, end_row in total_blocks:
+            for row_num in range(start_row, end_row + 1):
+                edges[row_num] = (row_num == start_row, row_num == end_row)
+        return edges
+
+    def chunk_rows(self, width):
+        """memory_budget 안에 들어가는 chunk 행 수 (열 수 width 기준)"""
+        return max(MIN_CHUNK_ROWS, self.memory_budget // (max(width, 7) * CHUNK_CELL_BYTES))
+
+    def iter_sheet_rows(self, excel_file, sheet_name):
+        """open_input으로 연 워크북의 시트 행을 하나씩 내보냄"""
+        if isinstance(excel_file, WorkbookReader):
+            return excel_file.iter_rows(sheet_name)
+        # pd.ExcelFile은 시트 전체를 DataFrame으로 읽은 뒤 행 단위로 넘김 (fast_reader=False)
+        df = pd.read_excel(excel_file, sheet_name=sheet_name, header=None)
+        return df.itertuples(index=False, name=None)
+
+    def write_chunked_sheet(self, wb, excel_file, sheet_name, english_company_name=None):
+        """시트를 chunk 단위로 읽고 변환해 write-only 워크북 wb에 씀 - 만든 시트 반환 (빈 시트면 None)
+
+        결과는 process_sheet + write_streaming_sheet와 같음. write-only 시트는 활성 셀/합계 행 테두리를
+        행보다 먼저 정해야 해서 변환한 chunk를 임시 파일에 내려 두었다가 다시 읽어 씀.
+        메모리에는 chunk 하나 분량(memory_budget)만 올라감.
+        """
+        rows = iter(self.iter_sheet_rows(excel_file, sheet_name))
+        head = list(islice(rows, 4))
+        if len(head) == 4 and not head[3]:
+            # read_rows처럼 끝쪽 빈 행을 버렸을 때 4행이 남는지 - 뒤에 값 있는 행이 있어야 함
+            following = next((row for row in rows if row), None)
+            if following is None:
+                return None
+            rows = chain([following], rows)
+        if len(head) < 4 or not any(head):
+            return None
+
+        header_rows = []
+        with self.metrics.stage('process_header_rows') as timer:
+            self._process_header_rows(head, header_rows)
+            timer.rows = len(header_rows)
+        _, layout = self._data_layout(head[3])
+
+        width = max(len(row) for row in head)
+        chunk_size = self.chunk_rows(width)
+        total_blocks = []
+        data_rows = 0
+        with tempfile.TemporaryFile() as spill:
+            while True:
+                with self.metrics.stage('read_sheet') as timer:
+                    chunk = list(islice(rows, chunk_size))
+                    timer.rows = len(chunk)
+                if not chunk:
+                    break
+                width = max(width, max(len(row) for row in chunk))
+                ws_chunk = []
+                with self.metrics.stage('process_data_rows') as timer:
+                    self._process_body([_pad_row(row, width) for row in chunk], ws_chunk, layout,
+                                       5 + data_rows, total_blocks)
+                    timer.rows = len(ws_chunk)
+                data_rows += len(ws_chunk)
+                pickle.dump(ws_chunk, spill, pickle.HIGHEST_PROTOCOL)
+                del chunk, ws_chunk
+
+            # 모든 행을 시트 전체 열 수에 맞춤 (read_rows의 _pad_rows와 같게) - 머리글은 이때 영문으로
+            header = _pad_row(head[3], width)
+            english_headers = [self.columns.get(str(h).strip(), str(h)) for h in header]
+            spill.seek(0)
+            sheet_rows = (list(_pad_row(row, width))
+                          for row in chain(header_rows, [english_headers], _read_spilled(spill)))
+
+            ws = wb.create_sheet(title=sheet_name)
+            with self.metrics.stage('write_streaming_sheet') as timer:
+                timer.rows = 4 + data_rows
+                self._write_streaming_rows(ws, sheet_rows, 4 + data_rows, max(7, width), total_blocks,
+                                           english_company_name)
+        return ws
+
+    def open_input(self, input_file):
+        """입력 워크북 열기 - fast_reader면 WorkbookReader, 아니면 pd.ExcelFile"""
+        if self.fast_reader:
+            return WorkbookReader(input_file)
+        return pd.ExcelFile(input_file)
+
+    def read_sheet(self, excel_file, sheet_name):
+        """open_input으로 연 워크북에서 시트 하나를 process_sheet 입력 형태로 읽음"""
+        with self.metrics.stage('read_sheet') as timer:
+            if isinstance(excel_file, WorkbookReader):
+                rows = excel_file.read_rows(sheet_name)
+            else:
+                rows = pd.read_excel(excel_file, sheet_name=sheet_name, header=None)
+            timer.rows = len(rows)
+        return rows
+
+    def load_sheet(self, excel_file, sheet_name, source=None):
+        """시트 하나를 읽어 변환 - (ws_data, total_blocks). sheet_cache가 있으면 이전 실행 결과를 재사용
+
+        source는 sheet_source()가 만든 입력 식별자 - 같은 입력의 같은 시트 결과만 재사용 후보
+        """
+        if self.sheet_cache is not None:
+            return self._load_sheet_incremental(excel_file, sheet_name, source)
+        rows = self.read_sheet(excel_file, sheet_name)
+        total_blocks = []
+        ws_data = self.process_sheet(rows, sheet_name, total_blocks)
+        return ws_data, total_blocks
+
+    def _load_sheet_incremental(self, excel_file, sheet_name, source):
+        rows = self.read_sheet(excel_file, sheet_name)
+        if isinstance(rows, pd.DataFrame):
+            rows = list(rows.itertuples(index=False, name=None))
+        width = len(rows[0]) if rows else 0
+        key = self._sheet_cache_key(sheet_name, source)
+        entry = self.sheet_cache.load(key)
+
+        # 이전 입력의 행 수까지의 누적 해시가 같으면 그 앞부분은 변하지 않은 것
+        # (열 수가 달라지면 모든 행의 NaN 채움이 바뀌므로 처음부터 다시)
+        checkpoint = None
+        if entry is not None and entry['width'] == width and entry['row_count'] <= len(rows):
+            checkpoint = entry['row_count']
+        with self.metrics.stage('fingerprint_sheet') as timer:
+            timer.rows = len(rows)
+            digest, prefix = _row_digest(rows, checkpoint)
+
+        if checkpoint is not None and prefix == entry['digest']:
+            if checkpoint == len(rows):
+                logger.info("    ♻️ 바뀌지 않은 시트 - 이전 결과 재사용")
+                self.metrics.increment('sheets_reused')
+                return entry['ws_data'], entry['total_blocks']
+            if entry['ws_data'] is not None:
+                logger.info("    ➕ 뒤에 붙은 %s행만 변환", len(rows) - checkpoint)
+                self.metrics.increment('sheets_appended')
+                ws_data, total_blocks = entry['ws_data'], entry['total_blocks']
+                _, layout = self._data_layout(rows[3])
+                with self.metrics.stage('process_data_rows') as timer:
+                    start = len(ws_data)
+                    self._process_body(rows[checkpoint:], ws_data, layout, start + 1, total_blocks)
+                    timer.rows = len(ws_data) - start
+                self._store_sheet(key, digest, rows, width, ws_data, total_blocks)
+                return ws_data, total_blocks
+
+        total_blocks = []
+        ws_data = self.process_sheet(rows, sheet_name, total_blocks)
+        self._store_sheet(key, digest, rows, width, ws_data, total_blocks)
+        return ws_data, total_blocks
+
+    def _store_sheet(self, key, digest, rows, width, ws_data, total_blocks):
+        entry = {'digest': digest, 'row_count': len(rows), 'width': width,
+                 'ws_data': ws_data, 'total_blocks': total_blocks}
+        try:
+            self.sheet_cache.store(key, entry)
+        except OSError as e:
+            # 저장 실패는 다음 변환이 느려질 뿐 - 이번 변환은 계속
+            logger.warning("    ⚠️ 시트 결과 저장 실패: %s", e)
+
+    @staticmethod
+    def sheet_source(input_file, english_company_name):
+        """시트 캐시 키의 입력 식별자 (영문 회사명, 입력 파일 이름)
+
+        더존 원장은 회사가 달라도 시트 이름('1_bank deposits' 등)이 같으므로 시트 이름만으로는
+        다른 워크북의 결과가 서로 덮어씀. 이름 없는 스트림(업로드 버퍼)은 회사명만으로 구분
+        """
+        name = file_label(input_file)
+        return english_company_name or '', '' if name == '<stream>' else os.path.basename(name)
+
+    def _sheet_cache_key(self, sheet_name, source=None):
+        """입력 식별자 + 시트 이름 + 변환 결과에 영향을 주는 설정 - 같은 키의 이전 결과만 재사용 후보"""
+        settings = (CONVERTER_VERSION, self.fast_reader, list(self.columns.items()),
+                    list(self.translations.items()), source, sheet_name)
+        return hashlib.sha256(repr(settings).encode('utf-8')).hexdigest()
+
+    def _iter_processed_sheets(self, input_file, excel_file, chunked=True, source=None):
+        """시트 순서대로 (시트 이름, ws_data, total_blocks, 오류)를 내보냄 - source는 load_sheet 참고"""
+        sheet_names = excel_file.sheet_names
+        if chunked and self.memory_budget:
+            # chunk 모드는 시트를 쓰면서 읽고 변환함 (write_chunked_sheet)
+            for sheet_name in sheet_names:
+                logger.info("  📋 처리 중: %s", sheet_name)
+                yield sheet_name, None, None, None
+            return
+
+        # 스트림 입력은 작업 프로세스로 넘길 수 없으므로 순차 처리
+        if self.workers > 1 and len(sheet_names) > 1 and not is_file_object(input_file):
+            options = {'vectorized': self.vectorized, 'cache_size': self.cache_size,
+                       'columns': self.columns, 'translations': self.translations if self.custom_translations else None,
+                       # 기본 용어집은 작업 프로세스가 직접 읽음 (컴파일 파일) - 그 밖의 용어집만 넘김
+                       'glossary': None if self.glossary is default_glossary() else self.glossary,
+                       'fast_reader': self.fast_reader,
+                       'sheet_cache': self.sheet_cache.root if self.sheet_cache is not None else None}
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(sheet_names)),
+                                     initializer=_init_sheet_worker, initargs=(options,)) as executor:
+                futures = [executor.submit(_process_sheet_worker, input_file, name, source) for name in sheet_names]
+                for sheet_name, future in zip(sheet_names, futures):
+                    logger.info("  📋 처리 중: %s", sheet_name)
+                    try:
+                        ws_data, total_blocks, worker_metrics = future.result()
+                        self.metrics.merge(worker_metrics)
+                    except Exception as e:
+                        yield sheet_name, None, None, e
+                        continue
+                    yield sheet_name, ws_data, total_blocks, None
+            return
+
+        for sheet_name in sheet_names:
+            logger.info("  📋 처리 중: %s", sheet_name)
+            try:
+                ws_data, total_blocks = self.load_sheet(excel_file, sheet_name, source)
+            except Exception as e:
+                yield sheet_name, None, None, e
+                continue
+            yield sheet_name, ws_data, total_blocks, None
+
+    def convert(self, input_file, output_file, english_company_name=None, progress=None, output_format='xlsx'):
+        """input_file을 변환해 output_file로 저장 - 성공 여부 반환
+
+        두 파일 모두 경로 대신 바이너리 스트림을 넘길 수 있음 (업로드 버퍼에서 읽어 메모리로 저장).
+        progress(처리한 시트 수, 전체 시트 수, 시트 이름)를 넘기면 시트마다 호출.
+        output_format이 'csv'(시트별 CSV의 zip), 'parquet', 'ndjson'이면 서식 없이 데이터 행만 저장
+        """
+        check_output_format(output_format)
+        # 변환기를 요청 간에 재사용해도 이전 파일의 'bank deposits' 열 너비가 남지 않도록 파일마다 초기화
+        self.reference_col_widths = {}
+        with self.metrics.stage('convert'):
+            if output_format == 'xlsx':
+                success = self._convert(input_file, output_file, english_company_name, progress)
+            else:
+                success = self._export(input_file, output_file, english_company_name, progress, output_format)
+        self.metrics.increment('conversions' if success else 'conversion_failures')
+        return success
+
+    def _check_output(self, output_file):
+        """출력 경로에 쓸 수 있는지 미리 확인 (스트림은 확인하지 않음)"""
+        if is_file_object(output_file):
+            return True
         try:
             with open(output_file, 'a'):
                 os.utime(output_file, None)
         except PermissionError:
-            print(f"❌ 파일이 사용 중입니다: {output_file}")
+            logger.error("❌ 파일이 사용 중입니다: %s", output_file)
             return False
         except IOError as e:
-            print(f"❌ 출력 파일 접근 오류: {e}")
+            logger.error("❌ 출력 파일 접근 오류: %s", e)
             return False
+        return True
 
-        print(f"🔄 변환 중: {input_file}")
-
+    def _load_input(self, input_file):
+        """open_input + 오류 로그 - 열지 못하면 None"""
+        logger.info("🔄 변환 중: %s", file_label(input_file))
         try:
-            excel_file = pd.ExcelFile(input_file)
+            with self.metrics.stage('load') as timer:
+                timer.bytes = _file_size(input_file)
+                return self.open_input(input_file)
         except FileNotFoundError:
-            print(f"❌ 파일을 찾을 수 없습니다: {input_file}")
-            return False
+            logger.error("❌ 파일을 찾을 수 없습니다: %s", input_file)
         except Exception as e:
-            print(f"❌ Excel 파일 읽기 실패: {e}")
+            logger.error("❌ Excel 파일 읽기 실패: %s", e)
+        return None
+
+    def _export(self, input_file, output_file, english_company_name, progress, output_format):
+        """서식/openpyxl 워크북 없이 변환된 데이터 행(5행부터, 머리글은 4행 영문)만 표 형식으로 저장"""
+        if not self._check_output(output_file):
+            return False
+        excel_file = self._load_input(input_file)
+        if excel_file is None:
+            return False
+        try:
+            exporter = EXPORTERS[output_format](output_file, english_company_name)
+        except ImportError as e:
+            logger.error("❌ %s 출력에 필요한 패키지가 없습니다: %s", output_format, e)
+            excel_file.close()
+            return False
+
+        processed_sheets = 0
+        saved = False
+        sheet_count = len(excel_file.sheet_names)
+        if progress is not None:
+            progress(0, sheet_count, None)
+        try:
+            for done, (sheet_name, ws_data, total_blocks, error) in enumerate(
+                    self._iter_processed_sheets(input_file, excel_file, chunked=False,
+                                                source=self.sheet_source(input_file, english_company_name)), 1):
+                if progress is not None:
+                    progress(done - 1, sheet_count, sheet_name)
+                try:
+                    if error is not None:
+                        raise error
+                    if ws_data:
+                        with self.metrics.stage('export_rows') as timer:
+                            rows = ws_data[4:]
+                            exporter.write_sheet(sheet_name, ws_data[3] if len(ws_data) > 3 else [], rows)
+                            timer.rows = len(rows)
+                        processed_sheets += 1
+                    else:
+                        logger.warning("    ⚠️ 빈 시트 건너뜀: %s", sheet_name)
+                except Exception as e:
+                    logger.error("    ❌ 시트 처리 실패 (%s): %s", sheet_name, e)
+                    self.metrics.increment('sheet_failures')
+                finally:
+                    if progress is not None:
+                        progress(done, sheet_count, sheet_name)
+        finally:
+            excel_file.close()
+            try:
+                with self.metrics.stage('save') as timer:
+                    exporter.close()
+                    timer.bytes = _file_size(output_file)
+                saved = True
+            except Exception as e:
+                logger.error("❌ 파일 저장 실패: %s", e)
+
+        if not saved:
+            return False
+        if processed_sheets == 0:
+            logger.error("❌ 처리할 수 있는 시트가 없습니다.")
+            return False
+        self.metrics.increment('sheets', processed_sheets)
+        logger.info("✅ 변환 완료: %s (%s/%s 시트, %s)", file_label(output_file), processed_sheets, sheet_count, output_format)
+        return True
+
+    def _convert(self, input_file, output_file, english_company_name, progress):
+        if not self._check_output(output_file):
+            return False
+        excel_file = self._load_input(input_file)
+        if excel_file is None:
             return False
 
         try:
-            wb = Workbook()
-            wb.remove(wb.active)
+            if self.writer == 'xml':
+                wb = XlsxWriter(output_file, self._workbook_style)
+            elif self.streaming or self.memory_budget:
+                wb = Workbook(write_only=True)
+            else:
+                wb = Workbook()
+                wb.remove(wb.active)
         except Exception as e:
-            print(f"❌ 워크북 생성 실패: {e}")
+            logger.error("❌ 워크북 생성 실패: %s", e)
             return False
 
         processed_sheets = 0
-        for sheet_name in excel_file.sheet_names:
+        sheet_count = len(excel_file.sheet_names)
+        if progress is not None:
+            progress(0, sheet_count, None)
+        for done, (sheet_name, ws_data, total_blocks, error) in enumerate(
+                self._iter_processed_sheets(input_file, excel_file,
+                                            source=self.sheet_source(input_file, english_company_name)), 1):
+            if progress is not None:
+                progress(done - 1, sheet_count, sheet_name)
             try:
-                print(f"  📋 처리 중: {sheet_name}")
-                df = pd.read_excel(excel_file, sheet_name=sheet_name, header=None)
-                ws_data = self.process_sheet(df, sheet_name)
+                if error is not None:
+                    raise error
 
-                if ws_data:
+                if self.memory_budget:
+                    ws = self.write_chunked_sheet(wb, excel_file, sheet_name, english_company_name)
+                elif ws_data:
                     ws = wb.create_sheet(title=sheet_name)
-                    for row_data in ws_data:
-                        ws.append(row_data)
-
-                    # ✅ 선택된 영문 회사명을 A3 셀에 삽입
-                    if english_company_name:
-                        ws['A3'] = f"Company Name : {english_company_name}"    
+                    if self.streaming or isinstance(ws, XlsxSheet):
+                        with self.metrics.stage('write_streaming_sheet') as timer:
+                            timer.rows = len(ws_data)
+                            self.write_streaming_sheet(ws, ws_data, english_company_name, total_blocks)
+                    else:
+                        with self.metrics.stage('write_rows') as timer:
+                            timer.rows = len(ws_data)
+                            for row_data in ws_data:
+                                ws.append(row_data)
+
+                        # ✅ 선택된 영문 회사명을 A3 셀에 삽입
+                        if english_company_name:
+                            ws['A3'] = f"Company Name : {english_company_name}"
+
+                        with self.metrics.stage('apply_formatting') as timer:
+                            timer.rows = len(ws_data)
+                            self.apply_formatting(ws, total_blocks)
+                else:
+                    ws = None
 
-                    self.apply_formatting(ws)
+                if ws is not None:
                     processed_sheets += 1
 
                     # ✅ 'bank deposits' 시트면 열 너비 저장
                     if 'bank deposits' in sheet_name.lower():
                         self.reference_col_widths = {
-                            col_letter: ws.column_dimensions[col_letter].width
+                            col_letter: (ws.column_widths[col_letter] if isinstance(ws, XlsxSheet)
+                                         else ws.column_dimensions[col_letter].width)
                             for col_letter in ['A', 'B', 'C', 'D', 'E', 'F', 'G']
                         }
                 else:
-                    print(f"    ⚠️ 빈 시트 건너뜀: {sheet_name}")
+                    logger.warning("    ⚠️ 빈 시트 건너뜀: %s", sheet_name)
             except Exception as e:
-                print(f"    ❌ 시트 처리 실패 ({sheet_name}): {e}")
+                logger.error("    ❌ 시트 처리 실패 (%s): %s", sheet_name, e)
+                self.metrics.increment('sheet_failures')
                 continue
+            finally:
+                if progress is not None:
+                    progress(done, sheet_count, sheet_name)
+        excel_file.close()
 
         if processed_sheets == 0:
-            print("❌ 처리할 수 있는 시트가 없습니다.")
+            logger.error("❌ 처리할 수 있는 시트가 없습니다.")
+            if isinstance(wb, XlsxWriter):
+                wb.discard()
             return False
 
         try:
-            wb.save(output_file)
-            print(f"✅ 변환 완료: {output_file} ({processed_sheets}/{len(excel_file.sheet_names)} 시트 처리됨)")
+            with self.metrics.stage('save') as timer:
+                if isinstance(wb, XlsxWriter):
+                    # 시트는 이미 zip에 들어가 있음 - 스타일/통합문서 파트만 쓰고 닫음
+                    wb.close()
+                else:
+                    wb.save(output_file)
+                timer.bytes = _file_size(output_file)
+            self.metrics.increment('sheets', processed_sheets)
+            logger.info("✅ 변환 완료: %s (%s/%s 시트 처리됨)", file_label(output_file), processed_sheets, sheet_count)
             return True
         except PermissionError:
-            print(f"❌ 파일 저장 권한 오류: {output_file}")
+            logger.error("❌ 파일 저장 권한 오류: %s", file_label(output_file))
             return False
         except Exception as e:
-            print(f"❌ 파일 저장 실패: {e}")
-            return False
\ No newline at end of file
+            logger.error("❌ 파일 저장 실패: %s", e)
+            return False
+
+    def warm_up(self):
+        """작은 합성 원장을 메모리에서 한 번 변환 - 지연 import, 날짜 형식 확인, 스타일 준비를 첫 요청 전에 끝냄
+
+        계측(METRICS)에는 남기지 않음. 변환 성공 여부 반환
+        """
+        wb = Workbook()
+        ws = wb.active
+        ws.title = '1_bank deposits'
+        for row in WARM_UP_ROWS:
+            ws.append(row)
+        source = io.BytesIO()
+        wb.save(source)
+        source.seek(0)
+
+        metrics, self.metrics = self.metrics, PipelineMetrics(enabled=False)
+        level = logger.level
+        logger.setLevel(logging.WARNING)
+        try:
+            return self.convert(source, io.BytesIO(), 'Warm Up')
+        finally:
+            self.metrics = metrics
+            logger.setLevel(level)
+
+class ConverterPool:
+    """스레드마다 변환기 하나를 만들어 요청 간에 재사용 (변환기는 스레드 간에 공유하지 않음)"""
+
+    def __init__(self, options=None):
+        self.options = options or {}
+        self._local = threading.local()
+
+    def get(self):
+        converter = getattr(self._local, 'converter', None)
+        if converter is None:
+            converter = self._local.converter = DouzoneConverter(**self.options)
+        return converter
+
+# warm_up용 원장 - 머리글, 날짜/금액/코드 열, 월계/누계 행이 모두 들어가도록
+WARM_UP_ROWS = (
+    (None, None, None, '계   정   별   원   장'),
+    (None, None, None, '2024년 1월 1일 부터 2024년 12월 31일 까지'),
+    ('회사명: (주)준비', None, None, None, None, None, '단위 : 원'),
+    ('날짜', '적    요    란', '코드', '거래처', '차   변', '대   변', '잔   액'),
+    (None, '전기이월', None, None, 0, 0, 0),
+    ('2024-01-02', '사무용품 구입', '00101', '(주)가나상사', '12,000', None, 12000),
+    ('2024.01.03', '보통예금 입금', 102, None, None, 2000.5, 9999.5),
+    (None, '[ 월         계 ]', None, None, 12000, 2000.5, None),
+    (None, '[ 누         계 ]', None, None, 12000, 2000.5, None),
+)
+
+# --- 병렬 시트 처리 (프로세스 풀 작업) ---
+
+_worker_converter = None
+_worker_input = None
+
+def _init_sheet_worker(options):
+    """작업 프로세스마다 변환기를 한 번만 만들어 번역 엔진/캐시를 시트 간에 재사용"""
+    global _worker_converter
+    _worker_converter = DouzoneConverter(**options)
+
+def _worker_open_input(input_file):
+    """같은 입력 파일의 다른 시트를 받으면 열어 둔 워크북을 재사용"""
+    global _worker_input
+    if _worker_input is None or _worker_input[0] != input_file:
+        if _worker_input is not None:
+            _worker_input[1].close()
+        _worker_input = (input_file, _worker_converter.open_input(input_file))
+    return _worker_input[1]
+
+def _process_sheet_worker(input_file, sheet_name, source=None):
+    """시트 하나를 읽어 변환한 결과 (ws_data, total_blocks, 단계별 계측)만 돌려줌 - 서식은 본 프로세스 담당"""
+    # 작업 프로세스의 계측은 본 프로세스 집계에 합치도록 시트마다 따로 모아 돌려줌
+    _worker_converter.metrics = PipelineMetrics()
+    ws_data, total_blocks = _worker_converter.load_sheet(_worker_open_input(input_file), sheet_name, source)
+    return ws_data, total_blocks, _worker_converter.metrics.snapshot()
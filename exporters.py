@@ -0,0 +1,178 @@
+import csv
+import importlib.util
+import io
+import json
+import math
+import zipfile
+
+# --- 서식 없는 표 형식 내보내기 (CSV / Parquet / NDJSON) ---
+
+# 출력 형식 → (파일 확장자, MIME 형식)
+ALL_OUTPUT_FORMATS = {
+    'xlsx': ('.xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+    'csv': ('.zip', 'application/zip'),
+    'parquet': ('.parquet', 'application/vnd.apache.parquet'),
+    'ndjson': ('.ndjson', 'application/x-ndjson'),
+}
+# requirements.txt에 없는 선택 패키지가 있어야 하는 형식 → 패키지 이름
+FORMAT_REQUIREMENTS = {'parquet': 'pyarrow'}
+# 이 환경에서 쓸 수 있는 형식만 (화면/명령행 선택지) - pyarrow가 없으면 Parquet은 빠짐
+OUTPUT_FORMATS = {
+    name: spec for name, spec in ALL_OUTPUT_FORMATS.items()
+    if name not in FORMAT_REQUIREMENTS or importlib.util.find_spec(FORMAT_REQUIREMENTS[name]) is not None
+}
+
+def check_output_format(output_format):
+    """이 환경에서 쓸 수 없는 출력 형식이면 이유를 담은 ValueError"""
+    if output_format in OUTPUT_FORMATS:
+        return
+    package = FORMAT_REQUIREMENTS.get(output_format)
+    if package:
+        raise ValueError(f"{output_format} 출력에는 {package} 패키지가 필요합니다 (pip install {package}).")
+    raise ValueError(f"지원하지 않는 출력 형식입니다: {output_format}")
+
+def plain_value(value):
+    """셀 값 → CSV/JSON/Arrow에 쓸 값 (NaN/None은 None, 날짜/시각은 ISO 문자열, numpy 값은 파이썬 값)"""
+    if value is None:
+        return None
+    if hasattr(value, 'item') and not isinstance(value, (str, bytes)):
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return value
+
+def column_names(headers, reserved=()):
+    """빈/중복 머리글에 번호를 붙여 열 이름을 유일하게 (reserved 이름과도 겹치지 않게)"""
+    names = []
+    seen = set(reserved)
+    for index, header in enumerate(headers, 1):
+        name = str(header).strip() if header is not None else ''
+        if not name or name == 'nan':
+            name = f"Column {index}"
+        unique, suffix = name, 2
+        while unique in seen:
+            unique = f"{name} {suffix}"
+            suffix += 1
+        seen.add(unique)
+        names.append(unique)
+    return names
+
+def _open_binary(output):
+    """경로면 새로 열고, 스트림이면 그대로 - (파일, 닫아야 하는지)"""
+    if hasattr(output, 'write'):
+        return output, False
+    return open(output, 'wb'), True
+
+class TableExporter:
+    """변환된 시트의 데이터 행을 서식 없이 내보내는 기반 클래스
+
+    시트마다 write_sheet(시트 이름, 영문 머리글, 데이터 행)을 부르고 끝나면 close().
+    output은 경로 또는 바이너리 스트림 (스트림은 닫지 않음).
+    """
+
+    def __init__(self, output, company=None):
+        self.company = company
+        self._file, self._owns_file = _open_binary(output)
+
+    def write_sheet(self, sheet_name, headers, rows):
+        raise NotImplementedError
+
+    def close(self):
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+
+class CsvExporter(TableExporter):
+    """시트마다 CSV 하나 (UTF-8, 첫 줄 머리글)를 zip 하나에 담음 - 행을 쓰는 대로 압축"""
+
+    def __init__(self, output, company=None):
+        super().__init__(output, company)
+        self._zip = zipfile.ZipFile(self._file, 'w', compression=zipfile.ZIP_DEFLATED)
+        self._names = set()
+
+    def write_sheet(self, sheet_name, headers, rows):
+        name = sheet_name.replace('/', '_').replace('\\', '_')
+        unique, suffix = name, 2
+        while unique in self._names:
+            unique = f"{name} ({suffix})"
+            suffix += 1
+        self._names.add(unique)
+
+        with self._zip.open(f"{unique}.csv", 'w') as raw:
+            text = io.TextIOWrapper(raw, encoding='utf-8', newline='')
+            writer = csv.writer(text)
+            writer.writerow(column_names(headers))
+            for row in rows:
+                writer.writerow(['' if v is None else v for v in map(plain_value, row)])
+            text.flush()
+            text.detach()
+
+    def close(self):
+        self._zip.close()
+        super().close()
+
+class NdjsonExporter(TableExporter):
+    """행 하나당 JSON 객체 한 줄 {"company", "sheet", 머리글: 값, ...}"""
+
+    def write_sheet(self, sheet_name, headers, rows):
+        names = column_names(headers, reserved=('company', 'sheet'))
+        for row in rows:
+            record = {'company': self.company, 'sheet': sheet_name}
+            record.update(zip(names, map(plain_value, row)))
+            self._file.write(json.dumps(record, ensure_ascii=False, default=str).encode('utf-8'))
+            self._file.write(b'\n')
+
+class ParquetExporter(TableExporter):
+    """모든 시트를 Parquet 파일 하나로 - company, sheet 열 + 시트 머리글의 합집합 (pyarrow 필요)
+
+    열 타입은 값에 따라 정함: 정수만 → int64, 숫자 → float64, 그 외에는 문자열.
+    """
+
+    def __init__(self, output, company=None):
+        # 설치되어 있지 않으면 변환을 시작하기 전에 알림
+        import pyarrow  # noqa: F401
+        super().__init__(output, company)
+        self._columns = {'company': [], 'sheet': []}
+        self._rows = 0
+
+    def write_sheet(self, sheet_name, headers, rows):
+        names = column_names(headers, reserved=('company', 'sheet'))
+        for name in names:
+            if name not in self._columns:
+                self._columns[name] = [None] * self._rows
+        self._columns['company'].extend([self.company] * len(rows))
+        self._columns['sheet'].extend([sheet_name] * len(rows))
+        for index, name in enumerate(names):
+            self._columns[name].extend(plain_value(row[index]) if index < len(row) else None for row in rows)
+        # 이 시트에 없는 열은 비워 둠
+        for name, values in self._columns.items():
+            if len(values) < self._rows + len(rows):
+                values.extend([None] * (self._rows + len(rows) - len(values)))
+        self._rows += len(rows)
+
+    def close(self):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        try:
+            table = pa.table({name: _arrow_array(values) for name, values in self._columns.items()})
+            pq.write_table(table, self._file)
+        finally:
+            super().close()
+
+def _arrow_array(values):
+    import pyarrow as pa
+    kinds = {type(v) for v in values if v is not None}
+    if kinds and kinds <= {int}:
+        return pa.array(values, type=pa.int64())
+    if kinds and kinds <= {int, float}:
+        return pa.array([None if v is None else float(v) for v in values], type=pa.float64())
+    return pa.array([None if v is None else str(v) for v in values], type=pa.string())
+
+EXPORTERS = {
+    'csv': CsvExporter,
+    'parquet': ParquetExporter,
+    'ndjson': NdjsonExporter,
+}
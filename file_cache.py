@@ -0,0 +1,69 @@
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+
+# --- 파일 캐시 공통 (결과 캐시/시트 캐시) ---
+
+@contextmanager
+def atomic_write(path, mode='wb', **kwargs):
+    """path와 같은 폴더의 임시 파일에 쓰고 끝나면 교체 - 다른 프로세스가 반쯤 쓴 파일을 읽지 않도록
+
+    쓰는 중에 오류가 나면 임시 파일을 지우고 기존 파일은 그대로 둠
+    """
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(tmp_path, mode, **kwargs) as f:
+            yield f
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+class FileCache:
+    """root/<키><suffix> 파일 하나에 항목 하나를 두는 캐시
+
+    전체 크기가 max_bytes를 넘으면 가장 오래 쓰지 않은 파일부터 지움 (파일 mtime을 마지막 사용 시각으로 사용).
+    """
+
+    suffix = ''
+
+    def __init__(self, root, max_bytes):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    def path(self, key):
+        return os.path.join(self.root, f"{key}{self.suffix}")
+
+    def evict(self, keep=None):
+        """전체 크기가 max_bytes 이하가 될 때까지 오래된 항목부터 삭제 (keep 경로는 남김)"""
+        with self._lock:
+            entries = []
+            total = 0
+            for entry in os.scandir(self.root):
+                if not entry.name.endswith(self.suffix) or entry.name.endswith('.tmp'):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                if path == keep:
+                    continue
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'max_bytes': self.max_bytes}
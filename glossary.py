@@ -0,0 +1,311 @@
+"""번역 용어집 - 열 머리글/계정과목/적요 문구를 데이터 파일에서 읽어 컴파일
+
+    python glossary.py validate [data/glossary.json]
+    python glossary.py compile [data/glossary.json] [-o data/glossary.pkl]
+
+용어집 파일은 {"version": ..., "columns": {...}, "accounts": {...}, "phrases": {...}} 형태의 JSON.
+compile은 검사를 통과한 용어집을 trie까지 만든 상태로 pickle 파일에 저장 - 원본 옆에 같은 내용의
+컴파일 파일이 있으면 load_glossary가 JSON 해석/trie 구성 없이 그대로 읽음.
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import pickle
+import re
+import sys
+import time
+from functools import lru_cache
+
+from file_cache import atomic_write
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_GLOSSARY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'glossary.json')
+GLOSSARY_FILE = os.environ.get('GLOSSARY_FILE', DEFAULT_GLOSSARY_FILE)
+
+# 번역 사전으로 합쳐지는 항목 (이 순서대로 합침) - columns는 머리글 전용
+TRANSLATION_SECTIONS = ('accounts', 'phrases')
+SECTIONS = ('columns',) + TRANSLATION_SECTIONS
+
+# 컴파일 파일 구조가 바뀌면 올림 - 다른 형식의 파일은 원본에서 다시 컴파일
+ARTIFACT_FORMAT = 1
+
+# 용어가 이 수 이하면 trie 대신 정규식 대체(|)로 치환 - 적을 때는 C로 도는 정규식이 더 빠름 (결과는 같음)
+REGEX_MAX_TERMS = 300
+
+# trie 노드에서 용어가 끝났음을 표시하는 키 (문자 키는 길이 1이므로 겹치지 않음)
+_END = ''
+
+class GlossaryError(ValueError):
+    """용어집 파일 형식 오류 - problems에 문제 목록"""
+
+    def __init__(self, path, problems):
+        self.path = path
+        self.problems = list(problems)
+        super().__init__(f"용어집 오류 ({path}): " + '; '.join(self.problems))
+
+class TermMatcher:
+    """용어 → 번역 최장 일치 치환기 (문자 단위 trie)
+
+    왼쪽부터 용어가 시작할 수 있는 위치로 건너뛰며, 그 위치에서 trie를 따라가 가장 긴 용어를 치환.
+    위치마다 용어 길이만큼만 비교하므로 용어가 수천 개로 늘어도 처리 속도가 거의 그대로임.
+    결과는 길이 내림차순 정규식 대체(|)로 한 번 치환하는 것과 같음 - 용어가 REGEX_MAX_TERMS개 이하면 그 정규식을 씀.
+    """
+
+    def __init__(self, terms, trie=None):
+        if trie is None:
+            trie = {}
+            for term, value in terms.items():
+                if not term:
+                    continue
+                node = trie
+                for char in term:
+                    node = node.setdefault(char, {})
+                node[_END] = value
+        self.root = trie
+        self.terms = terms
+        self.size = sum(1 for term in terms if term)
+        self._pattern = None
+        if 0 < self.size <= REGEX_MAX_TERMS:
+            ordered = sorted((term for term in terms if term), key=len, reverse=True)
+            self._pattern = re.compile('|'.join(re.escape(term) for term in ordered))
+        # 용어 첫 글자 집합 - 그 밖의 글자는 C 수준 검색으로 건너뜀
+        self._starts = re.compile('[' + ''.join(re.escape(c) for c in sorted(self.root)) + ']') if self.root else None
+
+    def __len__(self):
+        return self.size
+
+    def finditer(self, text):
+        """겹치지 않는 최장 일치 (시작, 끝, 번역)를 왼쪽부터"""
+        if self._starts is None:
+            return
+        root = self.root
+        length = len(text)
+        match = self._starts.search(text)
+        while match:
+            start = match.start()
+            node = root[text[start]]
+            pos = start + 1
+            end = 0
+            while True:
+                if _END in node:
+                    end, value = pos, node[_END]
+                if pos == length:
+                    break
+                node = node.get(text[pos])
+                if node is None:
+                    break
+                pos += 1
+            if end:
+                yield start, end, value
+                match = self._starts.search(text, end)
+            else:
+                match = self._starts.search(text, start + 1)
+
+    def contains(self, text):
+        if self._pattern is not None:
+            return self._pattern.search(text) is not None
+        return next(self.finditer(text), None) is not None
+
+    def sub(self, text):
+        """모든 최장 일치 용어를 번역으로 치환 (일치가 없으면 text 그대로)"""
+        if self._pattern is not None:
+            return self._pattern.sub(self._lookup, text)
+        if self._starts is None or not self._starts.search(text):
+            return text
+        parts = []
+        last = 0
+        for start, end, value in self.finditer(text):
+            parts.append(text[last:start])
+            parts.append(value)
+            last = end
+        if not parts:
+            return text
+        parts.append(text[last:])
+        return ''.join(parts)
+
+    def _lookup(self, match):
+        return self.terms[match.group(0)]
+
+class Glossary:
+    """검사를 마친 용어집 - columns(머리글), translations(계정과목+적요 문구), 컴파일된 matcher"""
+
+    def __init__(self, version, sections, digest=None, path=None, trie=None):
+        self.version = str(version)
+        self.sections = {name: dict(sections.get(name) or {}) for name in SECTIONS}
+        self.columns = self.sections['columns']
+        self.translations = {}
+        for name in TRANSLATION_SECTIONS:
+            self.translations.update(self.sections[name])
+        # trie를 주면 (컴파일 파일) 다시 만들지 않음
+        self.matcher = TermMatcher(self.translations, trie=trie)
+        if digest is None:
+            source = json.dumps({'version': self.version, **self.sections}, ensure_ascii=False, sort_keys=True)
+            digest = hashlib.sha256(source.encode('utf-8')).hexdigest()
+        self.digest = digest
+        self.path = path
+
+    @property
+    def fingerprint(self):
+        """버전 + 내용 해시 - 버전을 올리지 않고 용어만 고쳐도 달라짐 (결과 캐시 키에 사용)"""
+        return f"{self.version}-{self.digest[:12]}"
+
+    def __len__(self):
+        return len(self.columns) + len(self.translations)
+
+    def __repr__(self):
+        return f"<Glossary {self.fingerprint} columns={len(self.columns)} terms={len(self.translations)}>"
+
+    @classmethod
+    def from_mapping(cls, columns=None, translations=None, version='inline'):
+        """코드에서 만든 사전으로 용어집 구성 (translations는 모두 phrases로)"""
+        return cls(version, {'columns': columns or {}, 'phrases': translations or {}})
+
+def _reject_duplicates(pairs):
+    """json.load는 같은 키가 두 번 나오면 뒤의 값으로 덮어씀 - 오류로 잡기 위해 표시"""
+    result = {}
+    duplicates = []
+    for key, value in pairs:
+        if key in result:
+            duplicates.append(key)
+        result[key] = value
+    if duplicates:
+        result['\0duplicates'] = duplicates
+    return result
+
+def validate(data):
+    """용어집 JSON 객체의 문제 목록 (없으면 빈 목록)"""
+    if not isinstance(data, dict):
+        return ["최상위는 객체여야 합니다."]
+    problems = []
+    if data.get('version') in (None, ''):
+        problems.append("version이 없습니다.")
+    for key in data:
+        if key == '\0duplicates':
+            problems.extend(f"중복 항목: {name}" for name in data[key])
+        elif key != 'version' and key not in SECTIONS:
+            problems.append(f"알 수 없는 항목: {key} (허용: {', '.join(SECTIONS)})")
+
+    seen = {}
+    for name in SECTIONS:
+        section = data.get(name, {})
+        if not isinstance(section, dict):
+            problems.append(f"{name}은(는) 객체여야 합니다.")
+            continue
+        problems.extend(f"{name}: 중복 용어 {term}" for term in section.pop('\0duplicates', ()))
+        for term, value in section.items():
+            if not isinstance(value, str) or not value:
+                problems.append(f"{name}: {term!r}의 번역이 빈 값이거나 문자열이 아닙니다.")
+            if not term.strip():
+                problems.append(f"{name}: 빈 용어가 있습니다.")
+            elif name == 'columns' and term != term.strip():
+                # 머리글은 앞뒤 공백을 지운 뒤 찾으므로 공백이 붙은 키는 쓰이지 않음
+                problems.append(f"{name}: {term!r} 앞뒤에 공백이 있습니다.")
+            if name in TRANSLATION_SECTIONS:
+                if term in seen and seen[term][1] != value:
+                    problems.append(f"{name}: {term!r}이(가) {seen[term][0]}에서 다른 번역으로 정의되어 있습니다.")
+                seen.setdefault(term, (name, value))
+    return problems
+
+def compiled_path(path):
+    """원본 용어집 옆의 컴파일 파일 경로 (data/glossary.json → data/glossary.pkl)"""
+    return os.path.splitext(path)[0] + '.pkl'
+
+def parse_glossary(path):
+    """원본 JSON을 읽어 검사 후 Glossary 생성 - 문제가 있으면 GlossaryError"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    try:
+        data = json.loads(raw.decode('utf-8'), object_pairs_hook=_reject_duplicates)
+    except ValueError as e:
+        raise GlossaryError(path, [f"JSON 해석 실패: {e}"]) from None
+    problems = validate(data)
+    if problems:
+        raise GlossaryError(path, problems)
+    return Glossary(data['version'], data, digest=hashlib.sha256(raw).hexdigest(), path=path)
+
+def compile_glossary(path, output=None):
+    """원본을 검사/컴파일해 pickle로 저장 - (Glossary, 저장 경로)"""
+    glossary = parse_glossary(path)
+    output = output or compiled_path(path)
+    with atomic_write(output) as f:
+        # 클래스 대신 기본 자료형만 저장 - 모듈 위치가 바뀌어도 읽을 수 있도록
+        artifact = {'format': ARTIFACT_FORMAT, 'version': glossary.version, 'sections': glossary.sections,
+                    'digest': glossary.digest, 'trie': glossary.matcher.root}
+        pickle.dump(artifact, f, pickle.HIGHEST_PROTOCOL)
+    return glossary, output
+
+def _read_artifact(path):
+    """컴파일 파일의 Glossary (없거나 형식이 다르면 None)"""
+    try:
+        with open(path, 'rb') as f:
+            artifact = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+        logger.warning("⚠️ 컴파일된 용어집을 읽을 수 없음: %s", path)
+        return None
+    if not isinstance(artifact, dict) or artifact.get('format') != ARTIFACT_FORMAT:
+        return None
+    return Glossary(artifact['version'], artifact['sections'], digest=artifact['digest'], path=path,
+                    trie=artifact['trie'])
+
+def load_glossary(path=None):
+    """용어집 읽기 - 원본(.json) 옆에 내용이 같은 컴파일 파일이 있으면 그것을, 아니면 원본을 컴파일
+
+    path가 컴파일 파일(.pkl)이면 원본 없이 그대로 읽음 (배포본에 컴파일 파일만 둘 때).
+    """
+    path = path or GLOSSARY_FILE
+    if path.endswith('.pkl'):
+        glossary = _read_artifact(path)
+        if glossary is None:
+            raise GlossaryError(path, ["컴파일된 용어집이 아니거나 형식 버전이 다릅니다."])
+        return glossary
+
+    glossary = _read_artifact(compiled_path(path))
+    if glossary is not None:
+        with open(path, 'rb') as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        if glossary.digest == digest:
+            glossary.path = path
+            return glossary
+        logger.info("ℹ️ 컴파일된 용어집이 원본과 다름 - 원본에서 다시 읽음: %s", path)
+    return parse_glossary(path)
+
+@lru_cache(maxsize=1)
+def default_glossary():
+    """GLOSSARY_FILE(기본 data/glossary.json) 용어집 - 프로세스에서 한 번만 읽음"""
+    return load_glossary(GLOSSARY_FILE)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="번역 용어집 검사/컴파일")
+    parser.add_argument('command', choices=('validate', 'compile'))
+    parser.add_argument('path', nargs='?', default=GLOSSARY_FILE, help="용어집 JSON (기본: GLOSSARY_FILE)")
+    parser.add_argument('-o', '--output', help="컴파일 파일 경로 (기본: 원본 이름.pkl)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        if args.command == 'validate':
+            glossary = parse_glossary(args.path)
+        else:
+            glossary, output = compile_glossary(args.path, args.output)
+    except GlossaryError as e:
+        print(f"❌ {e.path}")
+        for problem in e.problems:
+            print(f"  - {problem}")
+        return 1
+    except OSError as e:
+        print(f"❌ {e}")
+        return 1
+
+    print(f"✅ {args.path}: 버전 {glossary.version}, 머리글 {len(glossary.columns)}개, "
+          f"용어 {len(glossary.translations)}개 ({time.perf_counter() - start:.3f}s)")
+    if args.command == 'compile':
+        print(f"📦 {output} ({os.path.getsize(output):,} bytes)")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,11 @@
+# gunicorn 설정 - `gunicorn app:app` 실행 시 현재 폴더의 이 파일을 자동으로 읽음
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 120))
+
+# 마스터에서 app을 한 번 import(pandas/openpyxl 로드 + 변환기 warm_up)한 뒤 워커를 포크
+# - 워커마다 import를 반복하지 않아 기동/스케일 아웃 후 첫 응답이 빨라짐
+# - JobQueue 스레드 풀은 첫 작업 제출 때 스레드를 만들므로 포크 전에는 스레드가 없음
+preload_app = os.environ.get('GUNICORN_PRELOAD', '1') != '0'
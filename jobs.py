@@ -0,0 +1,190 @@
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from converter import ConverterPool
+from exporters import OUTPUT_FORMATS
+from file_cache import atomic_write
+
+# --- 백그라운드 변환 작업 ---
+
+# submit마다 정리하지 않고 이 간격(초)마다 한 번만 작업 폴더를 훑음
+SWEEP_INTERVAL = 60
+
+class QueueFullError(Exception):
+    """대기 중인 작업이 한도를 넘음"""
+
+class JobQueue:
+    """변환 작업을 제한된 스레드 풀에서 처리 - 상태는 작업 폴더의 status.json에 기록
+
+    상태를 파일로 두므로 다른 gunicorn 워커가 받은 작업도 조회/다운로드 가능.
+    끝난(done/failed) 지 ttl초가 지난 작업 폴더는 생성 시와 submit 때 지움 (ttl이 0/None이면 지우지 않음).
+    """
+
+    def __init__(self, root, workers=2, max_pending=16, converter_options=None, result_cache=None, ttl=24 * 3600):
+        self.root = root
+        self.ttl = ttl
+        self.result_cache = result_cache
+        self.max_pending = max_pending
+        self.converter_options = converter_options or {}
+        # 작업 스레드마다 변환기를 하나씩 두고 작업 간에 재사용
+        self._converters = ConverterPool(self.converter_options)
+        os.makedirs(root, exist_ok=True)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='convert-job')
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._last_sweep = 0.0
+        self.sweep()
+
+    def job_dir(self, job_id):
+        return os.path.join(self.root, job_id)
+
+    def submit(self, file_storage, filename, english_name, output_format='xlsx'):
+        """업로드 파일을 작업 폴더에 저장하고 변환을 예약 - 작업 상태 반환
+
+        output_format은 exporters.OUTPUT_FORMATS 중 하나 - 어느 형식이든 결과는 결과 캐시로 옮김
+        (작업 폴더에 남지 않으므로 결과 캐시의 전체 크기 제한을 받음)
+        """
+        if time.time() - self._last_sweep >= SWEEP_INTERVAL:
+            self.sweep()
+        with self._lock:
+            if self._pending >= self.max_pending:
+                raise QueueFullError(f"대기 작업이 {self.max_pending}개를 넘었습니다.")
+            self._pending += 1
+
+        job_id = uuid.uuid4().hex
+        file_root, file_ext = os.path.splitext(filename)
+        input_path = os.path.join(self.job_dir(job_id), f"input{file_ext}")
+        try:
+            # 캐시 키는 업로드 버퍼에서 바로 계산 - 캐시 적중이면 입력을 디스크에 쓰지 않음
+            key = None
+            if self.result_cache is not None:
+                key = self.result_cache.key(file_storage.stream, english_name, output_format)
+            os.makedirs(self.job_dir(job_id))
+            if key is None or self.result_cache.get(key) is None:
+                file_storage.save(input_path)
+        except Exception:
+            with self._lock:
+                self._pending -= 1
+            raise
+
+        status = {
+            'id': job_id,
+            'state': 'queued',
+            'filename': filename,
+            'download_name': f"{file_root}_converted{OUTPUT_FORMATS[output_format][0]}",
+            'output_format': output_format,
+            'sheets_done': 0,
+            'sheets_total': None,
+            'current_sheet': None,
+            'error': None,
+            'result_key': key,
+            'created': time.time(),
+        }
+
+        # 같은 파일/회사명으로 이미 변환한 결과가 있으면 바로 완료 처리
+        if not os.path.exists(input_path):
+            with self._lock:
+                self._pending -= 1
+            status.update(state='done', cached=True, finished=time.time())
+            self._write_status(job_id, status)
+            return status
+
+        self._write_status(job_id, status)
+        self._executor.submit(self._run, job_id, input_path, english_name, dict(status))
+        return status
+
+    def status(self, job_id):
+        """작업 상태 (없는 작업이면 None)"""
+        if not _is_job_id(job_id):
+            return None
+        try:
+            with open(os.path.join(self.job_dir(job_id), 'status.json'), encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def output_path(self, job_id, output_format='xlsx'):
+        return os.path.join(self.job_dir(job_id), f"output{OUTPUT_FORMATS[output_format][0]}")
+
+    def result_path(self, status):
+        """완료된 작업의 결과 파일 경로 (캐시에서 지워졌으면 None)"""
+        if status.get('result_key') and self.result_cache is not None:
+            return self.result_cache.get(status['result_key'])
+        path = self.output_path(status['id'], status.get('output_format', 'xlsx'))
+        return path if os.path.exists(path) else None
+
+    def sweep(self, now=None):
+        """끝난 지 ttl초가 지난 작업 폴더 삭제 - 삭제한 작업 수
+
+        상태 파일이 없는 폴더(저장 도중 중단된 작업)는 폴더 수정 시각 기준. 대기/실행 중인 작업은 남김
+        """
+        if not self.ttl:
+            return 0
+        now = now or time.time()
+        self._last_sweep = now
+        removed = 0
+        for entry in os.scandir(self.root):
+            if not (entry.is_dir() and _is_job_id(entry.name)):
+                continue
+            status = self.status(entry.name)
+            if status is None:
+                try:
+                    finished = entry.stat().st_mtime
+                except FileNotFoundError:
+                    continue
+            elif status['state'] in ('done', 'failed'):
+                finished = status.get('finished') or status['created']
+            else:
+                continue
+            if now - finished > self.ttl:
+                shutil.rmtree(entry.path, ignore_errors=True)
+                removed += 1
+        return removed
+
+    def _run(self, job_id, input_path, english_name, status):
+        try:
+            status['state'] = 'running'
+            self._write_status(job_id, status)
+
+            def progress(done, total, sheet_name):
+                status.update(sheets_done=done, sheets_total=total, current_sheet=sheet_name)
+                self._write_status(job_id, status)
+
+            output_path = self.output_path(job_id, status['output_format'])
+            converter = self._converters.get()
+            success = converter.convert(input_path, output_path, english_name, progress=progress,
+                                        output_format=status['output_format'])
+            if success and status['result_key']:
+                self.result_cache.put(status['result_key'], output_path)
+            status['state'] = 'done' if success else 'failed'
+            if not success:
+                status['error'] = "변환 실패. 파일을 확인해주세요."
+                # 실패한 작업의 반쯤 쓴 결과는 남기지 않음
+                if os.path.exists(output_path):
+                    os.remove(output_path)
+        except Exception as e:
+            status.update(state='failed', error=str(e))
+        finally:
+            # 입력 파일은 변환이 끝나면 필요 없음
+            try:
+                os.remove(input_path)
+            except FileNotFoundError:
+                pass
+            with self._lock:
+                self._pending -= 1
+            status['finished'] = time.time()
+            self._write_status(job_id, status)
+
+    def _write_status(self, job_id, status):
+        """상태 파일을 임시 파일 + 교체로 기록 - 조회 중에 반쯤 쓰인 파일을 읽지 않도록"""
+        with atomic_write(os.path.join(self.job_dir(job_id), 'status.json'), 'w', encoding='utf-8') as f:
+            json.dump(status, f, ensure_ascii=False)
+
+def _is_job_id(job_id):
+    """경로 조작 방지 - uuid4().hex 형태만 허용"""
+    return len(job_id) == 32 and all(c in '0123456789abcdef' for c in job_id)
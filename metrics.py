@@ -0,0 +1,138 @@
+import threading
+import time
+from contextlib import contextmanager
+
+# --- 변환 단계별 계측 ---
+
+# 단계 소요 시간 히스토그램 구간 (초)
+DURATION_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0)
+
+class StageStats:
+    """단계 하나의 누적값 - 호출 수, 총 시간, 처리 행 수/바이트, 시간 분포"""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.rows = 0
+        self.bytes = 0
+        self.buckets = [0] * len(DURATION_BUCKETS)
+
+    def add(self, seconds, rows=0, nbytes=0):
+        self.count += 1
+        self.seconds += seconds
+        self.rows += rows
+        self.bytes += nbytes
+        for i, bound in enumerate(DURATION_BUCKETS):
+            if seconds <= bound:
+                self.buckets[i] += 1
+
+class StageTimer:
+    """stage() 블록 안에서 처리한 행 수/바이트를 기록하는 핸들"""
+
+    __slots__ = ('rows', 'bytes')
+
+    def __init__(self):
+        self.rows = 0
+        self.bytes = 0
+
+class PipelineMetrics:
+    """변환 파이프라인 단계별 소요 시간/행 수/바이트 집계 (프로세스 단위, 스레드 안전)"""
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self._stages = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name):
+        """with metrics.stage('save') as timer: ... timer.rows = n - 블록 소요 시간을 기록"""
+        timer = StageTimer()
+        if not self.enabled:
+            yield timer
+            return
+        start = time.perf_counter()
+        try:
+            yield timer
+        finally:
+            self.record(name, time.perf_counter() - start, timer.rows, timer.bytes)
+
+    def record(self, name, seconds, rows=0, nbytes=0):
+        if not self.enabled:
+            return
+        with self._lock:
+            stats = self._stages.get(name)
+            if stats is None:
+                stats = self._stages[name] = StageStats()
+            stats.add(seconds, rows, nbytes)
+
+    def increment(self, name, value=1):
+        """변환 성공/실패 수 등 단순 카운터"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def merge(self, snapshot):
+        """다른 프로세스에서 모은 snapshot()을 더함 (병렬 시트 작업 등)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            for name, values in snapshot['stages'].items():
+                stats = self._stages.get(name)
+                if stats is None:
+                    stats = self._stages[name] = StageStats()
+                stats.count += values['count']
+                stats.seconds += values['seconds']
+                stats.rows += values['rows']
+                stats.bytes += values['bytes']
+                stats.buckets = [a + b for a, b in zip(stats.buckets, values['buckets'])]
+            for name, value in snapshot['counters'].items():
+                self._counters[name] = self._counters.get(name, 0) + value
+
+    def snapshot(self):
+        """{'stages': {단계: {...}}, 'counters': {...}} 형태의 현재 값"""
+        with self._lock:
+            return {
+                'stages': {
+                    name: {'count': s.count, 'seconds': s.seconds, 'rows': s.rows, 'bytes': s.bytes,
+                           'buckets': list(s.buckets)}
+                    for name, s in self._stages.items()
+                },
+                'counters': dict(self._counters),
+            }
+
+    def reset(self):
+        with self._lock:
+            self._stages.clear()
+            self._counters.clear()
+
+    def to_prometheus(self, prefix='douzone'):
+        """Prometheus 텍스트 노출 형식"""
+        snapshot = self.snapshot()
+        stages = sorted(snapshot['stages'].items())
+        lines = []
+
+        lines.append(f"# HELP {prefix}_stage_duration_seconds Time spent in each conversion stage.")
+        lines.append(f"# TYPE {prefix}_stage_duration_seconds histogram")
+        for name, stats in stages:
+            for bound, count in zip(DURATION_BUCKETS, stats['buckets']):
+                lines.append(f'{prefix}_stage_duration_seconds_bucket{{stage="{name}",le="{bound}"}} {count}')
+            lines.append(f'{prefix}_stage_duration_seconds_bucket{{stage="{name}",le="+Inf"}} {stats["count"]}')
+            lines.append(f'{prefix}_stage_duration_seconds_sum{{stage="{name}"}} {stats["seconds"]:.6f}')
+            lines.append(f'{prefix}_stage_duration_seconds_count{{stage="{name}"}} {stats["count"]}')
+
+        for metric, key, help_text in (('rows', 'rows', 'Rows handled by each conversion stage.'),
+                                       ('bytes', 'bytes', 'Bytes read or written by each conversion stage.')):
+            lines.append(f"# HELP {prefix}_stage_{metric}_total {help_text}")
+            lines.append(f"# TYPE {prefix}_stage_{metric}_total counter")
+            for name, stats in stages:
+                lines.append(f'{prefix}_stage_{metric}_total{{stage="{name}"}} {stats[key]}')
+
+        for name, value in sorted(snapshot['counters'].items()):
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total {value}")
+        return '\n'.join(lines) + '\n'
+
+# 프로세스 전역 집계 - /metrics에서 노출
+METRICS = PipelineMetrics()
@@ -0,0 +1,80 @@
+import hashlib
+import os
+import shutil
+
+from converter import result_version
+from exporters import OUTPUT_FORMATS
+from file_cache import FileCache, atomic_write
+
+# --- 변환 결과 캐시 ---
+
+def hash_file(file, chunk_size=1 << 20):
+    """파일 내용의 sha256 (큰 업로드도 조각 단위로 읽음) - 스트림이면 읽은 뒤 처음 위치로 되돌림"""
+    digest = hashlib.sha256()
+    if hasattr(file, 'read'):
+        position = file.tell()
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            digest.update(chunk)
+        file.seek(position)
+        return digest.hexdigest()
+    with open(file, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class ResultCache(FileCache):
+    """입력 내용 + 영문 회사명 + 변환기/용어집 버전으로 찾는 변환 결과 캐시
+
+    결과 파일은 root/<키>로 저장 (키 = 해시 + 출력 형식 확장자, 예: <해시>.xlsx, <해시>.zip).
+    전체 크기가 max_bytes를 넘으면 형식과 상관없이 가장 오래 쓰지 않은 파일부터 지움
+    (파일 mtime을 마지막 사용 시각으로 사용).
+    """
+
+    def __init__(self, root, max_bytes=1 << 30, version=None):
+        super().__init__(root, max_bytes)
+        self.version = version or result_version()
+
+    def key(self, input_file, english_name, output_format='xlsx'):
+        """input_file(경로 또는 스트림)을 output_format으로 변환한 결과의 캐시 키"""
+        digest = hashlib.sha256()
+        for part in (hash_file(input_file), english_name or '', self.version):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return f"{digest.hexdigest()}{OUTPUT_FORMATS[output_format][0]}"
+
+    def get(self, key):
+        """저장된 결과 경로 (없으면 None) - 찾으면 사용 시각을 갱신"""
+        path = self.path(key)
+        try:
+            os.utime(path, None)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return path
+
+    def put(self, key, output_path):
+        """변환 결과 파일을 캐시로 옮기고 캐시 안 경로를 반환"""
+        path = self.path(key)
+        # 같은 파일 시스템이면 이동, 아니면 복사 후 교체
+        try:
+            os.replace(output_path, path)
+        except OSError:
+            with open(output_path, 'rb') as src, atomic_write(path) as f:
+                shutil.copyfileobj(src, f)
+            os.remove(output_path)
+        self.evict(keep=path)
+        return path
+
+    def put_stream(self, key, stream):
+        """메모리/스풀 스트림의 변환 결과를 캐시에 복사 (스트림 위치는 되돌림)"""
+        path = self.path(key)
+        position = stream.tell()
+        stream.seek(0)
+        try:
+            with atomic_write(path) as f:
+                shutil.copyfileobj(stream, f)
+        finally:
+            stream.seek(position)
+        self.evict(keep=path)
+        return path
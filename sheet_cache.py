@@ -0,0 +1,44 @@
+import os
+import pickle
+
+from file_cache import FileCache, atomic_write
+
+# --- 시트별 변환 결과 저장소 (증분 변환) ---
+
+class SheetCache(FileCache):
+    """시트별로 마지막 변환 결과와 입력 행 지문을 저장 - 다음 변환에서 바뀐 시트만 다시 처리
+
+    root/<키>.pkl 하나에 시트 하나: {'digest': 입력 행 누적 해시, 'row_count': 행 수, 'width': 열 수,
+    'ws_data': 변환 결과, 'total_blocks': 합계 행 구간}. 키는 변환기가 입력(영문 회사명/파일 이름),
+    시트 이름과 설정으로 만듦. 전체 크기가 max_bytes를 넘으면 가장 오래 쓰지 않은 항목부터 지움.
+    """
+
+    suffix = '.pkl'
+
+    def __init__(self, root, max_bytes=256 << 20):
+        super().__init__(root, max_bytes)
+
+    def load(self, key):
+        """저장된 항목 (없거나 읽을 수 없으면 None) - 찾으면 사용 시각을 갱신"""
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+            os.utime(path, None)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+            # 다른 버전이 남긴 손상된 항목 - 없는 것으로 처리
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def store(self, key, entry):
+        """항목 저장 (임시 파일에 쓴 뒤 교체)"""
+        path = self.path(key)
+        with atomic_write(path) as f:
+            pickle.dump(entry, f, pickle.HIGHEST_PROTOCOL)
+        self.evict(keep=path)
+        return path
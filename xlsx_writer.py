@@ -0,0 +1,272 @@
+import inspect
+import io
+import os
+import uuid
+from copy import copy
+from xml.sax.saxutils import escape
+from zipfile import ZIP_DEFLATED, ZipFile
+
+import openpyxl
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell._writer import etree_write_cell
+from openpyxl.cell.cell import ERROR_CODES, ILLEGAL_CHARACTERS_RE
+from openpyxl.packaging.extended import ExtendedProperties
+from openpyxl.packaging.manifest import Manifest
+from openpyxl.styles.stylesheet import write_stylesheet
+from openpyxl.utils import get_column_letter
+from openpyxl.utils.exceptions import IllegalCharacterError
+from openpyxl.workbook._writer import WorkbookWriter
+from openpyxl.writer.theme import theme_xml
+from openpyxl.xml.constants import (ARC_APP, ARC_CORE, ARC_ROOT_RELS, ARC_STYLE, ARC_THEME, ARC_WORKBOOK,
+                                    ARC_WORKBOOK_RELS)
+from openpyxl.xml.functions import tostring
+
+# --- xlsx 직접 쓰기 (writer='xml') ---
+#
+# 변환기의 고정 레이아웃(A1:G1/A2:G2 병합, A5 틀고정, 고정 열 너비, 몇 가지 스타일)만 다루는 저장 방식.
+# 시트 XML은 셀 객체/ElementTree 없이 문자열로 만들어 zip 항목에 바로 흘려 씀.
+# 스타일/통합문서/관계/테마 같은 작은 파트는 openpyxl로 써서 openpyxl 저장본(기준)과 같은 내용을 유지함.
+
+# openpyxl 내부 구현(etree_write_cell, Workbook._cell_styles, Manifest._write)과 시트 XML 머리/꼬리를
+# 그대로 따라 쓰므로 골든 비교를 통과한 버전에 고정 (requirements.txt와 같게) - check_openpyxl_internals 참고
+VERIFIED_OPENPYXL = '3.1.5'
+
+# 셀 문자열을 이 행 수만큼 모아 zip에 씀
+FLUSH_ROWS = 512
+
+SHEET_HEADER = ('<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                '<sheetPr><outlinePr summaryBelow="1" summaryRight="1"/><pageSetUpPr/></sheetPr>')
+SHEET_FOOTER = ('<pageMargins left="0.75" right="0.75" top="1" bottom="1" header="0.5" footer="0.5"/>'
+                '</worksheet>')
+
+def check_openpyxl_internals():
+    """이 모듈이 기대는 openpyxl 내부 구현이 그대로인지 - 문제 목록 (비어 있으면 정상)"""
+    problems = []
+    if list(inspect.signature(etree_write_cell).parameters) != ['xf', 'worksheet', 'cell', 'styled']:
+        problems.append(f"etree_write_cell 인자가 바뀜: {inspect.signature(etree_write_cell)}")
+    manifest_write = getattr(Manifest, '_write', None)
+    if manifest_write is None or list(inspect.signature(manifest_write).parameters) != ['self', 'archive', 'workbook']:
+        problems.append("Manifest._write(archive, workbook)가 없거나 인자가 바뀜")
+
+    workbook = Workbook(write_only=True)
+    try:
+        workbook._cell_styles[0]
+        workbook._cell_styles.add
+    except (AttributeError, IndexError, TypeError) as e:
+        problems.append(f"Workbook._cell_styles를 셀 스타일 번호로 읽을 수 없음: {e}")
+
+    # openpyxl write-only 시트 XML의 머리/꼬리가 SHEET_HEADER/SHEET_FOOTER와 같은지
+    workbook.create_sheet('check').append([1])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    with ZipFile(buffer) as archive:
+        xml = archive.read('xl/worksheets/sheet1.xml').decode('utf-8').replace(' />', '/>')
+    xml = xml[xml.index('<worksheet'):]
+    if not xml.startswith(SHEET_HEADER):
+        problems.append(f"시트 XML 머리가 바뀜: {xml[:len(SHEET_HEADER)]}")
+    if not xml.endswith(SHEET_FOOTER):
+        problems.append(f"시트 XML 꼬리가 바뀜: {xml[-len(SHEET_FOOTER):]}")
+
+    if problems and openpyxl.__version__ != VERIFIED_OPENPYXL:
+        problems.append(f"설치된 openpyxl {openpyxl.__version__} - 검증한 버전은 {VERIFIED_OPENPYXL}")
+    return problems
+
+class _ElementSink:
+    """etree_write_cell의 xf 자리에 넘겨 셀 요소를 문자열로 받음 (드문 값 타입 처리용)"""
+
+    def __init__(self):
+        self.parts = []
+
+    def write(self, element):
+        self.parts.append(tostring(element).decode('utf-8'))
+
+def _number(value):
+    """openpyxl safe_string과 같은 숫자 표기 (NaN/무한대는 빈 값)"""
+    if value != value or value in (float('inf'), float('-inf')):
+        return ''
+    return '%.16g' % value
+
+class XlsxSheet:
+    """XlsxWriter.create_sheet가 만드는 시트 - write()를 한 번 불러 zip에 씀"""
+
+    def __init__(self, writer, title):
+        self.writer = writer
+        # 시트 목록/경로/이름 검사는 openpyxl write-only 시트에 맡김 (셀은 담지 않음)
+        self.proxy = writer.workbook.create_sheet(title=title)
+        self.proxy._id = len(writer.sheets) + 1
+        self.title = self.proxy.title
+        self.column_widths = {}
+
+    def write(self, rows, max_row, max_col, column_widths, active_cell, merged=(), row_heights=None,
+              freeze='A5'):
+        """rows의 각 행 [(값, 스타일 키 또는 None), ...]을 차례로 시트 XML로 씀
+
+        시트 설정(틀고정/선택 셀/열 너비)은 sheetData보다 앞에 와야 하므로 미리 받음.
+        중간에 오류가 나면 그 전 행까지로 시트 XML을 닫고 오류를 그대로 올림 (openpyxl write-only와 같음 -
+        변환기는 시트 처리 실패로 기록).
+        """
+        self.column_widths = dict(column_widths)
+        row_heights = row_heights or {}
+        freeze_row = int(freeze[1:]) - 1
+        head = [SHEET_HEADER,
+                f'<dimension ref="A1:{get_column_letter(max(max_col, 1))}{max(max_row, 1)}"/>',
+                '<sheetViews><sheetView workbookViewId="0">',
+                f'<pane ySplit="{freeze_row}" topLeftCell="{freeze}" activePane="bottomLeft" state="frozen"/>',
+                f'<selection pane="bottomLeft" activeCell="{active_cell}" sqref="{active_cell}"/>',
+                '</sheetView></sheetViews><sheetFormatPr baseColWidth="8" defaultRowHeight="15"/>']
+        if self.column_widths:
+            head.append('<cols>')
+            for letter, width in self.column_widths.items():
+                index = _column_index(letter)
+                head.append(f'<col width="{_number(width)}" customWidth="1" min="{index}" max="{index}"/>')
+            head.append('</cols>')
+        head.append('<sheetData>')
+
+        letters = [get_column_letter(i) for i in range(1, max_col + 1)]
+        with self.writer.archive.open(self.proxy.path[1:], 'w') as stream:
+            stream.write(''.join(head).encode('utf-8'))
+            parts = []
+            try:
+                for row_num, cells in enumerate(rows, 1):
+                    # 행 하나를 따로 모았다가 끝까지 만들어진 뒤에만 붙임 - 셀에서 오류가 나면 그 행은 통째로 빠짐
+                    height = row_heights.get(row_num)
+                    row = [f'<row r="{row_num}" ht="{_number(height)}" customHeight="1">' if height
+                           else f'<row r="{row_num}">']
+                    for col_num, (value, key) in enumerate(cells):
+                        if col_num >= len(letters):
+                            letters.append(get_column_letter(col_num + 1))
+                        self._cell(row, f"{letters[col_num]}{row_num}", value,
+                                   self.writer.style_id(key) if key is not None else 0)
+                    row.append('</row>')
+                    parts.extend(row)
+                    if row_num % FLUSH_ROWS == 0:
+                        stream.write(''.join(parts).encode('utf-8'))
+                        parts.clear()
+            finally:
+                parts.append('</sheetData>')
+                if merged:
+                    parts.append(f'<mergeCells count="{len(merged)}">')
+                    parts.extend(f'<mergeCell ref="{ref}"/>' for ref in merged)
+                    parts.append('</mergeCells>')
+                parts.append(SHEET_FOOTER)
+                stream.write(''.join(parts).encode('utf-8'))
+
+    def _cell(self, parts, ref, value, style_id):
+        """셀 하나의 XML - openpyxl이 같은 값/스타일로 쓰는 것과 같게 (값 없고 스타일도 없으면 생략)"""
+        style = f' s="{style_id}"' if style_id else ''
+        kind = type(value)
+        if value is None:
+            if style_id:
+                parts.append(f'<c r="{ref}"{style}/>')
+        elif kind is str:
+            value = value[:32767]
+            if ILLEGAL_CHARACTERS_RE.search(value):
+                raise IllegalCharacterError(f"{value} cannot be used in worksheets.")
+            if len(value) > 1 and value[0] == '=':
+                parts.append(f'<c r="{ref}"{style}><f>{escape(value[1:])}</f><v/></c>')
+            elif value in ERROR_CODES:
+                parts.append(f'<c r="{ref}"{style} t="e"><v>{escape(value)}</v></c>')
+            elif not value:
+                parts.append(f'<c r="{ref}"{style} t="inlineStr"/>')
+            else:
+                stripped = value.strip()
+                space = ' xml:space="preserve"' if stripped and value != stripped else ''
+                parts.append(f'<c r="{ref}"{style} t="inlineStr"><is><t{space}>{escape(value)}</t></is></c>')
+        elif kind is int or kind is float:
+            text = _number(value)
+            parts.append(f'<c r="{ref}"{style} t="n"><v>{text}</v></c>' if text else f'<c r="{ref}"{style} t="n"/>')
+        elif kind is bool:
+            parts.append(f'<c r="{ref}"{style} t="b"><v>{int(value)}</v></c>')
+        else:
+            # 날짜/Decimal/numpy 값 등은 openpyxl 셀로 - 날짜 표시 형식이 스타일에 더해지는 것까지 같게
+            cell = WriteOnlyCell(self.proxy, value=value)
+            if style_id:
+                cell._style = copy(self.writer.workbook._cell_styles[style_id])
+            column = ref.rstrip('0123456789')
+            cell.row, cell.column = int(ref[len(column):]), _column_index(column)
+            sink = _ElementSink()
+            etree_write_cell(sink, self.proxy, cell, cell.has_style)
+            parts.extend(sink.parts)
+
+def _column_index(letter):
+    index = 0
+    for char in letter:
+        index = index * 26 + ord(char) - 64
+    return index
+
+class XlsxWriter:
+    """시트 XML을 zip에 바로 쓰는 xlsx 저장기 - create_sheet() / XlsxSheet.write() 후 close()
+
+    output은 경로 또는 바이너리 스트림. 경로면 같은 폴더의 임시 파일에 쓰고 close()에서 교체하므로
+    실패(discard)하면 기존 파일이 그대로 남음.
+    named_style(workbook, 스타일 키)는 openpyxl 워크북에 NamedStyle을 등록하고 그 이름을 돌려주는 함수
+    (변환기의 _workbook_style) - 셀 스타일 번호는 openpyxl 저장과 같은 순서로 매김.
+    """
+
+    def __init__(self, output, named_style, compresslevel=None):
+        self.named_style = named_style
+        # 스타일/시트 목록/패키지 파트 작성용 - 셀은 넣지 않음
+        self.workbook = Workbook(write_only=True)
+        self._style_ids = {}
+        self._target = None
+        if hasattr(output, 'write'):
+            self._file = output
+        else:
+            self._target = output
+            self._tmp_path = f"{output}.{uuid.uuid4().hex}.tmp"
+            self._file = open(self._tmp_path, 'wb')
+        self.archive = ZipFile(self._file, 'w', compression=ZIP_DEFLATED, compresslevel=compresslevel)
+        self.sheets = []
+
+    def create_sheet(self, title):
+        sheet = XlsxSheet(self, title)
+        self.sheets.append(sheet)
+        return sheet
+
+    def style_id(self, key):
+        """스타일 키의 셀 스타일 번호 (처음 쓰일 때 워크북에 등록)"""
+        style_id = self._style_ids.get(key)
+        if style_id is None:
+            # openpyxl 셀에 이름으로 지정했을 때와 같은 번호 - 저장 시 셀마다 매기는 style_id와 같은 순서
+            cell = WriteOnlyCell(self.sheets[-1].proxy)
+            cell.style = self.named_style(self.workbook, key)
+            style_id = self._style_ids[key] = cell.style_id
+        return style_id
+
+    def close(self):
+        """스타일/통합문서/관계/문서 속성 파트를 쓰고 zip을 닫음 (openpyxl ExcelWriter.write_data와 같은 파트)"""
+        try:
+            archive = self.archive
+            archive.writestr(ARC_APP, tostring(ExtendedProperties().to_tree()))
+            archive.writestr(ARC_CORE, tostring(self.workbook.properties.to_tree()))
+            archive.writestr(ARC_THEME, theme_xml)
+            archive.writestr(ARC_STYLE, tostring(write_stylesheet(self.workbook)))
+            writer = WorkbookWriter(self.workbook)
+            archive.writestr(ARC_ROOT_RELS, writer.write_root_rels())
+            archive.writestr(ARC_WORKBOOK, writer.write())
+            archive.writestr(ARC_WORKBOOK_RELS, writer.write_rels())
+            manifest = Manifest()
+            for sheet in self.sheets:
+                manifest.append(sheet.proxy)
+            manifest._write(archive, self.workbook)
+            archive.close()
+        except Exception:
+            self.discard()
+            raise
+        if self._target is not None:
+            self._file.close()
+            os.replace(self._tmp_path, self._target)
+        else:
+            self._file.flush()
+
+    def discard(self):
+        """저장하지 않고 정리 - 경로 출력이면 임시 파일 삭제"""
+        try:
+            self.archive.close()
+        except Exception:
+            pass
+        if self._target is not None:
+            self._file.close()
+            if os.path.exists(self._tmp_path):
+                os.remove(self._tmp_path)